@@ -0,0 +1,48 @@
+"""Pytest configuration for the benchmark regression suite.
+
+The suite is not part of the regular test run (it is outside ``testpaths``).
+Run it with ``nox -s benchmarks``; see docs/development/testing.md.
+"""
+
+import json
+import sys
+import sysconfig
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the baseline options."""
+    group = parser.getgroup("uuid-forge benchmarks")
+    group.addoption(
+        "--update-baseline",
+        action="store_true",
+        help="Record the measurements as the new baseline for this Python version",
+    )
+    group.addoption(
+        "--time-tolerance",
+        type=float,
+        default=None,
+        help="Allowed slowdown as a fraction (e.g. 0.25), overriding baseline.json",
+    )
+
+
+def python_version() -> str:
+    """Return the key baselines are stored under, e.g. ``"3.13"`` or ``"3.13t"``."""
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    return f"{sys.version_info.major}.{sys.version_info.minor}{'t' if free_threaded else ''}"
+
+
+@pytest.fixture(scope="session")
+def baseline(request: pytest.FixtureRequest) -> Any:
+    """The stored baseline; updated measurements are written back at the end."""
+    data = json.loads(BASELINE_PATH.read_text())
+    updates: dict[str, Any] = {}
+    yield data, updates
+    if request.config.getoption("--update-baseline") and updates:
+        data["baselines"].setdefault(python_version(), {}).update(updates)
+        BASELINE_PATH.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,112 @@
+"""Regression benchmarks for the hot paths of uuid_forge.core.
+
+Each benchmark is timed relative to the standard library's uuid.uuid5 on
+the same machine and in the same run, so the stored baseline does not
+depend on how fast the machine is. Transient memory per call is measured
+with tracemalloc. A benchmark fails when it is slower, or allocates more,
+than its baseline by more than the tolerance in baseline.json.
+"""
+
+import gc
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from conftest import python_version
+
+from uuid_forge.core import (
+    IDConfig,
+    UUIDGenerator,
+    _normalize_input,
+    extract_uuid_from_prefixed,
+    generate_uuid_only,
+    generate_uuid_with_prefix,
+)
+
+CONFIG = IDConfig(salt="benchmark-salt")
+ATTRIBUTES = {"region": "EUR", "number": 12345, "customer": "C-000042"}
+PREFIXED = generate_uuid_with_prefix("invoice", config=CONFIG, prefix="INV-EUR", **ATTRIBUTES)
+GENERATOR = UUIDGenerator(CONFIG)
+
+# Each benchmark is a zero-argument call of one hot path
+HOT_PATHS: dict[str, Callable[[], object]] = {
+    "generate_uuid_only": lambda: generate_uuid_only("invoice", config=CONFIG, **ATTRIBUTES),
+    "generate_uuid_with_prefix": lambda: generate_uuid_with_prefix(
+        "invoice", config=CONFIG, prefix="INV-EUR", **ATTRIBUTES
+    ),
+    "UUIDGenerator.generate": lambda: GENERATOR.generate("invoice", **ATTRIBUTES),
+    "_normalize_input": lambda: _normalize_input("EUR", 12345, **ATTRIBUTES),
+    "extract_uuid_from_prefixed": lambda: extract_uuid_from_prefixed(PREFIXED),
+}
+
+
+def _reference() -> object:
+    """The yardstick: a UUIDv5 from the standard library."""
+    return uuid.uuid5(uuid.NAMESPACE_DNS, "invoice|'EUR'|12345")
+
+
+def _ns_per_call(call: Callable[[], object], number: int) -> float:
+    """Return the mean time of one call, in ns, over a batch of ``number`` calls."""
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        call()
+    return (time.perf_counter_ns() - start) / number
+
+
+def relative_time(call: Callable[[], object], rounds: int = 15, number: int = 2_000) -> float:
+    """Time ``call`` relative to the reference, interleaving the two to cancel drift."""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        call_ns = reference_ns = float("inf")
+        for _ in range(rounds):
+            call_ns = min(call_ns, _ns_per_call(call, number))
+            reference_ns = min(reference_ns, _ns_per_call(_reference, number))
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return call_ns / reference_ns
+
+
+def peak_bytes(call: Callable[[], object]) -> int:
+    """Return the transient memory one call allocates, measured with tracemalloc."""
+    call()  # warm caches so they are not counted
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(5):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return min(peaks)
+
+
+@pytest.mark.parametrize("name", HOT_PATHS)
+def test_hot_path(name: str, baseline: Any, request: pytest.FixtureRequest) -> None:
+    """Test a hot path is no slower, and allocates no more, than its baseline."""
+    data, updates = baseline
+    call = HOT_PATHS[name]
+    measured = {"relative_time": round(relative_time(call), 3), "peak_bytes": peak_bytes(call)}
+    print(f"{name}: {measured}")
+    if request.config.getoption("--update-baseline"):
+        updates[name] = measured
+        return
+
+    stored = data["baselines"].get(python_version(), {}).get(name)
+    if stored is None:
+        pytest.skip(f"No baseline for {name} on Python {python_version()}; run --update-baseline")
+    tolerance = dict(data["tolerance"])
+    if request.config.getoption("--time-tolerance") is not None:
+        tolerance["relative_time"] = request.config.getoption("--time-tolerance")
+    for metric, value in measured.items():
+        limit = stored[metric] * (1 + tolerance[metric])
+        assert value <= limit, (
+            f"{name} regressed: {metric} {value} exceeds baseline {stored[metric]} "
+            f"by more than {tolerance[metric]:.0%}"
+        )
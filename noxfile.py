@@ -8,7 +8,7 @@ across development environments and CI/CD pipelines.
 import nox
 
 # Supported Python versions
-PYTHON_VERSIONS = ["3.11", "3.12"]
+PYTHON_VERSIONS = ["3.11", "3.12", "3.13", "3.13t"]
 
 # Default sessions to run when just calling 'nox'
 nox.options.sessions = ["tests", "lint", "type_check"]
@@ -43,6 +43,34 @@ def tests(session: nox.Session) -> None:
     )
 
 
+@nox.session(python="3.13")
+def benchmarks(session: nox.Session) -> None:
+    """Run the benchmark regression suite against the stored baseline.
+
+    This session times the core hot paths relative to the standard library's
+    uuid.uuid5 and measures their transient memory with tracemalloc. It fails
+    if any is slower, or allocates more, than benchmarks/baseline.json allows.
+
+    The stored baseline covers Python 3.13 only, so the session runs on 3.13;
+    on other versions the suite skips until a baseline is recorded for them.
+
+    Args:
+        session: The Nox session object.
+
+    Example:
+        $ nox -s benchmarks
+
+        Record a new baseline after an intended change:
+        $ nox -s benchmarks -- --update-baseline
+
+        Allow a larger slowdown on a noisy machine:
+        $ nox -s benchmarks -- --time-tolerance 0.5
+    """
+    session.install(".")
+    session.install("pytest")
+    session.run("pytest", "benchmarks", "-o", "addopts=", "-v", "-s", *session.posargs)
+
+
 @nox.session(python="3.11")
 def lint(session: nox.Session) -> None:
     """Run ruff linter to check code quality.
@@ -60,7 +88,7 @@ def lint(session: nox.Session) -> None:
         $ nox -s lint -- --fix
     """
     session.install(".[dev]")
-    session.run("ruff", "check", "src", "tests", *session.posargs)
+    session.run("ruff", "check", "src", "tests", "benchmarks", *session.posargs)
 
 
 @nox.session(python="3.11")
@@ -77,12 +77,22 @@ from uuid_forge.config import (
     validate_config_security,
 )
 from uuid_forge.core import (
+    BatchRowError,
+    CacheBackend,
+    CacheInfo,
+    CompiledSchema,
+    EntitySchema,
+    EntityUUIDGenerator,
     IDConfig,
     Namespace,
     Representable,
     UUIDGenerator,
     extract_uuid_from_prefixed,
+    extract_uuids_from_prefixed,
+    generate_iter,
     generate_salt,
+    generate_uuid_bytes,
+    generate_uuid_int,
     generate_uuid_only,
     generate_uuid_with_prefix,
 )
@@ -98,7 +108,11 @@ __all__ = [
     # Core functionality
     "generate_uuid_only",
     "generate_uuid_with_prefix",
+    "generate_uuid_bytes",
+    "generate_uuid_int",
     "extract_uuid_from_prefixed",
+    "extract_uuids_from_prefixed",
+    "generate_iter",
     "generate_salt",
     # Configuration
     "IDConfig",
@@ -109,6 +123,12 @@ __all__ = [
     "validate_config_security",
     # Optional OO interface
     "UUIDGenerator",
+    "EntityUUIDGenerator",
+    "EntitySchema",
+    "CompiledSchema",
+    "CacheInfo",
+    "CacheBackend",
+    "BatchRowError",
     # Protocols
     "Representable",
     # Types and functions (re-exported for convenience)
@@ -0,0 +1,25 @@
+"""Entry point for the ``uuid-forge`` command and ``python -m uuid_forge``.
+
+The CLI's dependencies are optional (the ``cli`` extra). When they are
+missing, this prints an install hint instead of a traceback.
+"""
+
+import sys
+
+# Distributions the CLI imports at start-up
+_CLI_DEPENDENCIES = frozenset({"typer", "click", "rich"})
+
+
+def main() -> None:
+    """Run the CLI, or exit with an install hint if its dependencies are missing."""
+    try:
+        from uuid_forge.cli import main as cli_main
+    except ImportError as e:
+        if e.name not in _CLI_DEPENDENCIES:
+            raise
+        sys.exit(f"uuid-forge: {e}")
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
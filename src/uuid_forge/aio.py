@@ -0,0 +1,727 @@
+"""Asyncio API that coalesces concurrent calls into micro-batches.
+
+Calling generate_uuid_only inline in an async handler is cheap for one ID but
+holds the event loop for the whole call, and a bulk request of ten thousand
+rows stalls every other request on the worker for tens of milliseconds. This
+module keeps the loop responsive:
+
+- agenerate() queues the call. Calls from many coroutines are gathered into
+  one micro-batch, which is flushed when it reaches ``max_batch_size`` or
+  ``max_wait_us`` microseconds after its first call, whichever comes first.
+- Micro-batches of up to ``inline_limit`` calls are generated on the loop
+  itself, since handing a handful of IDs to a thread costs more than
+  hashing them. Larger batches run on an executor.
+- agenerate_many() splits large batches into ``max_batch_size`` chunks that
+  run on the executor, so other coroutines get the loop between chunks.
+- generate_stream() consumes an async iterable (a Kafka or queue consumer)
+  in chunks with a bounded number in flight, so a slow consumer of the
+  results slows down reading from the source instead of buffering.
+
+The executor is the loop's default thread pool unless one is given. On a
+standard (GIL) build, pass a ProcessPoolExecutor to hash bursts on other
+cores. Results are identical to the synchronous APIs.
+
+Example:
+    ```python
+    from fastapi import FastAPI
+    from uuid_forge import IDConfig
+    from uuid_forge.aio import AsyncUUIDGenerator
+
+    app = FastAPI()
+    ids = AsyncUUIDGenerator(IDConfig(salt="my-secret-salt"), max_wait_us=200)
+
+    @app.get("/invoices/{region}/{number}")
+    async def invoice(region: str, number: int) -> dict[str, str]:
+        return {"id": str(await ids.generate("invoice", region=region, number=number))}
+    ```
+"""
+
+import asyncio
+import uuid as uuid_module
+import weakref
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from concurrent.futures import Executor
+from functools import partial
+from types import TracebackType
+from typing import Any, Self, overload
+
+from uuid_forge.core import BatchRowError, IDConfig, UUIDGenerator
+
+# Defaults for the coalescing limits
+MAX_BATCH_SIZE = 256
+MAX_WAIT_US = 200
+INLINE_LIMIT = 16
+
+# Defaults for generate_stream
+STREAM_CHUNK_SIZE = 1_000
+STREAM_MAX_IN_FLIGHT = 4
+STREAM_MAX_WAIT_US = 10_000
+
+# Marks the end of the source in generate_stream's queues
+_END = object()
+
+# Generators per config, built once per process (thread pools share them)
+_generators: dict[IDConfig, UUIDGenerator] = {}
+
+# One default AsyncUUIDGenerator per event loop and config, for agenerate
+_defaults: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[IDConfig, "AsyncUUIDGenerator"]
+] = weakref.WeakKeyDictionary()
+
+# A queued single call: entity type, args, kwargs and the future to resolve
+_Call = tuple[str, tuple[Any, ...], dict[str, Any], "asyncio.Future[uuid_module.UUID]"]
+
+
+def _generator_for(config: IDConfig) -> UUIDGenerator:
+    """Return this process's UUIDGenerator for a config."""
+    generator = _generators.get(config)
+    if generator is None:
+        generator = _generators.setdefault(config, UUIDGenerator(config))
+    return generator
+
+
+def _generate_calls(
+    config: IDConfig, calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]]
+) -> list[uuid_module.UUID | Exception]:
+    """Generate one UUID per call, returning each call's exception in its place.
+
+    Runs on the event loop for small batches and in an executor otherwise.
+    """
+    generator = _generator_for(config)
+    results: list[uuid_module.UUID | Exception] = []
+    for entity_type, args, kwargs in calls:
+        try:
+            results.append(generator.generate(entity_type, *args, **kwargs))
+        except Exception as exc:
+            results.append(exc)
+    return results
+
+
+def _generate_rows(
+    config: IDConfig, entity_type: str, rows: list[Any]
+) -> tuple[list[uuid_module.UUID | None], list[tuple[int, Exception]]]:
+    """Generate UUIDs for rows, returning failures as ``(index, exception)`` pairs.
+
+    BatchRowError is rebuilt by the caller, since it does not survive
+    pickling to and from worker processes.
+    """
+    errors: list[BatchRowError] = []
+    uuids = _generator_for(config).generate_many(entity_type, rows, errors=errors)
+    return uuids, [(error.index, error.error) for error in errors]
+
+
+class AsyncUUIDGenerator:
+    """Awaitable UUID generation that batches concurrent calls.
+
+    Produces the same UUIDs as UUIDGenerator with the same config. Concurrent
+    generate() calls are gathered into micro-batches; see the module
+    documentation for the flushing rules. An instance is bound to the event
+    loop it is first used on.
+
+    Attributes:
+        config: The IDConfig used for all UUID generation.
+        max_batch_size: Calls per micro-batch, and rows per executor task in
+            generate_many.
+        max_wait_us: Longest time, in microseconds, a call waits for others
+            to join its micro-batch.
+        inline_limit: Largest batch generated on the event loop itself.
+
+    Example:
+        ```python
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+
+        from uuid_forge import IDConfig
+        from uuid_forge.aio import AsyncUUIDGenerator
+
+        async def main() -> None:
+            with ProcessPoolExecutor(4) as pool:
+                async with AsyncUUIDGenerator(
+                    IDConfig(salt="my-secret-salt"), executor=pool
+                ) as ids:
+                    one = await ids.generate("invoice", region="EUR", number=1)
+                    many = await ids.generate_many("invoice", rows)
+
+        asyncio.run(main())
+        ```
+
+    Examples:
+        >>> import asyncio
+        >>> from uuid_forge.aio import AsyncUUIDGenerator
+        >>> from uuid_forge.core import generate_uuid_only
+        >>> async def main():
+        ...     async with AsyncUUIDGenerator() as ids:
+        ...         return await asyncio.gather(*(ids.generate("user", i) for i in range(3)))
+        >>> asyncio.run(main()) == [generate_uuid_only("user", i) for i in range(3)]
+        True
+    """
+
+    def __init__(
+        self,
+        config: IDConfig | None = None,
+        *,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_wait_us: int = MAX_WAIT_US,
+        inline_limit: int = INLINE_LIMIT,
+        executor: Executor | None = None,
+    ) -> None:
+        """Configure batching. Nothing is started until the first call.
+
+        Args:
+            config: Configuration for UUID generation. If None, uses default
+                configuration (DNS namespace, no salt).
+            max_batch_size: Flush a micro-batch once it holds this many calls.
+            max_wait_us: Flush a micro-batch this many microseconds after its
+                first call. 0 flushes on the next turn of the event loop.
+            inline_limit: Generate batches of up to this many calls or rows
+                on the event loop instead of the executor. 0 sends every
+                batch to the executor.
+            executor: Executor for larger batches. If None, the event loop's
+                default executor (a thread pool) is used. The caller keeps
+                ownership; it is not shut down by aclose().
+
+        Raises:
+            TypeError: If config is provided but is not an IDConfig instance.
+            ValueError: If max_batch_size is less than 1, or max_wait_us or
+                inline_limit is negative.
+        """
+        if config is None:
+            config = IDConfig()
+        elif not isinstance(config, IDConfig):
+            raise TypeError(f"config must be IDConfig, got {type(config).__name__}")
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if max_wait_us < 0 or inline_limit < 0:
+            raise ValueError(
+                f"max_wait_us and inline_limit must not be negative, got {max_wait_us} "
+                f"and {inline_limit}"
+            )
+        self.config = config
+        self.max_batch_size = max_batch_size
+        self.max_wait_us = max_wait_us
+        self.inline_limit = inline_limit
+        self._executor = executor
+        # A weak reference, so an instance kept in _defaults does not keep its
+        # loop, and with it the _defaults entry, alive after the loop is gone
+        self._loop: weakref.ref[asyncio.AbstractEventLoop] | None = None
+        self._pending: list[_Call] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def _bind(self) -> asyncio.AbstractEventLoop:
+        """Return the running loop, binding this instance to it on first use.
+
+        Raises:
+            RuntimeError: If called outside a running loop, or from a loop
+                other than the one this instance is bound to.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = weakref.ref(loop)
+        elif self._loop() is not loop:
+            raise RuntimeError("AsyncUUIDGenerator is bound to a different event loop")
+        return loop
+
+    async def generate(self, entity_type: str, *args: Any, **kwargs: Any) -> uuid_module.UUID:
+        """Generate a deterministic UUID as part of the next micro-batch.
+
+        Args:
+            entity_type: Type of entity being identified.
+            *args: Positional arguments contributing to the UUID.
+            **kwargs: Keyword arguments contributing to the UUID.
+
+        Returns:
+            The same UUID as UUIDGenerator.generate with this config.
+
+        Raises:
+            RuntimeError: If used from a different event loop.
+            Exception: Whatever the synchronous call would raise for these
+                arguments. Other calls in the same micro-batch are unaffected.
+        """
+        loop = self._bind()
+        future: asyncio.Future[uuid_module.UUID] = loop.create_future()
+        self._pending.append((entity_type, args, kwargs, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_us / 1e6, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Dispatch the pending micro-batch, inline or to the executor."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        calls = [(entity_type, args, kwargs) for entity_type, args, kwargs, _ in batch]
+        futures = [future for *_, future in batch]
+        if len(batch) <= self.inline_limit:
+            self._resolve(futures, _generate_calls(self.config, calls))
+            return
+        task = asyncio.get_running_loop().create_task(self._dispatch(futures, calls))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(
+        self,
+        futures: list["asyncio.Future[uuid_module.UUID]"],
+        calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]],
+    ) -> None:
+        """Run a micro-batch on the executor and resolve its futures."""
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _generate_calls, self.config, calls
+            )
+        except Exception as exc:
+            # The executor itself failed (e.g. a broken process pool)
+            results = [exc] * len(futures)
+        self._resolve(futures, results)
+
+    @staticmethod
+    def _resolve(
+        futures: list["asyncio.Future[uuid_module.UUID]"],
+        results: list[uuid_module.UUID | Exception],
+    ) -> None:
+        """Hand each waiting caller its result, skipping cancelled callers."""
+        for future, result in zip(futures, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @overload
+    async def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: None = None
+    ) -> list[uuid_module.UUID]: ...
+
+    @overload
+    async def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: list[BatchRowError]
+    ) -> list[uuid_module.UUID | None]: ...
+
+    async def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: list[BatchRowError] | None = None
+    ) -> list[uuid_module.UUID] | list[uuid_module.UUID | None]:
+        """Generate UUIDs for a batch of rows without blocking the event loop.
+
+        Rows follow the rules of UUIDGenerator.generate_many. Batches of up
+        to ``inline_limit`` rows are generated inline; larger ones are split
+        into ``max_batch_size`` chunks that run on the executor concurrently.
+
+        Args:
+            entity_type: Type of entity being identified.
+            rows: Iterable of mappings or tuples/lists. Consumed up front.
+            errors: If None, a failing row raises BatchRowError for the
+                lowest failing index. If a list is given, failures are
+                appended to it in input order and the corresponding result
+                slot is None.
+
+        Returns:
+            UUIDs in input order.
+
+        Raises:
+            BatchRowError: If a row fails and ``errors`` is None.
+            RuntimeError: If used from a different event loop.
+        """
+        loop = self._bind()
+        rows = list(rows)
+        if len(rows) <= self.inline_limit:
+            chunks = [_generate_rows(self.config, entity_type, rows)]
+        else:
+            size = self.max_batch_size
+            chunks = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self._executor,
+                        _generate_rows,
+                        self.config,
+                        entity_type,
+                        rows[start : start + size],
+                    )
+                    for start in range(0, len(rows), size)
+                )
+            )
+
+        results: list[uuid_module.UUID | None] = []
+        for uuids, failures in chunks:
+            offset = len(results)
+            for index, exc in failures:
+                error = BatchRowError(offset + index, rows[offset + index], exc)
+                if errors is None:
+                    raise error from exc
+                errors.append(error)
+            results.extend(uuids)
+        return results
+
+    async def aclose(self) -> None:
+        """Flush pending calls and wait for in-flight micro-batches."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def __aenter__(self) -> Self:
+        """Return self; pending calls are flushed on exit."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Flush pending calls and wait for in-flight micro-batches."""
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        """Detailed representation."""
+        return (
+            f"AsyncUUIDGenerator(config={self.config!r}, max_batch_size={self.max_batch_size}, "
+            f"max_wait_us={self.max_wait_us}, inline_limit={self.inline_limit})"
+        )
+
+
+def _default(config: IDConfig | None) -> AsyncUUIDGenerator:
+    """Return the running loop's shared AsyncUUIDGenerator for a config."""
+    if config is None:
+        config = IDConfig()
+    elif not isinstance(config, IDConfig):
+        raise TypeError(f"config must be IDConfig, got {type(config).__name__}")
+    generators = _defaults.setdefault(asyncio.get_running_loop(), {})
+    generator = generators.get(config)
+    if generator is None:
+        generator = generators[config] = AsyncUUIDGenerator(config)
+    return generator
+
+
+async def agenerate(
+    entity_type: str, *args: Any, config: IDConfig | None = None, **kwargs: Any
+) -> uuid_module.UUID:
+    """Awaitable generate_uuid_only, coalesced with concurrent calls.
+
+    Calls with the same config on the same event loop share one
+    AsyncUUIDGenerator with the default limits. Create an AsyncUUIDGenerator
+    to change the limits or the executor.
+
+    Args:
+        entity_type: Type of entity being identified.
+        *args: Positional arguments contributing to the UUID.
+        config: Configuration for UUID generation. If None, uses default config.
+        **kwargs: Keyword arguments contributing to the UUID.
+
+    Returns:
+        The same UUID as generate_uuid_only.
+
+    Raises:
+        TypeError: If config is provided but is not an IDConfig instance.
+
+    Examples:
+        >>> import asyncio
+        >>> from uuid_forge.aio import agenerate
+        >>> from uuid_forge.core import generate_uuid_only
+        >>> asyncio.run(agenerate("invoice", number=1)) == generate_uuid_only("invoice", number=1)
+        True
+    """
+    return await _default(config).generate(entity_type, *args, **kwargs)
+
+
+@overload
+async def agenerate_many(
+    entity_type: str,
+    rows: Iterable[Any],
+    *,
+    config: IDConfig | None = None,
+    errors: None = None,
+) -> list[uuid_module.UUID]: ...
+
+
+@overload
+async def agenerate_many(
+    entity_type: str,
+    rows: Iterable[Any],
+    *,
+    config: IDConfig | None = None,
+    errors: list[BatchRowError],
+) -> list[uuid_module.UUID | None]: ...
+
+
+async def agenerate_many(
+    entity_type: str,
+    rows: Iterable[Any],
+    *,
+    config: IDConfig | None = None,
+    errors: list[BatchRowError] | None = None,
+) -> list[uuid_module.UUID] | list[uuid_module.UUID | None]:
+    """Awaitable UUIDGenerator.generate_many that keeps the event loop free.
+
+    See AsyncUUIDGenerator.generate_many.
+
+    Args:
+        entity_type: Type of entity being identified.
+        rows: Iterable of mappings or tuples/lists.
+        config: Configuration for UUID generation. If None, uses default config.
+        errors: Optional list collecting per-row BatchRowError instances.
+
+    Returns:
+        UUIDs in input order.
+
+    Raises:
+        TypeError: If config is provided but is not an IDConfig instance.
+        BatchRowError: If a row fails and ``errors`` is None.
+
+    Examples:
+        >>> import asyncio
+        >>> from uuid_forge.aio import agenerate_many
+        >>> from uuid_forge.core import generate_uuid_only
+        >>> uuids = asyncio.run(agenerate_many("item", [(i,) for i in range(100)]))
+        >>> uuids[42] == generate_uuid_only("item", 42)
+        True
+    """
+    if errors is None:
+        return await _default(config).generate_many(entity_type, rows)
+    return await _default(config).generate_many(entity_type, rows, errors=errors)
+
+
+class _SourceError:
+    """Carries an exception raised by the source through the row queue."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+# A dispatched chunk: offset of its first row, its rows and the pending result
+_Chunk = tuple[
+    int,
+    list[Any],
+    "asyncio.Future[tuple[list[uuid_module.UUID | None], list[tuple[int, Exception]]]]",
+]
+
+
+class _Stream:
+    """Pipeline behind generate_stream.
+
+    A pump task copies rows from the source into a bounded queue. A batcher
+    task cuts that queue into chunks, waits for a free in-flight slot and
+    sends each chunk to the executor. The consumer (the async generator)
+    yields finished chunks and frees their slots. A slow consumer therefore
+    stops the batcher, which lets the row queue fill up and stops the pump.
+    """
+
+    def __init__(
+        self,
+        entity_type: str,
+        rows: AsyncIterable[Any],
+        config: IDConfig,
+        chunk_size: int,
+        max_in_flight: int,
+        max_wait_us: int,
+        ordered: bool,
+        executor: Executor | None,
+    ) -> None:
+        self.entity_type = entity_type
+        self.rows = rows
+        self.config = config
+        self.chunk_size = chunk_size
+        self.max_in_flight = max_in_flight
+        self.max_wait = max_wait_us / 1e6
+        self.ordered = ordered
+        self.executor = executor
+        self.row_queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=chunk_size)
+        # Chunks ready to yield (in dispatch order when ordered), then _END or an error
+        self.chunk_queue: asyncio.Queue[Any] = asyncio.Queue()
+        self.slots = asyncio.Semaphore(max_in_flight)
+
+    async def pump(self) -> None:
+        """Copy rows from the source into the row queue, then _END."""
+        try:
+            async for row in self.rows:
+                await self.row_queue.put(row)
+        except Exception as exc:
+            await self.row_queue.put(_SourceError(exc))
+        else:
+            await self.row_queue.put(_END)
+
+    async def read_chunk(self) -> tuple[list[Any], Any]:
+        """Collect up to chunk_size rows, waiting at most max_wait after the first.
+
+        Returns:
+            The rows, and _END or a _SourceError if the source stopped, else None.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self.row_queue
+        chunk: list[Any] = []
+        item = await queue.get()
+        deadline = loop.time() + self.max_wait
+        while item is not _END and not isinstance(item, _SourceError):
+            chunk.append(item)
+            if len(chunk) >= self.chunk_size:
+                return chunk, None
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        item = await queue.get()
+                except TimeoutError:
+                    return chunk, None
+        return chunk, item
+
+    async def batch(self) -> None:
+        """Send chunks to the executor, holding one in-flight slot per chunk."""
+        loop = asyncio.get_running_loop()
+        offset = 0
+        try:
+            end = None
+            while end is None:
+                chunk, end = await self.read_chunk()
+                if not chunk:
+                    continue
+                await self.slots.acquire()
+                future = loop.run_in_executor(
+                    self.executor, _generate_rows, self.config, self.entity_type, chunk
+                )
+                item: _Chunk = (offset, chunk, future)
+                offset += len(chunk)
+                if self.ordered:
+                    self.chunk_queue.put_nowait(item)
+                else:
+                    future.add_done_callback(partial(self._finished, item))
+            if not self.ordered:
+                # Every slot is free once every chunk has been yielded
+                for _ in range(self.max_in_flight):
+                    await self.slots.acquire()
+            self.chunk_queue.put_nowait(end.error if isinstance(end, _SourceError) else end)
+        except Exception as exc:
+            self.chunk_queue.put_nowait(exc)
+
+    def _finished(self, item: _Chunk, _future: "asyncio.Future[Any]") -> None:
+        """Queue a chunk for yielding as soon as it is done (unordered mode)."""
+        self.chunk_queue.put_nowait(item)
+
+    async def results(
+        self, errors: list[BatchRowError] | None
+    ) -> AsyncIterator[tuple[Any, uuid_module.UUID | None]]:
+        """Run the pipeline and yield ``(row, uuid)`` pairs as chunks finish."""
+        tasks = [asyncio.create_task(self.pump()), asyncio.create_task(self.batch())]
+        try:
+            while (item := await self.chunk_queue.get()) is not _END:
+                if isinstance(item, Exception):
+                    raise item
+                offset, chunk, future = item
+                uuids, failures = await future
+                failed = dict(failures)
+                for index, (row, uuid) in enumerate(zip(chunk, uuids, strict=True)):
+                    if index in failed:
+                        error = BatchRowError(offset + index, row, failed[index])
+                        if errors is None:
+                            raise error from error.error
+                        errors.append(error)
+                    yield row, uuid
+                self.slots.release()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def generate_stream(
+    entity_type: str,
+    rows: AsyncIterable[Any],
+    *,
+    config: IDConfig | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    max_in_flight: int = STREAM_MAX_IN_FLIGHT,
+    max_wait_us: int = STREAM_MAX_WAIT_US,
+    ordered: bool = True,
+    executor: Executor | None = None,
+    errors: list[BatchRowError] | None = None,
+) -> AsyncIterator[tuple[Any, uuid_module.UUID | None]]:
+    """Generate UUIDs for an async stream of rows, off the event loop.
+
+    The async counterpart of generate_iter with ``with_rows=True``. Rows are
+    read from ``rows`` into chunks. A chunk is sent to the executor once it
+    holds ``chunk_size`` rows, or ``max_wait_us`` after its first row
+    arrived, so a quiet source does not hold back the rows already read.
+    At most ``max_in_flight`` chunks are being generated or waiting to be
+    yielded. When that limit is reached the source is not read any further
+    until the consumer catches up, so memory stays bounded by about
+    ``(max_in_flight + 2) * chunk_size`` rows.
+
+    Rows follow the same rules as UUIDGenerator.generate_many: mappings are
+    keyword arguments, tuples/lists are positional arguments.
+
+    Args:
+        entity_type: Type of entity being identified.
+        rows: Async iterable of mappings or tuples/lists, such as a Kafka
+            consumer. Consumed lazily.
+        config: Configuration for UUID generation. If None, uses default config.
+        chunk_size: Largest number of rows per executor task.
+        max_in_flight: Most chunks generated or awaiting the consumer at once.
+        max_wait_us: Longest time, in microseconds, a chunk waits for more rows
+            after its first one.
+        ordered: If True, pairs are yielded in input order. If False, each
+            chunk is yielded as soon as it is done, which avoids waiting on
+            a slow chunk; rows within a chunk keep their order.
+        executor: Executor for the chunks. If None, the event loop's default
+            executor (a thread pool) is used.
+        errors: If None, a failing row raises BatchRowError after the rows
+            before it in its chunk have been yielded. If a list is given,
+            failures are appended to it and None is yielded in place of the
+            UUID. ``BatchRowError.index`` is the position in the whole stream.
+
+    Returns:
+        An async iterator of ``(row, uuid)`` pairs. Close it (for example with
+        contextlib.aclosing) to stop reading the source early.
+
+    Raises:
+        TypeError: If config is provided but is not an IDConfig instance.
+        ValueError: If chunk_size or max_in_flight is less than 1, or
+            max_wait_us is negative.
+
+    Example:
+        ```python
+        from uuid_forge import IDConfig
+        from uuid_forge.aio import generate_stream
+
+        config = IDConfig(salt="my-secret-salt")
+
+        async for message, order_uuid in generate_stream(
+            "order", consumer, config=config, chunk_size=500, max_in_flight=8
+        ):
+            await store.put(order_uuid, message)
+        ```
+
+    Examples:
+        >>> import asyncio
+        >>> from uuid_forge.aio import generate_stream
+        >>> from uuid_forge.core import generate_uuid_only
+        >>> async def source():
+        ...     for i in range(5):
+        ...         yield {"id": i}
+        >>> async def main():
+        ...     return [pair async for pair in generate_stream("item", source(), chunk_size=2)]
+        >>> pairs = asyncio.run(main())
+        >>> [row["id"] for row, _ in pairs]
+        [0, 1, 2, 3, 4]
+        >>> pairs[3][1] == generate_uuid_only("item", id=3)
+        True
+    """
+    if config is None:
+        config = IDConfig()
+    elif not isinstance(config, IDConfig):
+        raise TypeError(f"config must be IDConfig, got {type(config).__name__}")
+    if chunk_size < 1 or max_in_flight < 1:
+        raise ValueError(
+            f"chunk_size and max_in_flight must be at least 1, got {chunk_size} and {max_in_flight}"
+        )
+    if max_wait_us < 0:
+        raise ValueError(f"max_wait_us must not be negative, got {max_wait_us}")
+    stream = _Stream(
+        entity_type, rows, config, chunk_size, max_in_flight, max_wait_us, ordered, executor
+    )
+    return stream.results(errors)
@@ -0,0 +1,203 @@
+"""NumPy array output for large batches.
+
+Every result from the core batch APIs is a full uuid.UUID instance, which costs
+over 100 bytes per ID. For tens of millions of IDs that is gigabytes, and
+downstream tools (joins, sorting, dedupe, Parquet writers) want flat buffers
+anyway. This module returns batch results as a contiguous ``(N, 16)`` uint8
+array, 16 bytes per ID, with vectorized conversions to other representations.
+
+NumPy is an optional dependency. Install it with the ``numpy`` extra:
+
+    pip install "uuid-forge[numpy]"
+"""
+
+import importlib
+import uuid as uuid_module
+from collections.abc import Iterable, Iterator
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from uuid_forge.core import BatchRowError, EntityUUIDGenerator, IDConfig
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+_NIL_UUID_BYTES = bytes(16)
+
+# Offsets of the hex digits within the canonical 36-character form
+_HEX_POSITIONS = [i for i in range(36) if i not in (8, 13, 18, 23)]
+
+
+def _numpy() -> ModuleType:
+    """Import NumPy, raising an ImportError with an install hint if missing."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as exc:
+        raise ImportError(
+            'uuid_forge.arrays requires NumPy. Install it with: pip install "uuid-forge[numpy]"'
+        ) from exc
+
+
+def _check_array(uuids: "npt.NDArray[np.uint8]") -> "npt.NDArray[np.uint8]":
+    """Validate an ``(N, 16)`` uint8 UUID array and make it C-contiguous."""
+    np = _numpy()
+    if uuids.dtype != np.uint8 or uuids.ndim != 2 or uuids.shape[1] != 16:
+        raise ValueError(
+            f"expected an (N, 16) uint8 array, got shape {uuids.shape} of {uuids.dtype}"
+        )
+    return np.ascontiguousarray(uuids)
+
+
+def generate_array(
+    entity_type: str,
+    rows: Iterable[Any],
+    *,
+    config: IDConfig | None = None,
+    errors: list[BatchRowError] | None = None,
+) -> "npt.NDArray[np.uint8]":
+    """Generate UUIDs for a batch of rows as an ``(N, 16)`` uint8 array.
+
+    Row ``i`` of the result holds the 16 bytes of the UUID for input row
+    ``i``, identical to ``UUIDGenerator.generate_many(...)[i].bytes``. No
+    uuid.UUID objects are created. Use ``result.view("V16").ravel()`` for a
+    one-dimensional array of 16-byte records.
+
+    Args:
+        entity_type: Type of entity being identified.
+        rows: Iterable of mappings (keyword arguments) or tuples/lists
+            (positional arguments), as for UUIDGenerator.generate_many.
+        config: Configuration for UUID generation. If None, uses default config.
+        errors: If None, the first failing row raises BatchRowError. If a list
+            is given, failures are appended to it and their rows are left as
+            the nil UUID (all zeros).
+
+    Returns:
+        A C-contiguous array of shape ``(N, 16)`` and dtype uint8.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        TypeError: If config is provided but is not an IDConfig instance.
+        BatchRowError: If a row fails and ``errors`` is None.
+
+    Example:
+        ```python
+        from uuid_forge import IDConfig
+        from uuid_forge.arrays import generate_array, to_hex
+
+        config = IDConfig(salt="my-secret-salt")
+        ids = generate_array("invoice", rows, config=config)
+
+        ids.shape        # (len(rows), 16)
+        to_hex(ids)[0]   # '550e8400-e29b-51d4-a716-446655440000'
+        ```
+    """
+    np = _numpy()
+    entity = EntityUUIDGenerator(entity_type, config)
+    failed: list[int] = []
+    buffer = bytearray()
+    for index, digest in enumerate(entity._iter_digests(rows, errors)):
+        if digest is None:
+            failed.append(index)
+            digest = _NIL_UUID_BYTES
+        buffer += digest
+
+    uuids = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 16)
+    # Apply the RFC 4122 version (5) and variant bits to every row at once
+    uuids[:, 6] = (uuids[:, 6] & 0x0F) | 0x50
+    uuids[:, 8] = (uuids[:, 8] & 0x3F) | 0x80
+    if failed:
+        uuids[failed] = 0
+    return uuids
+
+
+def to_hex(uuids: "npt.NDArray[np.uint8]", *, dashes: bool = True) -> "npt.NDArray[np.str_]":
+    """Convert a UUID array to hex strings without creating UUID objects.
+
+    Args:
+        uuids: Array of shape ``(N, 16)`` and dtype uint8.
+        dashes: If True (default), produce the canonical 36-character form
+            (``str(uuid)``); otherwise the 32-character form (``uuid.hex``).
+
+    Returns:
+        A 1-D unicode array of length N.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If the input is not an ``(N, 16)`` uint8 array.
+    """
+    np = _numpy()
+    uuids = _check_array(uuids)
+    alphabet = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+    digits = np.empty((len(uuids), 32), dtype=np.uint8)
+    digits[:, 0::2] = alphabet[uuids >> 4]
+    digits[:, 1::2] = alphabet[uuids & 0x0F]
+
+    if dashes:
+        chars = np.full((len(uuids), 36), ord("-"), dtype=np.uint8)
+        chars[:, _HEX_POSITIONS] = digits
+        width = 36
+    else:
+        chars = digits
+        width = 32
+    return chars.view(f"S{width}").ravel().astype(f"U{width}")
+
+
+def to_int_pairs(uuids: "npt.NDArray[np.uint8]") -> "npt.NDArray[np.uint64]":
+    """Convert a UUID array to pairs of unsigned 64-bit integers.
+
+    Column 0 holds the high 64 bits and column 1 the low 64 bits, so
+    ``(hi << 64) | lo == uuid.int``. Lexicographic order on the pairs matches
+    UUID byte order, which makes them convenient for sorting and joins.
+
+    Args:
+        uuids: Array of shape ``(N, 16)`` and dtype uint8.
+
+    Returns:
+        A native-endian uint64 array of shape ``(N, 2)``.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If the input is not an ``(N, 16)`` uint8 array.
+    """
+    np = _numpy()
+    uuids = _check_array(uuids)
+    return uuids.view(">u8").astype(np.uint64)
+
+
+def to_uuids(uuids: "npt.NDArray[np.uint8]") -> Iterator[uuid_module.UUID]:
+    """Lazily convert a UUID array to uuid.UUID objects.
+
+    Objects are created one at a time on demand, so this can be used to
+    materialize just the IDs that are actually needed.
+
+    Args:
+        uuids: Array of shape ``(N, 16)`` and dtype uint8.
+
+    Returns:
+        An iterator producing one uuid.UUID per row.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If the input is not an ``(N, 16)`` uint8 array.
+    """
+    data = _check_array(uuids).tobytes()
+    return (uuid_module.UUID(bytes=data[i : i + 16]) for i in range(0, len(data), 16))
+
+
+def from_uuids(uuids: Iterable[uuid_module.UUID]) -> "npt.NDArray[np.uint8]":
+    """Pack uuid.UUID objects into an ``(N, 16)`` uint8 array.
+
+    Args:
+        uuids: Iterable of UUIDs.
+
+    Returns:
+        A C-contiguous array of shape ``(N, 16)`` and dtype uint8.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    np = _numpy()
+    buffer = bytearray(b"".join(uid.bytes for uid in uuids))
+    return np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 16)
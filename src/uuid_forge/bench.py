@@ -0,0 +1,428 @@
+"""Throughput benchmarks for the UUID-Forge APIs on the local machine.
+
+This module times each public API (the functional helpers, UUIDGenerator,
+the batch helpers and the parallel engines) over a set of payload shapes, so
+capacity can be planned from numbers measured on the target hardware rather
+than from hand-rolled timeit scripts. The ``uuid-forge bench`` command is a
+front end to it. run_server_benchmark measures a running ``uuid-forge serve``
+instance over HTTP instead.
+
+Each benchmark processes ``count`` distinct rows and is repeated; the best
+run is reported, as timeit recommends, since slower runs measure noise from
+other processes rather than the code. Rows are built before timing starts.
+For the parallel engines, worker start-up is also excluded, because pools
+are long-lived in real ingest jobs.
+
+Example:
+    ```python
+    from uuid_forge.bench import report, run_benchmarks
+
+    results = run_benchmarks(count=100_000, workers=[1, 2, 4, 8])
+    for result in results:
+        print(result.benchmark, result.payload, result.workers, result.ids_per_second)
+    json_ready = report(results)
+    ```
+"""
+
+import asyncio
+import json
+import os
+import platform
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from uuid_forge.core import (
+    IDConfig,
+    UUIDGenerator,
+    extract_uuid_from_prefixed,
+    extract_uuids_from_prefixed,
+    generate_uuid_only,
+    generate_uuid_with_prefix,
+)
+from uuid_forge.parallel import ParallelUUIDGenerator, ThreadedUUIDGenerator, gil_enabled
+
+# Entity type and prefix used by every benchmark
+_ENTITY = "invoice"
+_PREFIX = "INV-EUR"
+
+_LONG = "x" * 512
+
+# Attribute templates: few vs many kwargs, short vs long values
+PAYLOADS: dict[str, dict[str, Any]] = {
+    "few-short": {"region": "EUR", "number": 12345},
+    "few-long": {"region": _LONG, "number": _LONG},
+    "many-short": {f"field_{i}": f"value-{i}" for i in range(16)},
+    "many-long": {f"field_{i}": _LONG for i in range(16)},
+}
+
+# A zero-argument callable that processes every row once
+_Run = Callable[[], object]
+
+
+def _rows(payload: str, count: int) -> list[dict[str, Any]]:
+    """Return ``count`` distinct attribute dicts shaped like a payload.
+
+    The first attribute gets a per-row suffix so that every row has a
+    different UUID while keeping the payload's shape.
+    """
+    template = PAYLOADS[payload]
+    first = next(iter(template))
+    return [{**template, first: f"{template[first]}-{i}"} for i in range(count)]
+
+
+def _prefixed_ids(config: IDConfig, count: int) -> list[str]:
+    """Return ``count`` distinct prefixed IDs for the extraction benchmarks."""
+    generator = UUIDGenerator(config)
+    rows = _rows("few-short", count)
+    return [generator.generate_with_prefix(_ENTITY, prefix=_PREFIX, **row) for row in rows]
+
+
+def _generate_uuid_only(config: IDConfig, rows: list[dict[str, Any]]) -> _Run:
+    def run() -> None:
+        for row in rows:
+            generate_uuid_only(_ENTITY, config=config, **row)
+
+    return run
+
+
+def _generate_uuid_with_prefix(config: IDConfig, rows: list[dict[str, Any]]) -> _Run:
+    def run() -> None:
+        for row in rows:
+            generate_uuid_with_prefix(_ENTITY, config=config, prefix=_PREFIX, **row)
+
+    return run
+
+
+def _generator_generate(config: IDConfig, rows: list[dict[str, Any]]) -> _Run:
+    generate = UUIDGenerator(config).generate
+
+    def run() -> None:
+        for row in rows:
+            generate(_ENTITY, **row)
+
+    return run
+
+
+def _entity_generator(config: IDConfig, rows: list[dict[str, Any]]) -> _Run:
+    entity = UUIDGenerator(config).for_entity(_ENTITY)
+
+    def run() -> None:
+        for row in rows:
+            entity(**row)
+
+    return run
+
+
+def _generate_many(config: IDConfig, rows: list[dict[str, Any]]) -> _Run:
+    generator = UUIDGenerator(config)
+    return lambda: generator.generate_many(_ENTITY, rows)
+
+
+def _extract_uuid_from_prefixed(ids: list[str]) -> _Run:
+    def run() -> None:
+        for prefixed in ids:
+            extract_uuid_from_prefixed(prefixed)
+
+    return run
+
+
+def _extract_uuids_from_prefixed(ids: list[str]) -> _Run:
+    return lambda: extract_uuids_from_prefixed(ids)
+
+
+def _engine_run(generator: ParallelUUIDGenerator | ThreadedUUIDGenerator, rows: list[Any]) -> _Run:
+    return lambda: generator.generate_many(_ENTITY, rows)
+
+
+# Benchmarks timed once per payload shape
+GENERATION_BENCHMARKS: dict[str, Callable[[IDConfig, list[dict[str, Any]]], _Run]] = {
+    "generate_uuid_only": _generate_uuid_only,
+    "generate_uuid_with_prefix": _generate_uuid_with_prefix,
+    "UUIDGenerator.generate": _generator_generate,
+    "UUIDGenerator.for_entity": _entity_generator,
+    "UUIDGenerator.generate_many": _generate_many,
+}
+
+# Benchmarks whose cost does not depend on the payload
+EXTRACTION_BENCHMARKS: dict[str, Callable[[list[str]], _Run]] = {
+    "extract_uuid_from_prefixed": _extract_uuid_from_prefixed,
+    "extract_uuids_from_prefixed": _extract_uuids_from_prefixed,
+}
+
+# Engines timed at each worker count
+ENGINES: dict[str, type[ParallelUUIDGenerator] | type[ThreadedUUIDGenerator]] = {
+    "ParallelUUIDGenerator": ParallelUUIDGenerator,
+    "ThreadedUUIDGenerator": ThreadedUUIDGenerator,
+}
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """The best timing of one benchmark.
+
+    Attributes:
+        benchmark: Name of the API measured, e.g. ``"UUIDGenerator.generate"``.
+        payload: Payload shape (a key of PAYLOADS), or None for extraction.
+        workers: Number of workers for the parallel engines, else None.
+        count: IDs produced (or extracted) per run.
+        seconds: Duration of the fastest run.
+        ids_per_second: ``count / seconds``.
+        ns_per_id: Nanoseconds per ID, ``seconds / count`` scaled.
+    """
+
+    benchmark: str
+    payload: str | None
+    workers: int | None
+    count: int
+    seconds: float
+    ids_per_second: float
+    ns_per_id: float
+
+
+def _measure(
+    run: _Run, benchmark: str, payload: str | None, workers: int | None, count: int, repeat: int
+) -> BenchResult:
+    """Time ``run`` ``repeat`` times and keep the fastest run."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        run()
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    nanoseconds = max(best or 0, 1)
+    return BenchResult(
+        benchmark=benchmark,
+        payload=payload,
+        workers=workers,
+        count=count,
+        seconds=nanoseconds / 1e9,
+        ids_per_second=count * 1e9 / nanoseconds,
+        ns_per_id=nanoseconds / count,
+    )
+
+
+def default_workers() -> list[int]:
+    """Return the worker counts to scale over: powers of two up to the CPU count.
+
+    Examples:
+        >>> from uuid_forge.bench import default_workers
+        >>> default_workers()[0]
+        1
+    """
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def run_benchmarks(
+    *,
+    config: IDConfig | None = None,
+    count: int = 20_000,
+    repeat: int = 3,
+    payloads: Iterable[str] | None = None,
+    benchmarks: Iterable[str] | None = None,
+    workers: Sequence[int] | None = None,
+    progress: Callable[[BenchResult], None] | None = None,
+) -> list[BenchResult]:
+    """Measure the throughput of each API on this machine.
+
+    Generation benchmarks run once per payload shape. Extraction benchmarks
+    run once, on prefixed IDs. The parallel engines run on the first payload
+    shape at each worker count, to show how throughput scales.
+
+    Args:
+        config: Configuration for UUID generation. If None, a salted config
+            is used, as in production.
+        count: IDs per run. Larger counts give steadier numbers.
+        repeat: Runs per benchmark; the fastest is reported.
+        payloads: Payload shapes to use (keys of PAYLOADS). Defaults to all.
+        benchmarks: Benchmark names to run, from GENERATION_BENCHMARKS,
+            EXTRACTION_BENCHMARKS and ENGINES. Defaults to all.
+        workers: Worker counts for the parallel engines. Defaults to
+            default_workers(). Pass an empty sequence to skip them.
+        progress: Called with each result as soon as it is measured.
+
+    Returns:
+        The results, in the order they were measured.
+
+    Raises:
+        TypeError: If config is provided but is not an IDConfig instance.
+        ValueError: If count or repeat is less than 1, a worker count is less
+            than 1, or a payload or benchmark name is unknown.
+
+    Examples:
+        >>> from uuid_forge.bench import run_benchmarks
+        >>> results = run_benchmarks(count=100, repeat=1, payloads=["few-short"], workers=[])
+        >>> [result.benchmark for result in results][:2]
+        ['generate_uuid_only', 'generate_uuid_with_prefix']
+        >>> all(result.ids_per_second > 0 for result in results)
+        True
+    """
+    config = config if config is not None else IDConfig(salt="uuid-forge-benchmark-salt")
+    if not isinstance(config, IDConfig):
+        raise TypeError(f"config must be IDConfig, got {type(config).__name__}")
+    if count < 1 or repeat < 1:
+        raise ValueError(f"count and repeat must be at least 1, got {count} and {repeat}")
+    payloads = list(PAYLOADS if payloads is None else payloads)
+    known = {*GENERATION_BENCHMARKS, *EXTRACTION_BENCHMARKS, *ENGINES}
+    selected = set(known if benchmarks is None else benchmarks)
+    workers = default_workers() if workers is None else list(workers)
+    for names, valid in ((payloads, PAYLOADS), (selected, known)):
+        unknown = sorted(set(names) - set(valid))
+        if unknown:
+            raise ValueError(f"Unknown name(s): {', '.join(unknown)}. Choose from {sorted(valid)}")
+    if any(n < 1 for n in workers):
+        raise ValueError(f"Worker counts must be at least 1, got {workers}")
+
+    results: list[BenchResult] = []
+
+    def record(result: BenchResult) -> None:
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    for payload in payloads:
+        rows = _rows(payload, count)
+        for benchmark, factory in GENERATION_BENCHMARKS.items():
+            if benchmark in selected:
+                record(_measure(factory(config, rows), benchmark, payload, None, count, repeat))
+
+    if selected & EXTRACTION_BENCHMARKS.keys():
+        ids = _prefixed_ids(config, count)
+        for benchmark, extract_factory in EXTRACTION_BENCHMARKS.items():
+            if benchmark in selected:
+                record(_measure(extract_factory(ids), benchmark, None, None, count, repeat))
+
+    if payloads and workers:
+        rows = _rows(payloads[0], count)
+        for benchmark, engine in ENGINES.items():
+            if benchmark not in selected:
+                continue
+            for n in workers:
+                chunk_size = max(1, count // (n * 4))
+                with engine(config, workers=n, chunk_size=chunk_size) as generator:
+                    # Start the pool before timing
+                    generator.generate_many(_ENTITY, rows[: n * chunk_size])
+                    run = _engine_run(generator, rows)
+                    record(_measure(run, benchmark, payloads[0], n, count, repeat))
+    return results
+
+
+async def _post_batches(
+    host: str, port: int, request: bytes, requests: int, connections: int
+) -> None:
+    """Send ``requests`` copies of a request over keep-alive connections."""
+    remaining = requests
+
+    async def connection() -> None:
+        nonlocal remaining
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                writer.write(request)
+                head = await reader.readuntil(b"\r\n\r\n")
+                status = head.split(b" ", 2)[1]
+                if status != b"200":
+                    raise RuntimeError(f"server answered {head.splitlines()[0].decode()}")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+        finally:
+            writer.close()
+
+    await asyncio.gather(*(connection() for _ in range(connections)))
+
+
+def run_server_benchmark(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    *,
+    count: int = 100_000,
+    batch_size: int = 1_000,
+    connections: int = 4,
+    repeat: int = 3,
+    payload: str = "few-short",
+) -> BenchResult:
+    """Measure the throughput of a running ID server's batch endpoint.
+
+    Sends ``POST /v1/ids`` requests of ``batch_size`` rows over
+    ``connections`` keep-alive connections until ``count`` IDs have been
+    generated. The request body is built once, so the client adds little
+    load; still, run it from another core than the server's to measure the
+    server alone.
+
+    Args:
+        host: Host of the server started with ``uuid-forge serve``.
+        port: Port of the server.
+        count: IDs per run, rounded up to whole requests.
+        batch_size: Rows per request.
+        connections: Concurrent connections.
+        repeat: Runs; the fastest is reported.
+        payload: Payload shape of the rows (a key of PAYLOADS).
+
+    Returns:
+        A BenchResult named ``"serve /v1/ids"``. Its ``workers`` field holds
+        the number of connections.
+
+    Raises:
+        ValueError: If a count is less than 1 or the payload is unknown.
+        OSError: If the server cannot be reached.
+        RuntimeError: If the server answers with an error status.
+    """
+    if min(count, batch_size, connections, repeat) < 1:
+        raise ValueError("count, batch_size, connections and repeat must be at least 1")
+    if payload not in PAYLOADS:
+        raise ValueError(f"Unknown name(s): {payload}. Choose from {sorted(PAYLOADS)}")
+    requests = -(-count // batch_size)
+    body = json.dumps({"entity_type": _ENTITY, "rows": _rows(payload, batch_size)}).encode()
+    request = (
+        f"POST /v1/ids HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+    def run() -> None:
+        asyncio.run(_post_batches(host, port, request, requests, connections))
+
+    return _measure(run, "serve /v1/ids", payload, connections, requests * batch_size, repeat)
+
+
+def machine_info() -> dict[str, Any]:
+    """Describe the interpreter and hardware the benchmarks ran on.
+
+    Examples:
+        >>> from uuid_forge.bench import machine_info
+        >>> sorted(machine_info())
+        ['cpu_count', 'gil_enabled', 'machine', 'platform', 'python', 'uuid_forge']
+    """
+    from uuid_forge import __version__
+
+    return {
+        "uuid_forge": __version__,
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "gil_enabled": gil_enabled(),
+    }
+
+
+def report(results: Iterable[BenchResult]) -> dict[str, Any]:
+    """Return results with machine information, ready for ``json.dumps``.
+
+    Examples:
+        >>> from uuid_forge.bench import BenchResult, report
+        >>> result = BenchResult("generate_uuid_only", "few-short", None, 10, 1e-5, 1e6, 1000.0)
+        >>> report([result])["results"][0]["ids_per_second"]
+        1000000.0
+    """
+    return {"machine": machine_info(), "results": [asdict(result) for result in results]}
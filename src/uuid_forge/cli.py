@@ -4,17 +4,24 @@ This module provides a comprehensive CLI for generating deterministic UUIDs,
 managing configuration, and validating security settings. The CLI is designed
 as a first-class interface to the library, suitable for both interactive use
 and automation in scripts and CI/CD pipelines.
+
+The CLI needs Typer and Rich, which are installed with the ``cli`` extra
+(``pip install "uuid-forge[cli]"``); the library itself depends on neither.
+
+Start-up time matters when scripts run a command once per entity, so heavy
+modules are imported only by the commands that use them: Rich when output is
+first formatted, subprocess by docs and test, and the multiprocessing engine
+by batch --workers. With --plain, commands print bare results and Rich is
+never imported.
 """
 
-import subprocess
+import csv
+import importlib.util
 import sys
+from contextlib import ExitStack, suppress
+from itertools import islice
 from pathlib import Path
-
-import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
+from typing import TYPE_CHECKING, Any, TextIO
 
 from uuid_forge.config import (
     init_config_file,
@@ -22,20 +29,117 @@ from uuid_forge.config import (
     validate_config_security,
 )
 from uuid_forge.core import (
+    BatchRowError,
     IDConfig,
     extract_uuid_from_prefixed,
+    extract_uuids_from_prefixed,
     generate_salt,
     generate_uuid_only,
     generate_uuid_with_prefix,
 )
+from uuid_forge.records import (
+    EnrichSpec,
+    InputFormat,
+    OnError,
+    enrich_file,
+    enrich_stream,
+    parse_keys,
+)
+
+_CLI_INSTALL_HINT = (
+    'The uuid-forge CLI requires Typer and Rich. Install them with: pip install "uuid-forge[cli]"'
+)
+
+try:
+    import typer
+except ImportError as e:
+    raise ImportError(_CLI_INSTALL_HINT, name=e.name) from e
+# Rich is imported lazily, so check up front that it is installed
+if importlib.util.find_spec("rich") is None:
+    raise ImportError(_CLI_INSTALL_HINT, name="rich")
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class _LazyConsole:
+    """Stand-in for a Rich Console that imports Rich on first use."""
+
+    def __init__(self, **options: Any) -> None:
+        self._options = options
+        self._console: Console | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._options)
+        return getattr(self._console, name)
+
 
-# Initialize Typer app and Rich console
+# Initialize Typer app and Rich consoles
 app = typer.Typer(
     name="uuid-forge",
     help="Deterministic UUID generation for cross-system coordination",
     add_completion=False,
 )
-console = Console()
+console = _LazyConsole()
+err_console = _LazyConsole(stderr=True)
+
+# Set by the --plain option: print bare results without Rich formatting
+_plain = False
+
+# Lines processed per batch by the bulk (file/stdin) commands
+_BULK_CHUNK_LINES = 10_000
+
+
+@app.callback()
+def _options(
+    plain: bool = typer.Option(
+        False,
+        "--plain",
+        "--quiet",
+        "-q",
+        envvar="UUID_FORGE_PLAIN",
+        help="Print only results, as plain text; errors go to stderr",
+    ),
+) -> None:
+    """Deterministic UUID generation for cross-system coordination."""
+    global _plain
+    _plain = plain
+
+
+def _error(message: object, *, stderr: bool = False) -> None:
+    """Report an error on the console, or as plain text on stderr with --plain."""
+    if _plain:
+        typer.echo(f"Error: {message}", err=True)
+    else:
+        (err_console if stderr else console).print(f"[red]Error:[/red] {message}")
+
+
+def _warn(message: str) -> None:
+    """Report a warning on stderr (plain text with --plain)."""
+    if _plain:
+        typer.echo(f"Warning: {message}", err=True)
+    else:
+        err_console.print(f"[yellow]{message}[/yellow]")
+
+
+def _build_config(namespace: str | None, salt: str | None, use_env: bool) -> IDConfig:
+    """Build the IDConfig for the --namespace, --salt and --env/--no-env options."""
+    if use_env and not namespace and not salt:
+        # Load from environment
+        return load_config_from_env()
+
+    # Build custom config
+    import uuid as uuid_module
+
+    ns = (
+        uuid_module.uuid5(uuid_module.NAMESPACE_DNS, namespace)
+        if namespace
+        else uuid_module.NAMESPACE_DNS
+    )
+    return IDConfig(namespace=ns, salt=salt or "")
 
 
 @app.command()
@@ -90,31 +194,16 @@ def generate(
         if attributes:
             for attr in attributes:
                 if "=" not in attr:
-                    console.print(
-                        f"[red]Error:[/red] Invalid attribute format: {attr}. Use key=value format."
-                    )
+                    _error(f"Invalid attribute format: {attr}. Use key=value format.")
                     raise typer.Exit(code=1)
                 key, value = attr.split("=", 1)
                 kwargs[key.strip()] = value.strip()
 
-        # Build configuration
-        if use_env and not namespace and not salt:
-            # Load from environment
-            config = load_config_from_env()
-        else:
-            # Build custom config
-            import uuid as uuid_module
-
-            ns = (
-                uuid_module.uuid5(uuid_module.NAMESPACE_DNS, namespace)
-                if namespace
-                else uuid_module.NAMESPACE_DNS
-            )
-            config = IDConfig(namespace=ns, salt=salt or "")
+        config = _build_config(namespace, salt, use_env)
 
         # Validate configuration security
         is_valid, messages = validate_config_security(config, strict=False)
-        if not is_valid:
+        if not is_valid and not _plain:
             console.print("[yellow]⚠ Security Warning:[/yellow]")
             for msg in messages:
                 console.print(f"  {msg}")
@@ -129,7 +218,13 @@ def generate(
             uuid_obj = generate_uuid_only(entity_type, config=config, **kwargs)
             result = str(uuid_obj)
 
+        if _plain:
+            typer.echo(result)
+            return
+
         # Display result
+        from rich.panel import Panel
+
         console.print(
             Panel(
                 f"[green bold]{result}[/green bold]",
@@ -148,17 +243,74 @@ def generate(
         console.print(f"  Namespace: {config.namespace}")
         console.print(f"  Salt: {'<set>' if config.salt else '<not set>'}")
 
+    except typer.Exit:
+        raise
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _error(e)
         raise typer.Exit(code=1) from e
 
 
+def _extract_lines(
+    source: TextIO, out: TextIO, separator: str, on_error: OnError
+) -> tuple[int, int]:
+    """Write the UUID extracted from each line of ``source`` to ``out``, one per line.
+
+    Lines are processed and written in chunks, so memory stays bounded and
+    output is written in large blocks. Lines are read with readline rather
+    than by iterating: some stdin wrappers, such as the one in Click 8.2's
+    CliRunner, raise EOFError at end of input instead of stopping.
+
+    Returns:
+        A ``(processed, failed)`` pair of line counts.
+
+    Raises:
+        BatchRowError: On the first bad line when ``on_error`` is FAIL, after
+            writing the UUIDs of all preceding lines. The index is 0-based
+            over the whole input.
+    """
+    stripped = (line.rstrip("\r\n") for line in iter(source.readline, ""))
+    processed = failed = 0
+    while chunk := list(islice(stripped, _BULK_CHUNK_LINES)):
+        errors: list[BatchRowError] = []
+        uuids = extract_uuids_from_prefixed(chunk, separator, errors=errors)
+        if errors and on_error is OnError.FAIL:
+            first = errors[0]
+            out.write("".join([f"{uuid}\n" for uuid in uuids[: first.index]]))
+            raise BatchRowError(processed + first.index, first.row, first.error)
+        if on_error is OnError.SKIP:
+            out.write("".join([f"{uuid}\n" for uuid in uuids if uuid is not None]))
+        else:
+            out.write("".join(["\n" if uuid is None else f"{uuid}\n" for uuid in uuids]))
+        processed += len(chunk)
+        failed += len(errors)
+    return processed, failed
+
+
 @app.command()
 def extract(
-    prefixed_id: str = typer.Argument(..., help="Prefixed UUID to extract from"),
+    prefixed_id: str | None = typer.Argument(
+        None, help="Prefixed UUID to extract from (omit to read IDs from --input or stdin)"
+    ),
     separator: str = typer.Option(
         "-", "--separator", "-s", help="Separator between prefix and UUID"
     ),
+    input_file: Path | None = typer.Option(
+        None,
+        "--input",
+        "-i",
+        help="File with one prefixed ID per line ('-' for stdin)",
+        dir_okay=False,
+        allow_dash=True,
+    ),
+    output: Path | None = typer.Option(
+        None, "--output", "-o", help="Write UUIDs to this file instead of stdout", dir_okay=False
+    ),
+    on_error: OnError = typer.Option(
+        OnError.FAIL,
+        "--on-error",
+        case_sensitive=False,
+        help="Bulk mode: what to do with lines without a valid UUID",
+    ),
 ) -> None:
     """Extract the UUID from a prefixed identifier.
 
@@ -166,16 +318,45 @@ def extract(
     extracts just the UUID portion. Useful for database queries or API calls
     that require the pure UUID.
 
+    Without a PREFIXED_ID argument it runs in bulk mode: IDs are streamed from
+    --input (or stdin) one per line and the UUIDs are written as plain text,
+    one per line, ready for tools such as Postgres COPY. With --on-error
+    skip, bad lines are dropped; with emit-empty, an empty line is written in
+    their place so output lines stay aligned with input lines; with fail (the
+    default), processing stops at the first bad line.
+
     Examples:
         # Extract from prefixed UUID
         $ uuid-forge extract "INV-EUR-550e8400-e29b-41d4-a716-446655440000"
 
         # With custom separator
         $ uuid-forge extract "INV_EUR_550e8400-e29b-41d4-a716-446655440000" --separator "_"
+
+        # Bulk: strip prefixes from a file of IDs
+        $ uuid-forge extract --input ids.txt --output uuids.txt --on-error skip
+
+        # Bulk: from stdin
+        $ cut -d, -f1 dump.csv | uuid-forge extract > uuids.txt
     """
+    if prefixed_id is None:
+        if input_file is None and sys.stdin.isatty():
+            _error("Pass PREFIXED_ID, --input, or pipe IDs on stdin.")
+            raise typer.Exit(code=1)
+        _extract_bulk(input_file, output, separator, on_error)
+        return
+    if input_file is not None:
+        _error("Pass either PREFIXED_ID or --input, not both.")
+        raise typer.Exit(code=1)
+
     try:
         extracted = extract_uuid_from_prefixed(prefixed_id, separator=separator)
 
+        if _plain:
+            typer.echo(extracted)
+            return
+
+        from rich.panel import Panel
+
         console.print(
             Panel(
                 f"[green bold]{extracted}[/green bold]",
@@ -189,10 +370,215 @@ def extract(
         console.print(f"  Separator: {separator}")
 
     except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _error(e)
         raise typer.Exit(code=1) from e
 
 
+def _extract_bulk(
+    input_file: Path | None, output: Path | None, separator: str, on_error: OnError
+) -> None:
+    """Run the extract command in bulk mode (file or stdin to file or stdout)."""
+    try:
+        with ExitStack() as stack:
+            if input_file is None or str(input_file) == "-":
+                source: TextIO = sys.stdin
+            else:
+                source = stack.enter_context(input_file.open(encoding="utf-8"))
+            if output is None:
+                sink: TextIO = sys.stdout
+                stack.callback(sink.flush)
+            else:
+                sink = stack.enter_context(output.open("w", encoding="utf-8"))
+            _, failed = _extract_lines(source, sink, separator, on_error)
+    except BatchRowError as e:
+        _error(f"line {e.index + 1}: {e.error}", stderr=True)
+        raise typer.Exit(code=1) from e
+    except (OSError, UnicodeDecodeError) as e:
+        _error(e, stderr=True)
+        raise typer.Exit(code=1) from e
+
+    if failed:
+        action = "Skipped" if on_error is OnError.SKIP else "Emitted empty lines for"
+        _warn(f"{action} {failed} line(s) without a valid UUID")
+
+
+@app.command()
+def batch(
+    entity_type: str = typer.Argument(
+        ..., help="Type of entity (e.g., 'invoice', 'order', 'user')"
+    ),
+    keys: list[str] = typer.Option(
+        ...,
+        "--key",
+        "-k",
+        help="Column (CSV) or dotted JSON path (JSONL) to use as an attribute, "
+        "as NAME or NAME=COLUMN (can be used multiple times)",
+    ),
+    input_file: Path | None = typer.Option(
+        None,
+        "--input",
+        "-i",
+        help="Input file ('-' or omitted for stdin)",
+        dir_okay=False,
+        allow_dash=True,
+    ),
+    output: Path | None = typer.Option(
+        None, "--output", "-o", help="Write output to this file instead of stdout", dir_okay=False
+    ),
+    input_format: InputFormat | None = typer.Option(
+        None,
+        "--format",
+        "-f",
+        case_sensitive=False,
+        help="Input format (default: from the file extension, else csv)",
+    ),
+    id_column: str = typer.Option("id", "--id-column", help="Name of the appended ID column"),
+    ids_only: bool = typer.Option(
+        False, "--ids-only", help="Write only the IDs, one per line, instead of the records"
+    ),
+    prefix: str | None = typer.Option(
+        None, "--prefix", "-p", help="Human-readable prefix for each UUID"
+    ),
+    separator: str = typer.Option(
+        "-", "--separator", "-s", help="Separator between prefix and UUID"
+    ),
+    namespace: str | None = typer.Option(
+        None, "--namespace", "-n", help="Custom namespace domain (e.g., 'mycompany.com')"
+    ),
+    salt: str | None = typer.Option(
+        None, "--salt", help="Cryptographic salt (leave empty to use env var)"
+    ),
+    use_env: bool = typer.Option(
+        True, "--env/--no-env", help="Load configuration from environment variables"
+    ),
+    on_error: OnError = typer.Option(
+        OnError.FAIL,
+        "--on-error",
+        case_sensitive=False,
+        help="What to do with records that are malformed or missing a key",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=1,
+        help="Worker processes; above 1, the --input file is split into shards "
+        "processed in parallel (requires --output)",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue an interrupted file-to-file run from its checkpoint",
+    ),
+) -> None:
+    """Generate UUIDs for every record in a CSV or JSONL stream.
+
+    Records are read from --input (or stdin), the --key columns or JSON paths
+    become the UUID attributes, and the records are written back with an ID
+    column appended (or, with --ids-only, just the IDs). Everything runs in
+    one process, in chunks, with one large write per chunk, so millions of
+    rows take seconds rather than one CLI invocation each. With --workers N
+    the input file is memory-mapped and split into newline-aligned shards
+    that N processes handle in parallel; the output is identical.
+
+    When both --input and --output are files (and --workers is 1), progress
+    is checkpointed to OUTPUT.checkpoint every 100,000 records. If the run is
+    interrupted, rerun the same command with --resume to continue where it
+    stopped; the final output is the same as that of an uninterrupted run.
+
+    IDs match the generate command and the library: CSV values are strings,
+    so "--key region --key number" gives the same UUID as "generate invoice
+    --attr region=EUR --attr number=12345"; JSONL values keep their JSON
+    types, as in generate_uuid_only("invoice", region="EUR", number=12345).
+
+    Examples:
+        # Append an id column to a CSV file
+        $ uuid-forge batch invoice --key region --key number -i invoices.csv -o out.csv
+
+        # JSONL from stdin, nested path renamed to an attribute, IDs only
+        $ cat orders.jsonl | uuid-forge batch order --key customer_id=customer.id --ids-only
+
+        # Prefixed IDs, skipping bad records
+        $ uuid-forge batch invoice -k number -i invoices.csv --prefix INV --on-error skip
+
+        # A large export across 16 processes
+        $ uuid-forge batch order -k order_id -i export.jsonl -o enriched.jsonl --workers 16
+
+        # Resume a backfill after the machine was preempted
+        $ uuid-forge batch order -k order_id -i export.jsonl -o enriched.jsonl --resume
+    """
+    from_stdin = input_file is None or str(input_file) == "-"
+    if input_format is None:
+        input_format = (
+            InputFormat.CSV
+            if input_file is None or from_stdin
+            else InputFormat.from_path(input_file)
+        )
+
+    try:
+        if workers > 1 and (input_file is None or from_stdin or output is None):
+            raise ValueError("--workers needs an --input file and an --output file")
+        if resume and (input_file is None or from_stdin or output is None or workers > 1):
+            raise ValueError(
+                "--resume needs an --input file and an --output file, without --workers"
+            )
+        spec = EnrichSpec(
+            entity_type,
+            parse_keys(keys),
+            input_format,
+            id_column=id_column,
+            ids_only=ids_only,
+            prefix=prefix,
+            separator=separator,
+            on_error=on_error,
+        )
+        config = _build_config(namespace, salt, use_env)
+    except Exception as e:
+        _error(e, stderr=True)
+        raise typer.Exit(code=1) from e
+
+    is_valid, messages = validate_config_security(config, strict=False)
+    if not is_valid and not _plain:
+        err_console.print("[yellow]⚠ Security Warning:[/yellow]")
+        for msg in messages:
+            err_console.print(f"  {msg}")
+
+    try:
+        if workers > 1:
+            from uuid_forge.parallel import process_file
+
+            assert input_file is not None and output is not None
+            _, failed = process_file(input_file, output, spec, config=config, workers=workers)
+        elif input_file is not None and not from_stdin and output is not None:
+            _, failed = enrich_file(
+                input_file, output, spec, config=config, resume=resume, chunk_size=_BULK_CHUNK_LINES
+            )
+        else:
+            with ExitStack() as stack:
+                if input_file is None or from_stdin:
+                    source: TextIO = sys.stdin
+                else:
+                    source = stack.enter_context(input_file.open(encoding="utf-8", newline=""))
+                if output is None:
+                    sink: TextIO = sys.stdout
+                    stack.callback(sink.flush)
+                else:
+                    sink = stack.enter_context(output.open("w", encoding="utf-8", newline=""))
+                _, failed = enrich_stream(
+                    source, sink, spec, config=config, chunk_size=_BULK_CHUNK_LINES
+                )
+    except BatchRowError as e:
+        _error(f"record {e.index + 1}: {e.error}", stderr=True)
+        raise typer.Exit(code=1) from e
+    except (OSError, ValueError, csv.Error) as e:
+        _error(e, stderr=True)
+        raise typer.Exit(code=1) from e
+
+    if failed:
+        action = "Skipped" if on_error is OnError.SKIP else "Wrote empty IDs for"
+        _warn(f"{action} {failed} record(s)")
+
+
 @app.command()
 def new_salt(
     length: int = typer.Option(32, "--length", "-l", help="Length of salt in bytes (minimum 16)"),
@@ -215,6 +601,12 @@ def new_salt(
     try:
         salt = generate_salt(length=length)
 
+        if _plain:
+            typer.echo(salt)
+            return
+
+        from rich.panel import Panel
+
         console.print(
             Panel(f"[green bold]{salt}[/green bold]", title="Generated Salt", border_style="green")
         )
@@ -231,7 +623,7 @@ def new_salt(
         console.print(f"  echo 'UUID_FORGE_SALT={salt}' >> .env")
 
     except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _error(e)
         raise typer.Exit(code=1) from e
 
 
@@ -261,6 +653,13 @@ def init(
     try:
         output_path = init_config_file(output_path=output, force=force)
 
+        if _plain:
+            typer.echo(output_path.absolute())
+            return
+
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+
         console.print(
             Panel(
                 f"[green]Configuration file created successfully![/green]\n\n"
@@ -287,11 +686,12 @@ config = load_config_from_env()"""
         console.print(syntax)
 
     except FileExistsError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        console.print("\n[dim]Use --force to overwrite the existing file.[/dim]")
+        _error(f"{e}. Use --force to overwrite the existing file." if _plain else e)
+        if not _plain:
+            console.print("\n[dim]Use --force to overwrite the existing file.[/dim]")
         raise typer.Exit(code=1) from e
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _error(e)
         raise typer.Exit(code=1) from e
 
 
@@ -316,6 +716,16 @@ def validate(
         config = load_config_from_env()
         is_valid, messages = validate_config_security(config, strict=strict)
 
+        if _plain:
+            for msg in messages:
+                typer.echo(msg)
+            if not is_valid or (messages and strict):
+                raise typer.Exit(code=1)
+            return
+
+        from rich.panel import Panel
+        from rich.table import Table
+
         if is_valid and not messages:
             console.print(
                 Panel(
@@ -354,8 +764,10 @@ def validate(
                     console.print("[red]Strict mode enabled - treating as failure[/red]")
                     raise typer.Exit(code=1)
 
+    except typer.Exit:
+        raise
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _error(e)
         raise typer.Exit(code=1) from e
 
 
@@ -369,6 +781,18 @@ def info() -> None:
     """
     try:
         config = load_config_from_env()
+        is_valid, messages = validate_config_security(config, strict=False)
+
+        if _plain:
+            typer.echo(f"namespace: {config.namespace}")
+            typer.echo(f"salt: {'set' if config.salt else 'not set'}")
+            typer.echo(f"salt_length: {len(config.salt)}")
+            typer.echo(f"issues: {len(messages)}")
+            return
+
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+        from rich.table import Table
 
         # Configuration info
         console.print(Panel("[bold]Current Configuration[/bold]", style="cyan"))
@@ -384,7 +808,6 @@ def info() -> None:
         console.print(info_table)
 
         # Security status
-        is_valid, messages = validate_config_security(config, strict=False)
         if is_valid and not messages:
             console.print("\n[green]✓ Configuration is secure[/green]")
         else:
@@ -409,9 +832,263 @@ uuid = generate_uuid_only(
         console.print(syntax)
 
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _error(e)
+        raise typer.Exit(code=1) from e
+
+
+@app.command()
+def bench(
+    count: int = typer.Option(
+        20_000, "--count", "-c", min=1, help="IDs per run; larger counts give steadier numbers"
+    ),
+    repeat: int = typer.Option(
+        3, "--repeat", "-r", min=1, help="Runs per benchmark; the fastest is reported"
+    ),
+    payloads: list[str] | None = typer.Option(
+        None,
+        "--payload",
+        help="Payload shape: few-short, few-long, many-short or many-long "
+        "(can be used multiple times; default: all)",
+    ),
+    only: list[str] | None = typer.Option(
+        None, "--only", help="Run only this benchmark (can be used multiple times)"
+    ),
+    workers: list[int] | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=1,
+        help="Worker count for the parallel engines (can be used multiple times; "
+        "default: powers of two up to the CPU count)",
+    ),
+    scaling: bool = typer.Option(
+        True, "--scaling/--no-scaling", help="Measure the parallel engines at each worker count"
+    ),
+    server: str | None = typer.Option(
+        None,
+        "--server",
+        metavar="HOST:PORT",
+        help="Measure a running 'uuid-forge serve' instance instead of the Python APIs",
+    ),
+    batch_size: int = typer.Option(
+        1_000, "--batch-size", min=1, help="Rows per request with --server"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the results as JSON"),
+    output: Path | None = typer.Option(
+        None, "--output", "-o", help="Also write the JSON results to this file", dir_okay=False
+    ),
+) -> None:
+    """Measure UUID throughput of each API on this machine.
+
+    Times generate_uuid_only, generate_uuid_with_prefix, UUIDGenerator (single
+    and batch), the extraction helpers and the parallel engines, across
+    payload shapes with few or many attributes and short or long values.
+    Reports IDs per second and nanoseconds per ID, and how the parallel
+    engines scale from 1 to N workers. Use --json for machine-readable output.
+
+    Examples:
+        # Everything, with a table of results
+        $ uuid-forge bench
+
+        # JSON for capacity planning, scaling over 1 to 16 workers
+        $ uuid-forge bench --json -w 1 -w 2 -w 4 -w 8 -w 16 > bench.json
+
+        # Only single-call generation, small payloads
+        $ uuid-forge bench --only UUIDGenerator.generate --payload few-short --no-scaling
+
+        # A server started with 'uuid-forge serve', 4 connections
+        $ uuid-forge bench --server 127.0.0.1:8765 -w 4 --count 200000
+    """
+    import json
+
+    from uuid_forge.bench import BenchResult, report, run_benchmarks, run_server_benchmark
+
+    def show(result: BenchResult) -> None:
+        if _plain and not as_json:
+            typer.echo(
+                f"{result.benchmark}\t{result.payload or '-'}\t{result.workers or '-'}\t"
+                f"{result.ids_per_second:.0f}\t{result.ns_per_id:.1f}"
+            )
+
+    try:
+        if server is not None:
+            host, _, port = server.rpartition(":")
+            if not host or not port.isdigit():
+                raise ValueError(f"--server must be HOST:PORT, got {server!r}")
+            options: dict[str, Any] = {
+                "count": count,
+                "batch_size": batch_size,
+                "connections": (workers or [4])[0],
+                "repeat": repeat,
+                "payload": (payloads or ["few-short"])[0],
+            }
+            if as_json or _plain:
+                result = run_server_benchmark(host.strip("[]"), int(port), **options)
+            else:
+                with console.status(f"Benchmarking {server}..."):
+                    result = run_server_benchmark(host.strip("[]"), int(port), **options)
+            show(result)
+            results = [result]
+        elif as_json or _plain:
+            results = run_benchmarks(
+                count=count,
+                repeat=repeat,
+                payloads=payloads or None,
+                benchmarks=only or None,
+                workers=(workers or None) if scaling else [],
+                progress=show,
+            )
+        else:
+            with console.status("Running benchmarks..."):
+                results = run_benchmarks(
+                    count=count,
+                    repeat=repeat,
+                    payloads=payloads or None,
+                    benchmarks=only or None,
+                    workers=(workers or None) if scaling else [],
+                )
+    except (ValueError, OSError, RuntimeError) as e:
+        _error(e, stderr=True)
+        raise typer.Exit(code=1) from e
+
+    text = json.dumps(report(results), indent=2)
+    if output is not None:
+        output.write_text(f"{text}\n", encoding="utf-8")
+    if as_json:
+        typer.echo(text)
+    elif not _plain:
+        from rich.table import Table
+
+        table = Table(title=f"UUID-Forge throughput ({count:,} IDs per run, best of {repeat})")
+        table.add_column("Benchmark", style="cyan")
+        table.add_column("Payload")
+        table.add_column("Workers", justify="right")
+        table.add_column("IDs/s", justify="right", style="green")
+        table.add_column("ns/ID", justify="right")
+        for result in results:
+            table.add_row(
+                result.benchmark,
+                result.payload or "-",
+                str(result.workers or "-"),
+                f"{result.ids_per_second:,.0f}",
+                f"{result.ns_per_id:,.0f}",
+            )
+        console.print(table)
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", "-h", help="Interface to listen on"),
+    port: int = typer.Option(8765, "--port", "-p", min=0, help="Port to listen on"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1, help="Server processes; use one per core to scale"
+    ),
+    namespace: str | None = typer.Option(
+        None, "--namespace", "-n", help="Custom namespace domain (e.g., 'mycompany.com')"
+    ),
+    salt: str | None = typer.Option(None, "--salt", help="Custom salt"),
+    use_env: bool = typer.Option(
+        True, "--env/--no-env", help="Load configuration from environment variables"
+    ),
+) -> None:
+    """Serve ID generation over HTTP for services in other languages.
+
+    Every ID is generated with the same configuration, so it matches what the
+    Python API returns for that configuration. Endpoints: GET /health,
+    POST /v1/id for one ID and POST /v1/ids for a batch. Connections are
+    kept alive and may pipeline requests. Runs until interrupted.
+
+    Examples:
+        # Serve with the configuration from UUID_FORGE_* variables
+        $ uuid-forge serve
+
+        # One process per core, reachable from other hosts
+        $ uuid-forge serve --host 0.0.0.0 --workers 4
+
+        # Request a batch of IDs
+        $ curl -d '{"entity_type":"order","rows":[{"order_number":1}]}' localhost:8765/v1/ids
+    """
+    from uuid_forge.server import serve as run_server
+
+    config = _build_config(namespace, salt, use_env)
+
+    def ready(bound: int) -> None:
+        if _plain:
+            typer.echo(f"http://{host}:{bound}")
+        else:
+            console.print(
+                f"[green]Serving IDs on[/green] [cyan]http://{host}:{bound}[/cyan] "
+                f"[dim]({workers} worker{'s' if workers > 1 else ''}; Ctrl+C to stop)[/dim]"
+            )
+
+    try:
+        run_server(config, host, port, workers=workers, ready=ready)
+    except (ValueError, OSError) as e:
+        _error(e, stderr=True)
+        raise typer.Exit(code=1) from e
+
+
+@app.command()
+def sidecar(
+    name: str = typer.Option(
+        "uuid-forge", "--name", help="Name workers attach to with SidecarClient(name)"
+    ),
+    slots: int = typer.Option(
+        64, "--slots", min=1, help="Most clients attached at once (one per worker)"
+    ),
+    slot_size: int = typer.Option(
+        64 * 1024, "--slot-size", min=1024, help="Bytes per slot; bounds one request"
+    ),
+    cache_size: int | None = typer.Option(
+        None, "--cache-size", min=1, help="Entries in the cache shared by all workers"
+    ),
+    namespace: str | None = typer.Option(
+        None, "--namespace", "-n", help="Custom namespace domain (e.g., 'mycompany.com')"
+    ),
+    salt: str | None = typer.Option(None, "--salt", help="Custom salt"),
+    use_env: bool = typer.Option(
+        True, "--env/--no-env", help="Load configuration from environment variables"
+    ),
+) -> None:
+    """Serve ID generation to worker processes on this host through shared memory.
+
+    One sidecar owns the generator and its cache; forked workers (gunicorn,
+    uWSGI) use uuid_forge.sidecar.SidecarClient instead of generating IDs
+    themselves, so the cache is held once per host. Runs until interrupted
+    or sent SIGTERM, then closes the shared-memory segment.
+
+    Examples:
+        # One sidecar per host, sharing a cache of a million IDs
+        $ uuid-forge sidecar --cache-size 1000000
+
+        # A second sidecar for another configuration
+        $ uuid-forge sidecar --name ids-tenant-b --salt "$TENANT_B_SALT"
+    """
+    import signal
+
+    from uuid_forge.sidecar import SidecarServer
+
+    config = _build_config(namespace, salt, use_env)
+    try:
+        server = SidecarServer(
+            config, name, slots=slots, slot_size=slot_size, cache_size=cache_size
+        )
+    except (ValueError, OSError) as e:
+        _error(e, stderr=True)
         raise typer.Exit(code=1) from e
 
+    with server:
+        signal.signal(signal.SIGTERM, lambda *_: server.stop())
+        if _plain:
+            typer.echo(name)
+        else:
+            console.print(
+                f"[green]Sidecar[/green] [cyan]{name}[/cyan] [green]ready[/green] "
+                f"[dim]({slots} slots; Ctrl+C to stop)[/dim]"
+            )
+        with suppress(KeyboardInterrupt):
+            server.serve_forever()
+
 
 @app.command()
 def docs(
@@ -441,6 +1118,10 @@ def docs(
         # Serve on all interfaces
         $ uuid-forge docs --host 0.0.0.0 --port 8000
     """
+    import subprocess
+
+    from rich.panel import Panel
+
     try:
         # Check if mkdocs is installed
         result = subprocess.run(
@@ -564,6 +1245,8 @@ def test(
         # Verbose output and fail fast
         $ uuid-forge test --verbose --fail-fast
     """
+    import subprocess
+
     console.print("[cyan]Running test suite...[/cyan]")
 
     # Base pytest command
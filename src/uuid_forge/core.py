@@ -8,10 +8,44 @@ identifiers across Postgres, S3, Redis, QDrant, MinIO, and other storage systems
 The core principle: Same input + Same config = Same UUID, every time.
 """
 
+import hashlib
+import re
 import secrets
+import sys
+import threading
+import time
 import uuid as uuid_module
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass
-from typing import Any, Protocol
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Literal, Protocol, TypeVar, overload
+
+from uuid_forge.metrics import GeneratorStats, _EntityRecorder, _Recorder
+
+# RFC 4122 version 5 and variant bits, exactly as uuid.UUID(..., version=5) applies them
+_UUID5_CLEAR_MASK = ~((0xC000 << 48) | (0xF000 << 64)) & ((1 << 128) - 1)
+_UUID5_SET_BITS = (0x8000 << 48) | (5 << 76)
+
+_T = TypeVar("_T")
+
+# Canonical 36-character and bare 32-digit hex UUID forms, for extraction
+_CANONICAL_UUID = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+_HEX_UUID = re.compile(r"[0-9a-fA-F]{32}")
+
+# Compiled generators a UUIDGenerator keeps per entity type and per schema;
+# past this many the map is emptied, so dynamic entity types cannot grow it
+_MAX_COMPILED = 1024
+
+# Memory a _UUIDCache entry takes beyond its normalized string: the key tuple,
+# the uuid.UUID and its int, and the OrderedDict slot (measured on CPython 3.13)
+_CACHE_ENTRY_BYTES = 270
+
+# Set by uuid_forge.metrics.enable() to instrument the module-level functions
+_recorder: _Recorder | None = None
 
 
 class Representable(Protocol):
@@ -200,6 +234,28 @@ def generate_salt(length: int = 32) -> str:
     return secrets.token_urlsafe(length)
 
 
+def _uuid_str(value: int) -> str:
+    """Format a 128-bit integer exactly as str(uuid.UUID(int=value))."""
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _repr_uuid(value: uuid_module.UUID) -> str:
+    """Return exactly repr(value) for a uuid.UUID, without UUID.__str__."""
+    h = f"{value.int:032x}"
+    return f"UUID('{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}')"
+
+
+# Dedicated formatters keyed on exact type; each must return exactly repr(value),
+# since the normalized string is hashed and any change would change existing IDs.
+# Everything else (including subclasses) goes through repr(). str, int, bool,
+# None, float, Decimal, date and datetime are left on that path on purpose:
+# their C-level repr is already the fastest exact formatter.
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    uuid_module.UUID: _repr_uuid,
+}
+
+
 def _normalize_input(*args: Any, **kwargs: Any) -> str:
     """Normalize input arguments into a consistent string representation.
 
@@ -207,6 +263,11 @@ def _normalize_input(*args: Any, **kwargs: Any) -> str:
     string format for UUID generation. It handles positional arguments,
     keyword arguments, and objects with __repr__ methods.
 
+    Every value is rendered exactly as repr() would render it. Dispatch is on
+    the exact type: types with a dedicated formatter in ``_FORMATTERS`` (such
+    as uuid.UUID) skip their slower pure-Python ``__repr__``, and all other
+    values go straight to the built-in repr().
+
     Args:
         *args: Positional arguments to normalize. Can be strings, objects
             with __repr__, or any other type that can be converted to string.
@@ -241,26 +302,94 @@ def _normalize_input(*args: Any, **kwargs: Any) -> str:
         >>> "invoice" in result4 and "region" in result4
         True
     """
-    parts = []
+    formatter = _FORMATTERS.get
 
     # Add positional arguments
-    for arg in args:
-        if hasattr(arg, "__repr__"):
-            parts.append(repr(arg))
-        else:
-            parts.append(str(arg))
+    parts = [formatter(type(arg), repr)(arg) for arg in args]
 
     # Add keyword arguments (sorted for consistency)
-    for key in sorted(kwargs.keys()):
-        value = kwargs[key]
-        if hasattr(value, "__repr__"):
-            parts.append(f"{key}={repr(value)}")
-        else:
-            parts.append(f"{key}={value}")
+    if kwargs:
+        parts += [
+            f"{key}={formatter(type(kwargs[key]), repr)(kwargs[key])}" for key in sorted(kwargs)
+        ]
 
     return "|".join(parts)
 
 
+class BatchRowError(ValueError):
+    """Error raised or collected for a single row of a batch.
+
+    Batch APIs report failures per row so that one malformed record does not
+    abort a large batch. The original exception is available as ``error``
+    (and as ``__cause__`` when raised).
+
+    Attributes:
+        index: Zero-based position of the failing row in the input.
+        row: The row that could not be processed.
+        error: The underlying exception.
+    """
+
+    def __init__(self, index: int, row: Any, error: Exception) -> None:
+        """Create an error for the row at ``index``.
+
+        Args:
+            index: Zero-based position of the failing row in the input.
+            row: The row that could not be processed.
+            error: The underlying exception.
+        """
+        super().__init__(f"row {index}: {error}")
+        self.index = index
+        self.row = row
+        self.error = error
+
+
+def _normalize_row(row: Any, key_order: list[Any]) -> str:
+    """Normalize a batch row exactly as _normalize_input would.
+
+    Mappings are treated as keyword arguments and tuples or lists as positional
+    arguments. ``key_order`` is a two-item ``[shape, sorted_keys]`` cache owned
+    by the caller: rows sharing the same key order (the common case for
+    homogeneous batches) reuse the previous sort instead of re-sorting.
+
+    Args:
+        row: A mapping of keyword arguments, or a tuple/list of positional
+            arguments.
+        key_order: Mutable ``[shape, sorted_keys]`` cache for mapping rows.
+
+    Returns:
+        The normalized string for the row.
+
+    Raises:
+        TypeError: If the row is neither a mapping nor a tuple/list, or if a
+            mapping has non-string keys.
+
+    Examples:
+        >>> from uuid_forge.core import _normalize_input, _normalize_row
+        >>> cache = [None, ()]
+        >>> _normalize_row({"region": "EUR", "number": 1}, cache) == _normalize_input(
+        ...     region="EUR", number=1
+        ... )
+        True
+        >>> _normalize_row(("EUR", 1), cache) == _normalize_input("EUR", 1)
+        True
+    """
+    if isinstance(row, Mapping):
+        shape = tuple(row)
+        if shape != key_order[0]:
+            if not all(isinstance(key, str) for key in shape):
+                raise TypeError("row keys must be strings")
+            key_order[0] = shape
+            key_order[1] = sorted(shape)
+        formatter = _FORMATTERS.get
+        return "|".join(
+            [f"{key}={formatter(type(row[key]), repr)(row[key])}" for key in key_order[1]]
+        )
+    if isinstance(row, tuple | list):
+        formatter = _FORMATTERS.get
+        return "|".join([formatter(type(value), repr)(value) for value in row])
+    raise TypeError(f"row must be a mapping, tuple or list, got {type(row).__name__}")
+
+
 def generate_uuid_only(
     entity_type: str, *args: Any, config: IDConfig | None = None, **kwargs: Any
 ) -> uuid_module.UUID:
@@ -353,6 +482,23 @@ def generate_uuid_only(
         >>> uuid7 == uuid8  # Kwargs order shouldn't matter
         True
     """
+    if _recorder is not None:
+        return _timed_uuid5(_recorder, entity_type, config, args, kwargs, _uuid_from_digest)
+
+    namespace, name = _uuid5_name(entity_type, config, args, kwargs)
+
+    # Generate deterministic UUID
+    return uuid_module.uuid5(namespace, name)
+
+
+def _uuid5_name(
+    entity_type: str, config: IDConfig | None, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[uuid_module.UUID, str]:
+    """Validate config and build the UUIDv5 namespace and name for an entity.
+
+    Raises:
+        TypeError: If config is provided but is not an IDConfig instance.
+    """
     if config is None:
         config = IDConfig()
     elif not isinstance(config, IDConfig):
@@ -368,10 +514,113 @@ def generate_uuid_only(
     if normalized:
         parts.append(normalized)
 
-    name = "|".join(parts)
+    return config.namespace_uuid, "|".join(parts)
+
+
+def _uuid5_int(digest: bytes) -> int:
+    """Turn the first 16 bytes of a SHA-1 digest into a version 5 UUID integer."""
+    return (int.from_bytes(digest[:16]) & _UUID5_CLEAR_MASK) | _UUID5_SET_BITS
+
+
+def _uuid_from_digest(digest: bytes) -> uuid_module.UUID:
+    """Build a version 5 uuid.UUID from a SHA-1 digest."""
+    return uuid_module.UUID(bytes=digest[:16], version=5)
 
-    # Generate deterministic UUID
-    return uuid_module.uuid5(config.namespace_uuid, name)
+
+def _uuid5_bytes(digest: bytes) -> bytes:
+    """Turn a SHA-1 digest into the 16 bytes of a version 5 UUID."""
+    return _uuid5_int(digest).to_bytes(16)
+
+
+def _identity(value: uuid_module.UUID) -> uuid_module.UUID:
+    """Return a cached UUID unchanged."""
+    return value
+
+
+# Convert a cached uuid.UUID to the other representations
+_uuid_int: Callable[[uuid_module.UUID], int] = attrgetter("int")
+_uuid_bytes: Callable[[uuid_module.UUID], bytes] = attrgetter("bytes")
+
+
+def _timed_uuid5(
+    recorder: _Recorder,
+    entity_type: str,
+    config: IDConfig | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    form: Callable[[bytes], _T],
+) -> _T:
+    """Instrumented body of the module-level functions, timing each phase."""
+    clock = time.perf_counter_ns
+    start = clock()
+    namespace, name = _uuid5_name(entity_type, config, args, kwargs)
+    normalized = clock()
+    digest = hashlib.sha1(namespace.bytes + name.encode()).digest()
+    hashed = clock()
+    value = form(digest)
+    recorder.entity(entity_type).record_call(start, normalized, hashed, clock())
+    return value
+
+
+def generate_uuid_int(
+    entity_type: str, *args: Any, config: IDConfig | None = None, **kwargs: Any
+) -> int:
+    """Generate a deterministic UUID as a 128-bit integer.
+
+    Equivalent to ``generate_uuid_only(...).int`` but skips constructing the
+    uuid.UUID object. Useful in tight loops that only need the integer.
+
+    Args:
+        entity_type: Type of entity being identified.
+        *args: Positional arguments contributing to the UUID.
+        config: Configuration for UUID generation. If None, uses default config.
+        **kwargs: Keyword arguments contributing to the UUID.
+
+    Returns:
+        The UUID as an integer, with version and variant bits set.
+
+    Raises:
+        TypeError: If config is provided but is not an IDConfig instance.
+
+    Examples:
+        >>> from uuid_forge.core import generate_uuid_int, generate_uuid_only
+        >>> generate_uuid_int("test", key="value") == generate_uuid_only("test", key="value").int
+        True
+    """
+    if _recorder is not None:
+        return _timed_uuid5(_recorder, entity_type, config, args, kwargs, _uuid5_int)
+
+    namespace, name = _uuid5_name(entity_type, config, args, kwargs)
+    return _uuid5_int(hashlib.sha1(namespace.bytes + name.encode()).digest())
+
+
+def generate_uuid_bytes(
+    entity_type: str, *args: Any, config: IDConfig | None = None, **kwargs: Any
+) -> bytes:
+    """Generate a deterministic UUID as 16 raw bytes.
+
+    Equivalent to ``generate_uuid_only(...).bytes`` but skips constructing the
+    uuid.UUID object. Suitable for binary database parameters and compact
+    cache keys.
+
+    Args:
+        entity_type: Type of entity being identified.
+        *args: Positional arguments contributing to the UUID.
+        config: Configuration for UUID generation. If None, uses default config.
+        **kwargs: Keyword arguments contributing to the UUID.
+
+    Returns:
+        The 16 big-endian bytes of the UUID, with version and variant bits set.
+
+    Raises:
+        TypeError: If config is provided but is not an IDConfig instance.
+
+    Examples:
+        >>> from uuid_forge.core import generate_uuid_bytes, generate_uuid_only
+        >>> generate_uuid_bytes("test", key="value") == generate_uuid_only("test", key="value").bytes
+        True
+    """
+    return generate_uuid_int(entity_type, *args, config=config, **kwargs).to_bytes(16)
 
 
 def generate_uuid_with_prefix(
@@ -509,6 +758,13 @@ def extract_uuid_from_prefixed(prefixed_id: str, separator: str = "-") -> uuid_m
     Raises:
         ValueError: If no valid UUID can be found in the input string.
 
+    Note:
+        The common case, an ID ending in a canonical 36-character or bare
+        32-digit hex UUID directly after the separator, is recognized with a
+        single fixed-width check. Other inputs (braces, ``urn:uuid:`` forms,
+        overlapping multi-character separators) fall back to trying each
+        separator-delimited suffix from the front, as UUID() would parse it.
+
     Example:
         ```python
         from uuid_forge.core import (
@@ -577,13 +833,21 @@ def extract_uuid_from_prefixed(prefixed_id: str, separator: str = "-") -> uuid_m
     ...
     ValueError: No valid UUID found in 'not-a-uuid'
     """
+    uuid = _extract_uuid_suffix(prefixed_id, separator)
+    if uuid is not None:
+        return uuid
+
     # Split by separator and try to find UUID pattern
     parts = prefixed_id.split(separator)
 
-    # Try each part from the end (UUID is typically at the end)
+    # Try each part from the front, longest candidate first
     for i in range(len(parts)):
         # Join remaining parts in case UUID has dashes
         potential_uuid = separator.join(parts[i:])
+        # Skip candidates UUID() would reject for length, without raising
+        digits = potential_uuid.replace("urn:", "").replace("uuid:", "").strip("{}")
+        if len(digits.replace("-", "")) != 32:
+            continue
         try:
             return uuid_module.UUID(potential_uuid)
         except ValueError:
@@ -592,6 +856,1020 @@ def extract_uuid_from_prefixed(prefixed_id: str, separator: str = "-") -> uuid_m
     raise ValueError(f"No valid UUID found in '{prefixed_id}'")
 
 
+def _extract_uuid_suffix(prefixed_id: str, separator: str) -> uuid_module.UUID | None:
+    """Return the UUID if the ID ends in a plain UUID right after a separator.
+
+    Returns None when the fast path does not apply, in which case the caller
+    falls back to the general scan. Any longer candidate the scan would try
+    first can only parse if its extra characters are all ignored by UUID(),
+    so it would yield this same UUID.
+    """
+    length = len(prefixed_id)
+    if length >= 36 and _CANONICAL_UUID.fullmatch(prefixed_id, length - 36):
+        start = length - 36
+    elif length >= 32 and _HEX_UUID.fullmatch(prefixed_id, length - 32):
+        start = length - 32
+    else:
+        return None
+
+    if start:
+        sep_len = len(separator)
+        if not sep_len or prefixed_id[start - sep_len : start] != separator:
+            return None
+        # With a self-overlapping separator (e.g. "--") str.split may not
+        # split at this position, so leave such inputs to the general scan.
+        if sep_len > 1 and any(separator[:k] == separator[-k:] for k in range(1, sep_len)):
+            return None
+    elif not separator:
+        # str.split("") raises; leave that to the general path
+        return None
+    return uuid_module.UUID(prefixed_id[start:])
+
+
+@overload
+def extract_uuids_from_prefixed(
+    prefixed_ids: Iterable[str], separator: str = "-", *, errors: None = None
+) -> list[uuid_module.UUID]: ...
+
+
+@overload
+def extract_uuids_from_prefixed(
+    prefixed_ids: Iterable[str], separator: str = "-", *, errors: list[BatchRowError]
+) -> list[uuid_module.UUID | None]: ...
+
+
+def extract_uuids_from_prefixed(
+    prefixed_ids: Iterable[str],
+    separator: str = "-",
+    *,
+    errors: list[BatchRowError] | None = None,
+) -> list[uuid_module.UUID] | list[uuid_module.UUID | None]:
+    """Extract UUIDs from many prefixed identifiers.
+
+    Batch form of extract_uuid_from_prefixed; each result is identical to
+    calling it on the corresponding input.
+
+    Args:
+        prefixed_ids: List or iterator of prefixed (or plain) UUID strings.
+        separator: The separator used between prefix and UUID. Default is "-".
+        errors: If None, the first ID without a valid UUID raises
+            BatchRowError. If a list is given, failures are appended to it
+            and the corresponding result slot is None.
+
+    Returns:
+        UUIDs in input order.
+
+    Raises:
+        BatchRowError: If an ID fails and ``errors`` is None.
+
+    Examples:
+        >>> from uuid_forge.core import extract_uuids_from_prefixed
+        >>> ids = ["INV-550e8400-e29b-41d4-a716-446655440000", "bogus"]
+        >>> errors = []
+        >>> extract_uuids_from_prefixed(ids, errors=errors)
+        [UUID('550e8400-e29b-41d4-a716-446655440000'), None]
+        >>> errors[0].index
+        1
+    """
+    extract = extract_uuid_from_prefixed
+    results: list[uuid_module.UUID | None] = []
+    append = results.append
+    for index, prefixed_id in enumerate(prefixed_ids):
+        try:
+            append(extract(prefixed_id, separator))
+        except Exception as exc:
+            error = BatchRowError(index, prefixed_id, exc)
+            if errors is None:
+                raise error from exc
+            errors.append(error)
+            append(None)
+    return results
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Snapshot of a UUIDGenerator cache's statistics.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that had to hash the input.
+        evictions: Entries discarded to stay within ``maxsize`` or ``maxbytes``.
+        maxsize: Maximum number of cached UUIDs, or None if only ``maxbytes``
+            bounds the cache.
+        currsize: Number of UUIDs currently cached.
+        maxbytes: Maximum memory of the cached entries in bytes, or None if
+            only ``maxsize`` bounds the cache.
+        currbytes: Memory of the cached entries in bytes. For a private cache
+            this is an estimate from the size of the normalized inputs.
+
+    Examples:
+        >>> from uuid_forge.core import CacheInfo
+        >>> CacheInfo(hits=3, misses=1, evictions=0, maxsize=10, currsize=1).hit_rate
+        0.75
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+    maxbytes: int | None = None
+    currbytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CacheBackend(Protocol):
+    """Protocol for UUIDGenerator caches passed as ``cache``.
+
+    Entries are keyed on the entity type and normalized input. The normalized
+    string already encodes each value's type (it is built from repr), so
+    inputs that compare equal but produce different UUIDs, such as ``1`` and
+    ``1.0``, never share an entry. See uuid_forge.shared_cache.SharedUUIDCache.
+    """
+
+    def bind(self, config: IDConfig) -> None:
+        """Prepare to cache UUIDs of ``config``, raising ValueError if impossible."""
+        ...
+
+    def uuid_for(
+        self, entity_type: str, normalized: str, digest: Callable[[str], bytes]
+    ) -> uuid_module.UUID:
+        """Return the cached UUID for the input, computing it with ``digest`` on a miss."""
+        ...
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        ...
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        ...
+
+
+class _UUIDCache:
+    """Thread-safe bounded LRU cache of UUIDs keyed on normalized input.
+
+    Keys are ``(entity_type, normalized)`` pairs. The normalized string already
+    encodes each value's type (it is built from repr), so inputs that compare
+    equal but produce different UUIDs, such as ``1`` and ``1.0``, never share
+    an entry. Hashing on a miss happens outside the lock.
+
+    The cache is bounded by entry count, by bytes, or both. An entry is
+    charged the size of its normalized string plus _CACHE_ENTRY_BYTES; the
+    entity type is shared with the caller and not charged.
+    """
+
+    __slots__ = (
+        "_data",
+        "_lock",
+        "currbytes",
+        "evictions",
+        "hits",
+        "maxbytes",
+        "maxsize",
+        "misses",
+    )
+
+    def __init__(self, maxsize: int | None, maxbytes: int | None = None) -> None:
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.currbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[tuple[str, str], uuid_module.UUID] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bind(self, config: IDConfig) -> None:
+        """Do nothing: each private cache serves a single generator."""
+
+    def uuid_for(
+        self, entity_type: str, normalized: str, digest: Callable[[str], bytes]
+    ) -> uuid_module.UUID:
+        """Return the cached UUID for the input, computing it with ``digest`` on a miss."""
+        key = (entity_type, normalized)
+        data = self._data
+        with self._lock:
+            value = data.get(key)
+            if value is not None:
+                data.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = uuid_module.UUID(bytes=digest(normalized), version=5)
+        size = sys.getsizeof(normalized) + _CACHE_ENTRY_BYTES
+        maxsize, maxbytes = self.maxsize, self.maxbytes
+        with self._lock:
+            # Another thread may have inserted the same key meanwhile; an
+            # entry larger than the whole budget is not cached at all
+            if key not in data and (maxbytes is None or size <= maxbytes):
+                data[key] = value
+                self.currbytes += size
+                while (maxsize is not None and len(data) > maxsize) or (
+                    maxbytes is not None and self.currbytes > maxbytes
+                ):
+                    (_, evicted), _ = data.popitem(last=False)
+                    self.currbytes -= sys.getsizeof(evicted) + _CACHE_ENTRY_BYTES
+                    self.evictions += 1
+        return value
+
+    def info(self) -> CacheInfo:
+        """Return a consistent snapshot of the counters."""
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self._data),
+                self.maxbytes,
+                self.currbytes,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.currbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+
+class EntityUUIDGenerator:
+    """Compiled UUID generator for a single entity type and configuration.
+
+    A UUIDv5 is the SHA-1 of the namespace bytes followed by the name. For a
+    fixed configuration and entity type the start of that name never changes
+    (``entity_type|salt:...``), so this class hashes it once up front and
+    only copies the hash state and feeds the normalized business data on each
+    call. The resulting UUIDs are byte-identical to generate_uuid_only.
+
+    Instances are normally obtained via UUIDGenerator.for_entity rather than
+    constructed directly.
+
+    Attributes:
+        entity_type: The entity type baked into this generator.
+        config: The IDConfig baked into this generator.
+
+    Example:
+        ```python
+        from uuid_forge.core import UUIDGenerator, IDConfig
+
+        generator = UUIDGenerator(IDConfig(salt="my-secret-salt"))
+        invoice = generator.for_entity("invoice")
+
+        # Same result as generator.generate("invoice", region="EUR", number=123)
+        invoice_uuid = invoice(region="EUR", number=123)
+        ```
+
+    Examples:
+        >>> from uuid_forge.core import EntityUUIDGenerator, IDConfig, generate_uuid_only
+        >>> config = IDConfig(salt="test-salt")
+        >>> invoice = EntityUUIDGenerator("invoice", config)
+        >>> invoice(region="EUR", number=123) == generate_uuid_only(
+        ...     "invoice", config=config, region="EUR", number=123
+        ... )
+        True
+        >>> invoice() == generate_uuid_only("invoice", config=config)
+        True
+    """
+
+    __slots__ = ("_cache", "_hasher", "config", "entity_type")
+
+    def __init__(self, entity_type: str, config: IDConfig | None = None) -> None:
+        """Precompute the hash state for an entity type.
+
+        Args:
+            entity_type: Type of entity being identified (e.g., "invoice").
+            config: Configuration for UUID generation. If None, uses default
+                configuration (DNS namespace, no salt).
+
+        Raises:
+            TypeError: If config is provided but is not an IDConfig instance.
+        """
+        if config is None:
+            config = IDConfig()
+        elif not isinstance(config, IDConfig):
+            raise TypeError(f"config must be IDConfig, got {type(config).__name__}")
+
+        self.entity_type = entity_type
+        self.config = config
+
+        # Mirrors the name layout built by generate_uuid_only
+        head = f"{entity_type}|salt:{config.salt}" if config.salt else entity_type
+        self._hasher = hashlib.sha1(config.namespace_uuid.bytes + head.encode("utf-8"))
+        # Set by UUIDGenerator.for_entity when the owning generator has a cache
+        self._cache: CacheBackend | None = None
+
+    def _digest(self, normalized: str) -> bytes:
+        """Return the first 16 bytes of the SHA-1 digest for normalized input."""
+        hasher = self._hasher.copy()
+        if normalized:
+            hasher.update(f"|{normalized}".encode())
+        return hasher.digest()[:16]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> uuid_module.UUID:
+        """Generate a deterministic UUID for this entity type.
+
+        Args:
+            *args: Positional arguments contributing to the UUID.
+            **kwargs: Keyword arguments contributing to the UUID.
+
+        Returns:
+            A deterministic UUID, identical to generate_uuid_only for the same
+            entity type, inputs and configuration.
+        """
+        normalized = _normalize_input(*args, **kwargs)
+        if self._cache is None:
+            return uuid_module.UUID(bytes=self._digest(normalized), version=5)
+        return self._cache.uuid_for(self.entity_type, normalized, self._digest)
+
+    generate = __call__
+
+    def generate_int(self, *args: Any, **kwargs: Any) -> int:
+        """Generate a deterministic UUID as a 128-bit integer.
+
+        Equivalent to ``self(...).int`` without constructing a uuid.UUID.
+
+        Args:
+            *args: Positional arguments contributing to the UUID.
+            **kwargs: Keyword arguments contributing to the UUID.
+
+        Returns:
+            The UUID as an integer, with version and variant bits set.
+        """
+        normalized = _normalize_input(*args, **kwargs)
+        if self._cache is None:
+            return _uuid5_int(self._digest(normalized))
+        return self._cache.uuid_for(self.entity_type, normalized, self._digest).int
+
+    def generate_bytes(self, *args: Any, **kwargs: Any) -> bytes:
+        """Generate a deterministic UUID as 16 raw bytes.
+
+        Equivalent to ``self(...).bytes`` without constructing a uuid.UUID.
+
+        Args:
+            *args: Positional arguments contributing to the UUID.
+            **kwargs: Keyword arguments contributing to the UUID.
+
+        Returns:
+            The 16 big-endian bytes of the UUID.
+        """
+        normalized = _normalize_input(*args, **kwargs)
+        if self._cache is None:
+            return _uuid5_int(self._digest(normalized)).to_bytes(16)
+        return self._cache.uuid_for(self.entity_type, normalized, self._digest).bytes
+
+    @overload
+    def generate_many(
+        self, rows: Iterable[Any], *, errors: None = None
+    ) -> list[uuid_module.UUID]: ...
+
+    @overload
+    def generate_many(
+        self, rows: Iterable[Any], *, errors: list[BatchRowError]
+    ) -> list[uuid_module.UUID | None]: ...
+
+    def generate_many(
+        self, rows: Iterable[Any], *, errors: list[BatchRowError] | None = None
+    ) -> list[uuid_module.UUID] | list[uuid_module.UUID | None]:
+        """Generate UUIDs for many rows of this entity type.
+
+        Each row is either a mapping (treated as keyword arguments) or a
+        tuple/list (treated as positional arguments), and produces the same
+        UUID as the equivalent single call. Config and prefix setup happen
+        once, and key order is sorted once for runs of identically shaped rows.
+
+        Args:
+            rows: Iterable of mappings or tuples/lists.
+            errors: If None, the first failing row raises BatchRowError. If a
+                list is given, failures are appended to it as BatchRowError
+                and the corresponding result slot is None, so one bad row
+                does not abort the batch.
+
+        Returns:
+            UUIDs in input order.
+
+        Raises:
+            BatchRowError: If a row fails and ``errors`` is None.
+
+        Examples:
+            >>> from uuid_forge.core import EntityUUIDGenerator, IDConfig, generate_uuid_only
+            >>> invoice = EntityUUIDGenerator("invoice", IDConfig(salt="test-salt"))
+            >>> uuids = invoice.generate_many([{"number": 1}, {"number": 2}])
+            >>> uuids[1] == invoice(number=2)
+            True
+            >>> errors = []
+            >>> uuids = invoice.generate_many([("EUR", 1), 42], errors=errors)
+            >>> uuids[1] is None, errors[0].index
+            (True, 1)
+        """
+        cache = self._cache
+        if cache is not None:
+            entity_type, digest = self.entity_type, self._digest
+            return list(
+                self._iter_rows(
+                    rows, errors, lambda normalized: cache.uuid_for(entity_type, normalized, digest)
+                )
+            )
+        uuid_cls = uuid_module.UUID
+        return [
+            None if digest is None else uuid_cls(bytes=digest, version=5)
+            for digest in self._iter_digests(rows, errors)
+        ]
+
+    def _iter_digests(
+        self, rows: Iterable[Any], errors: list[BatchRowError] | None
+    ) -> Iterator[bytes | None]:
+        """Yield the raw 16-byte digest for each row, or None for a failed row.
+
+        This is the shared batch loop behind generate_many and the array and
+        raw-output variants. Version and variant bits are not yet applied.
+        """
+        return self._iter_rows(rows, errors, self._digest)
+
+    def _iter_rows(
+        self,
+        rows: Iterable[Any],
+        errors: list[BatchRowError] | None,
+        make: Callable[[str], _T],
+    ) -> Iterator[_T | None]:
+        """Yield ``make(normalized_row)`` for each row, or None for a failed row."""
+        key_order: list[Any] = [None, ()]
+        for index, row in enumerate(rows):
+            try:
+                value = make(_normalize_row(row, key_order))
+            except Exception as exc:
+                error = BatchRowError(index, row, exc)
+                if errors is None:
+                    raise error from exc
+                errors.append(error)
+                value = None
+            yield value
+
+    def generate_with_prefix(
+        self, *args: Any, prefix: str | None = None, separator: str = "-", **kwargs: Any
+    ) -> str:
+        """Generate a deterministic UUID string with an optional prefix.
+
+        Args:
+            *args: Positional arguments contributing to the UUID.
+            prefix: Human-readable prefix to prepend to the UUID.
+            separator: Character(s) to use between prefix and UUID.
+            **kwargs: Keyword arguments contributing to the UUID.
+
+        Returns:
+            A string with optional prefix and UUID.
+        """
+        uuid_str = str(self(*args, **kwargs))
+        if prefix:
+            return f"{prefix}{separator}{uuid_str}"
+        return uuid_str
+
+    def __repr__(self) -> str:
+        """Detailed representation."""
+        return f"EntityUUIDGenerator(entity_type={self.entity_type!r}, config={self.config!r})"
+
+
+class _InstrumentedEntityUUIDGenerator(EntityUUIDGenerator):
+    """EntityUUIDGenerator that records call counts and phase timings.
+
+    A separate class, so that generators without instrumentation keep running
+    the original methods with no extra work. Instances are created by
+    UUIDGenerator.for_entity when the generator was built with
+    ``instrument=True``, and by generate_iter after metrics.enable().
+    """
+
+    __slots__ = ("_metrics",)
+
+    _metrics: _EntityRecorder
+
+    def _timed(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        form: Callable[[bytes], _T],
+        convert: Callable[[uuid_module.UUID], _T],
+    ) -> _T:
+        """Generate one ID, building it with ``form`` or, from the cache, ``convert``."""
+        clock = time.perf_counter_ns
+        start = clock()
+        normalized = _normalize_input(*args, **kwargs)
+        normalized_at = clock()
+        cache = self._cache
+        if cache is None:
+            digest = self._digest(normalized)
+            hashed_at = clock()
+            value = form(digest)
+        else:
+            cached = cache.uuid_for(self.entity_type, normalized, self._digest)
+            hashed_at = clock()
+            value = convert(cached)
+        self._metrics.record_call(start, normalized_at, hashed_at, clock())
+        return value
+
+    def __call__(self, *args: Any, **kwargs: Any) -> uuid_module.UUID:
+        """Generate a deterministic UUID, recording its phase timings."""
+        return self._timed(args, kwargs, _uuid_from_digest, _identity)
+
+    generate = __call__
+
+    def generate_int(self, *args: Any, **kwargs: Any) -> int:
+        """Generate a deterministic UUID as an integer, recording its phase timings."""
+        return self._timed(args, kwargs, _uuid5_int, _uuid_int)
+
+    def generate_bytes(self, *args: Any, **kwargs: Any) -> bytes:
+        """Generate a deterministic UUID as bytes, recording its phase timings."""
+        return self._timed(args, kwargs, _uuid5_bytes, _uuid_bytes)
+
+    def _iter_rows(
+        self,
+        rows: Iterable[Any],
+        errors: list[BatchRowError] | None,
+        make: Callable[[str], _T],
+    ) -> Iterator[_T | None]:
+        """Batch loop of EntityUUIDGenerator._iter_rows, recording phase timings.
+
+        The time spent by the consumer between rows counts as formatting.
+        The batch is recorded when the loop finishes or is abandoned.
+        """
+        clock = time.perf_counter_ns
+        key_order: list[Any] = [None, ()]
+        count = normalize_ns = hash_ns = format_ns = 0
+        try:
+            for index, row in enumerate(rows):
+                start = clock()
+                try:
+                    normalized = _normalize_row(row, key_order)
+                    normalized_at = clock()
+                    value = make(normalized)
+                except Exception as exc:
+                    normalized_at = clock()
+                    error = BatchRowError(index, row, exc)
+                    if errors is None:
+                        raise error from exc
+                    errors.append(error)
+                    value = None
+                hashed_at = clock()
+                normalize_ns += normalized_at - start
+                hash_ns += hashed_at - normalized_at
+                count += 1
+                yield value
+                format_ns += clock() - hashed_at
+        finally:
+            self._metrics.record_batch(count, normalize_ns, hash_ns, format_ns)
+
+
+@dataclass(frozen=True)
+class EntitySchema:
+    """Fixed field layout for an entity type, compiled once for fast generation.
+
+    Most entity types are always identified by the same keyword arguments.
+    Declaring them up front lets the library sort the field names, hash the
+    constant part of the name and build the prefix string once, so each call
+    only formats the values and performs one hash update. Values are passed
+    positionally in the order the fields are declared here.
+
+    UUIDs are byte-identical to the keyword form:
+    ``schema.compile(config)(*values)`` equals
+    ``generate_uuid_only(entity_type, config=config, **dict(zip(fields, values)))``.
+
+    Attributes:
+        entity_type: Type of entity being identified (e.g., "invoice").
+        fields: Keyword argument names, in the order values will be passed.
+        prefix: Optional human-readable prefix for generate_with_prefix.
+        separator: Character(s) between prefix and UUID. Default is "-".
+
+    Example:
+        ```python
+        from uuid_forge.core import EntitySchema, IDConfig
+
+        INVOICE = EntitySchema("invoice", fields=("region", "number"), prefix="INV")
+        invoice = INVOICE.compile(IDConfig(salt="my-secret-salt"))
+
+        invoice("EUR", 123)                      # UUID(...)
+        invoice.generate_with_prefix("EUR", 123) # "INV-550e8400-..."
+        ```
+
+    Examples:
+        >>> from uuid_forge.core import EntitySchema, IDConfig, generate_uuid_only
+        >>> config = IDConfig(salt="test-salt")
+        >>> schema = EntitySchema("invoice", fields=("region", "number"), prefix="INV")
+        >>> invoice = schema.compile(config)
+        >>> invoice("EUR", 123) == generate_uuid_only(
+        ...     "invoice", config=config, region="EUR", number=123
+        ... )
+        True
+        >>> EntitySchema("invoice", fields=("number", "number"))
+        Traceback (most recent call last):
+        ...
+        ValueError: duplicate field names in schema for 'invoice': ('number', 'number')
+    """
+
+    entity_type: str
+    fields: tuple[str, ...]
+    prefix: str | None = None
+    separator: str = "-"
+
+    def __post_init__(self) -> None:
+        """Validate the field names."""
+        if not isinstance(self.fields, tuple):
+            # Accept any iterable of names but store a hashable tuple
+            object.__setattr__(self, "fields", tuple(self.fields))
+        for field in self.fields:
+            if not isinstance(field, str) or not field.isidentifier():
+                raise ValueError(
+                    f"schema fields must be valid identifiers, got {field!r} "
+                    f"for {self.entity_type!r}"
+                )
+        if len(set(self.fields)) != len(self.fields):
+            raise ValueError(
+                f"duplicate field names in schema for {self.entity_type!r}: {self.fields!r}"
+            )
+
+    def compile(self, config: IDConfig | None = None) -> "CompiledSchema":
+        """Compile this schema for a configuration.
+
+        Args:
+            config: Configuration for UUID generation. If None, uses default
+                configuration (DNS namespace, no salt).
+
+        Returns:
+            A CompiledSchema bound to this schema and configuration.
+
+        Raises:
+            TypeError: If config is provided but is not an IDConfig instance.
+        """
+        return CompiledSchema(self, config)
+
+
+class CompiledSchema:
+    """UUID generator specialised for one EntitySchema and configuration.
+
+    The field names are sorted once into a format template and the hash state
+    for ``namespace + entity_type|salt:...|`` is precomputed, so a call is a
+    single pass over the values plus one SHA-1 update. Obtain instances via
+    EntitySchema.compile or UUIDGenerator.for_schema.
+
+    Attributes:
+        schema: The EntitySchema this generator was compiled from.
+        config: The IDConfig baked into this generator.
+
+    Examples:
+        >>> from uuid_forge.core import EntitySchema, IDConfig, generate_uuid_with_prefix
+        >>> config = IDConfig(salt="test-salt")
+        >>> invoice = EntitySchema("invoice", ("region", "number"), prefix="INV").compile(config)
+        >>> invoice.generate_with_prefix("EUR", 123) == generate_uuid_with_prefix(
+        ...     "invoice", prefix="INV", config=config, region="EUR", number=123
+        ... )
+        True
+        >>> invoice("EUR")
+        Traceback (most recent call last):
+        ...
+        TypeError: invoice expects 2 values (region, number), got 1
+    """
+
+    __slots__ = ("_cache", "_hasher", "_order", "_prefix", "_template", "config", "schema")
+
+    def __init__(self, schema: EntitySchema, config: IDConfig | None = None) -> None:
+        """Precompute the template and hash state for a schema.
+
+        Args:
+            schema: The entity schema to compile.
+            config: Configuration for UUID generation. If None, uses default
+                configuration (DNS namespace, no salt).
+
+        Raises:
+            TypeError: If config is provided but is not an IDConfig instance.
+        """
+        entity = EntityUUIDGenerator(schema.entity_type, config)
+        self.schema = schema
+        self.config = entity.config
+
+        fields = schema.fields
+        # Value positions in sorted-key order, matching _normalize_input's kwargs order
+        self._order = sorted(range(len(fields)), key=fields.__getitem__)
+        self._template = "|".join(f"{fields[i]}={{}}" for i in self._order)
+        self._hasher = entity._hasher.copy()
+        if fields:
+            # Every call has non-empty normalized input, so its leading "|" is constant
+            self._hasher.update(b"|")
+        self._prefix = f"{schema.prefix}{schema.separator}" if schema.prefix else ""
+        # Set by UUIDGenerator.for_schema when the owning generator has a cache
+        self._cache: CacheBackend | None = None
+
+    def _normalize(self, values: tuple[Any, ...] | list[Any]) -> str:
+        """Format values exactly as _normalize_input formats the keyword form."""
+        order = self._order
+        if len(values) != len(order):
+            raise TypeError(
+                f"{self.schema.entity_type} expects {len(order)} values "
+                f"({', '.join(self.schema.fields)}), got {len(values)}"
+            )
+        formatter = _FORMATTERS.get
+        return self._template.format(
+            *[formatter(type(value), repr)(value) for value in [values[i] for i in order]]
+        )
+
+    def _hash(self, normalized: str) -> bytes:
+        """Return the first 16 bytes of the SHA-1 digest for normalized values."""
+        hasher = self._hasher.copy()
+        hasher.update(normalized.encode())
+        return hasher.digest()[:16]
+
+    def _digest(self, values: tuple[Any, ...] | list[Any]) -> bytes:
+        """Return the first 16 bytes of the SHA-1 digest for one set of values."""
+        return self._hash(self._normalize(values))
+
+    def _uuid(self, values: tuple[Any, ...] | list[Any]) -> uuid_module.UUID:
+        """Return the UUID for one set of values, through the cache if enabled."""
+        if self._cache is None:
+            return uuid_module.UUID(bytes=self._digest(values), version=5)
+        return self._cache.uuid_for(self.schema.entity_type, self._normalize(values), self._hash)
+
+    def __call__(self, *values: Any) -> uuid_module.UUID:
+        """Generate a deterministic UUID from field values.
+
+        Args:
+            *values: One value per schema field, in declaration order.
+
+        Returns:
+            The same UUID as generate_uuid_only with the equivalent keyword
+            arguments.
+
+        Raises:
+            TypeError: If the number of values does not match the schema.
+        """
+        return self._uuid(values)
+
+    generate = __call__
+
+    def generate_int(self, *values: Any) -> int:
+        """Generate a deterministic UUID as a 128-bit integer.
+
+        Args:
+            *values: One value per schema field, in declaration order.
+
+        Returns:
+            The UUID as an integer, with version and variant bits set.
+        """
+        if self._cache is None:
+            return _uuid5_int(self._digest(values))
+        return self._uuid(values).int
+
+    def generate_bytes(self, *values: Any) -> bytes:
+        """Generate a deterministic UUID as 16 raw bytes.
+
+        Args:
+            *values: One value per schema field, in declaration order.
+
+        Returns:
+            The 16 big-endian bytes of the UUID.
+        """
+        if self._cache is None:
+            return _uuid5_int(self._digest(values)).to_bytes(16)
+        return self._uuid(values).bytes
+
+    def generate_with_prefix(self, *values: Any) -> str:
+        """Generate a UUID string with the schema's prefix and separator.
+
+        Args:
+            *values: One value per schema field, in declaration order.
+
+        Returns:
+            ``"{prefix}{separator}{uuid}"``, or just the UUID string if the
+            schema has no prefix.
+        """
+        if self._cache is None:
+            return self._prefix + _uuid_str(_uuid5_int(self._digest(values)))
+        return self._prefix + str(self._uuid(values))
+
+    @overload
+    def generate_many(
+        self, rows: Iterable[tuple[Any, ...] | list[Any]], *, errors: None = None
+    ) -> list[uuid_module.UUID]: ...
+
+    @overload
+    def generate_many(
+        self, rows: Iterable[tuple[Any, ...] | list[Any]], *, errors: list[BatchRowError]
+    ) -> list[uuid_module.UUID | None]: ...
+
+    def generate_many(
+        self,
+        rows: Iterable[tuple[Any, ...] | list[Any]],
+        *,
+        errors: list[BatchRowError] | None = None,
+    ) -> list[uuid_module.UUID] | list[uuid_module.UUID | None]:
+        """Generate UUIDs for many rows of field values.
+
+        Args:
+            rows: Iterable of tuples/lists, each holding one value per schema
+                field in declaration order.
+            errors: If None, the first failing row raises BatchRowError. If a
+                list is given, failures are appended to it and the
+                corresponding result slot is None.
+
+        Returns:
+            UUIDs in input order.
+
+        Raises:
+            BatchRowError: If a row fails and ``errors`` is None.
+
+        Examples:
+            >>> from uuid_forge.core import EntitySchema
+            >>> invoice = EntitySchema("invoice", ("region", "number")).compile()
+            >>> invoice.generate_many([("EUR", 1), ("USD", 2)])[1] == invoice("USD", 2)
+            True
+        """
+        if self._cache is not None:
+            return list(self._iter_rows(rows, errors, self._uuid))
+        uuid_cls = uuid_module.UUID
+        return [
+            None if digest is None else uuid_cls(bytes=digest, version=5)
+            for digest in self._iter_digests(rows, errors)
+        ]
+
+    def _iter_digests(
+        self, rows: Iterable[Any], errors: list[BatchRowError] | None
+    ) -> Iterator[bytes | None]:
+        """Yield the raw 16-byte digest for each row, or None for a failed row."""
+        return self._iter_rows(rows, errors, self._digest)
+
+    def _iter_rows(
+        self,
+        rows: Iterable[Any],
+        errors: list[BatchRowError] | None,
+        make: Callable[[tuple[Any, ...] | list[Any]], _T],
+    ) -> Iterator[_T | None]:
+        """Yield ``make(row)`` for each row, or None for a failed row."""
+        for index, row in enumerate(rows):
+            try:
+                if not isinstance(row, tuple | list):
+                    raise TypeError(f"row must be a tuple or list, got {type(row).__name__}")
+                value = make(row)
+            except Exception as exc:
+                error = BatchRowError(index, row, exc)
+                if errors is None:
+                    raise error from exc
+                errors.append(error)
+                value = None
+            yield value
+
+    def __repr__(self) -> str:
+        """Detailed representation."""
+        return f"CompiledSchema(schema={self.schema!r}, config={self.config!r})"
+
+
+@overload
+def generate_iter(
+    entity_type: str,
+    rows: Iterable[Any],
+    *,
+    config: IDConfig | None = None,
+    chunk_size: int = 10_000,
+    with_rows: Literal[False] = False,
+    errors: None = None,
+) -> Iterator[uuid_module.UUID]: ...
+
+
+@overload
+def generate_iter(
+    entity_type: str,
+    rows: Iterable[Any],
+    *,
+    config: IDConfig | None = None,
+    chunk_size: int = 10_000,
+    with_rows: Literal[True],
+    errors: None = None,
+) -> Iterator[tuple[Any, uuid_module.UUID]]: ...
+
+
+@overload
+def generate_iter(
+    entity_type: str,
+    rows: Iterable[Any],
+    *,
+    config: IDConfig | None = None,
+    chunk_size: int = 10_000,
+    with_rows: Literal[False] = False,
+    errors: list[BatchRowError],
+) -> Iterator[uuid_module.UUID | None]: ...
+
+
+@overload
+def generate_iter(
+    entity_type: str,
+    rows: Iterable[Any],
+    *,
+    config: IDConfig | None = None,
+    chunk_size: int = 10_000,
+    with_rows: Literal[True],
+    errors: list[BatchRowError],
+) -> Iterator[tuple[Any, uuid_module.UUID | None]]: ...
+
+
+def generate_iter(
+    entity_type: str,
+    rows: Iterable[Any],
+    *,
+    config: IDConfig | None = None,
+    chunk_size: int = 10_000,
+    with_rows: bool = False,
+    errors: list[BatchRowError] | None = None,
+) -> Iterator[Any]:
+    """Lazily generate UUIDs for a stream of rows with bounded memory.
+
+    Rows are pulled from any iterable (for example a server-side database
+    cursor) ``chunk_size`` at a time and run through the batch path, so at
+    most one chunk of input and output is held in memory at once. Rows follow
+    the same rules as UUIDGenerator.generate_many: mappings are keyword
+    arguments, tuples/lists are positional arguments.
+
+    Args:
+        entity_type: Type of entity being identified.
+        rows: Iterable of mappings or tuples/lists. Consumed lazily.
+        config: Configuration for UUID generation. If None, uses default config.
+        chunk_size: Number of rows pulled from ``rows`` per batch.
+        with_rows: If True, yield ``(row, uuid)`` pairs instead of bare UUIDs.
+        errors: If None, a failing row raises BatchRowError after every
+            preceding row has been yielded. If a list is given, failures are
+            appended to it and None is yielded in place of the UUID.
+            ``BatchRowError.index`` is the position in the whole stream.
+
+    Yields:
+        UUIDs, or ``(row, uuid)`` pairs, in input order.
+
+    Raises:
+        ValueError: If chunk_size is less than 1.
+        TypeError: If config is provided but is not an IDConfig instance.
+        BatchRowError: If a row fails and ``errors`` is None.
+
+    Example:
+        ```python
+        from uuid_forge.core import generate_iter, IDConfig
+
+        config = IDConfig(salt="my-secret-salt")
+
+        cursor.execute("SELECT region, number FROM invoices")
+        for row, invoice_uuid in generate_iter(
+            "invoice", cursor, config=config, with_rows=True
+        ):
+            writer.write(row, invoice_uuid)
+        ```
+
+    Examples:
+        >>> from uuid_forge.core import generate_iter, generate_uuid_only
+        >>> stream = generate_iter("item", ((i,) for i in range(5)), chunk_size=2)
+        >>> next(stream) == generate_uuid_only("item", 0)
+        True
+        >>> len(list(stream))
+        4
+        >>> pairs = generate_iter("item", [{"id": 7}], with_rows=True)
+        >>> [(row, uid == generate_uuid_only("item", id=7)) for row, uid in pairs]
+        [({'id': 7}, True)]
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    # Validate eagerly, before the first row is consumed
+    if _recorder is None:
+        entity = EntityUUIDGenerator(entity_type, config)
+    else:
+        entity = _InstrumentedEntityUUIDGenerator(entity_type, config)
+        entity._metrics = _recorder.entity(entity_type)
+    return _generate_iter(entity, iter(rows), chunk_size, with_rows, errors)
+
+
+def _generate_iter(
+    entity: EntityUUIDGenerator,
+    rows: Iterator[Any],
+    chunk_size: int,
+    with_rows: bool,
+    errors: list[BatchRowError] | None,
+) -> Iterator[Any]:
+    """Chunked generator body for generate_iter."""
+    offset = 0
+    while chunk := list(islice(rows, chunk_size)):
+        chunk_errors: list[BatchRowError] = []
+        results = entity.generate_many(chunk, errors=chunk_errors)
+        failed = {error.index: error for error in chunk_errors}
+
+        for index, (row, result) in enumerate(zip(chunk, results, strict=True)):
+            if index in failed:
+                error = BatchRowError(offset + index, row, failed[index].error)
+                if errors is None:
+                    raise error from error.error
+                errors.append(error)
+            yield (row, result) if with_rows else result
+
+        offset += len(chunk)
+
+
 class UUIDGenerator:
     """Object-oriented convenience wrapper for UUID generation.
 
@@ -606,6 +1884,14 @@ class UUIDGenerator:
     - Encapsulation of configuration in a service/repository
     - Dependency injection patterns
 
+    A generator is safe to share between threads, including on free-threaded
+    (PEP 703) builds: the compiled per-entity hash state is written once and
+    afterwards only ever copied, never updated in place. The optional cache
+    (``cache_size`` or ``cache_bytes``) is guarded by a lock.
+
+    Assigning ``config`` discards the compiled generators and empties the
+    cache, so later calls use the new configuration.
+
     Attributes:
         config: The IDConfig used for all UUID generation operations.
 
@@ -669,20 +1955,215 @@ class UUIDGenerator:
         True
     """
 
-    def __init__(self, config: IDConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: IDConfig | None = None,
+        *,
+        cache_size: int | None = None,
+        cache_bytes: int | None = None,
+        cache: CacheBackend | None = None,
+        instrument: bool = False,
+    ) -> None:
         """Initialize the UUID generator with a configuration.
 
         Args:
             config: Configuration for UUID generation. If None, uses default
                 configuration (DNS namespace, no salt).
+            cache_size: If given, keep up to this many generated UUIDs in a
+                thread-safe LRU cache keyed on entity type and normalized
+                input. Useful when the same business keys recur often. A hit
+                skips hashing and UUID construction but still normalizes the
+                input, which the key is built from, so it is not a bare dict
+                lookup: expect a hit to take roughly half to two thirds of
+                the time of an uncached call. Each entry costs roughly the
+                size of its normalized input plus about 320 bytes. If None
+                (default) and cache_bytes is None, no cache is used and there
+                is no overhead.
+            cache_bytes: If given, also keep the cache's entries within about
+                this many bytes, evicting the least recently used ones; use
+                it when inputs can be long. Either limit alone enables the
+                cache.
+            cache: A cache to use instead of a private one, such as a
+                uuid_forge.shared_cache.SharedUUIDCache shared by the forked
+                workers of a server. Cannot be combined with cache_size or
+                cache_bytes.
+            instrument: If True, count IDs per entity type and time the
+                normalize, hash and format phases, readable with stats().
+                Costs a few timer reads per ID. If False (default), nothing
+                is recorded and there is no overhead.
+
+        Raises:
+            ValueError: If cache_size or cache_bytes is less than 1, if cache
+                is combined with either, or if cache holds UUIDs of another
+                config.
         """
-        self.config = config or IDConfig()
+        self._config = config or IDConfig()
+        self._entities: dict[str, EntityUUIDGenerator] = {}
+        self._schemas: dict[EntitySchema, CompiledSchema] = {}
+        if cache_size is not None and cache_size < 1:
+            raise ValueError(f"cache_size must be at least 1, got {cache_size}")
+        if cache_bytes is not None and cache_bytes < 1:
+            raise ValueError(f"cache_bytes must be at least 1, got {cache_bytes}")
+        private = cache_size is not None or cache_bytes is not None
+        if private and cache is not None:
+            raise ValueError("pass either cache_size/cache_bytes or cache, not both")
+        if cache is not None:
+            cache.bind(self.config)
+        self._cache = _UUIDCache(cache_size, cache_bytes) if private else cache
+        self._recorder = _Recorder() if instrument else None
+
+    @property
+    def config(self) -> IDConfig:
+        """The IDConfig used for all UUID generation operations."""
+        return self._config
+
+    @config.setter
+    def config(self, config: IDConfig) -> None:
+        """Switch to another configuration, dropping state built for the old one.
+
+        Raises:
+            ValueError: If the generator uses a shared cache that holds UUIDs
+                of another config.
+        """
+        if config == self._config:
+            return
+        if self._cache is not None:
+            self._cache.bind(config)
+        # Compiled generators and cached UUIDs are only valid for one config
+        self._config = config
+        self._entities = {}
+        self._schemas = {}
+        if self._cache is not None:
+            self._cache.clear()
+
+    def for_entity(self, entity_type: str) -> EntityUUIDGenerator:
+        """Return a compiled generator for one entity type.
+
+        The compiled generator precomputes the namespace, entity type and salt
+        portion of the hash, so repeated calls only hash the business data.
+        Generators are built once per entity type and reused; past 1024
+        entity types the stored generators are discarded and rebuilt on use.
+
+        Args:
+            entity_type: Type of entity being identified.
+
+        Returns:
+            An EntityUUIDGenerator bound to this generator's configuration.
+
+        Examples:
+            >>> from uuid_forge.core import UUIDGenerator, IDConfig
+            >>> gen = UUIDGenerator(IDConfig(salt="test-salt"))
+            >>> invoice = gen.for_entity("invoice")
+            >>> invoice(number=1) == gen.generate("invoice", number=1)
+            True
+            >>> gen.for_entity("invoice") is invoice
+            True
+        """
+        entity = self._entities.get(entity_type)
+        if entity is None:
+            if self._recorder is None:
+                entity = EntityUUIDGenerator(entity_type, self.config)
+            else:
+                entity = _InstrumentedEntityUUIDGenerator(entity_type, self.config)
+                entity._metrics = self._recorder.entity(entity_type)
+            entity._cache = self._cache
+            if len(self._entities) >= _MAX_COMPILED:
+                self._entities.clear()
+            # setdefault keeps the first generator if two threads race here
+            entity = self._entities.setdefault(entity_type, entity)
+        return entity
+
+    def for_schema(self, schema: EntitySchema) -> CompiledSchema:
+        """Return a compiled generator for an entity schema.
+
+        Schemas are compiled once per generator and reused, like the
+        generators of for_entity.
+
+        Args:
+            schema: The entity schema to compile with this generator's
+                configuration.
+
+        Returns:
+            A CompiledSchema bound to this generator's configuration.
+
+        Examples:
+            >>> from uuid_forge.core import EntitySchema, UUIDGenerator, IDConfig
+            >>> gen = UUIDGenerator(IDConfig(salt="test-salt"))
+            >>> schema = EntitySchema("invoice", fields=("region", "number"))
+            >>> invoice = gen.for_schema(schema)
+            >>> invoice("EUR", 1) == gen.generate("invoice", region="EUR", number=1)
+            True
+            >>> gen.for_schema(schema) is invoice
+            True
+        """
+        compiled = self._schemas.get(schema)
+        if compiled is None:
+            compiled = CompiledSchema(schema, self.config)
+            compiled._cache = self._cache
+            if len(self._schemas) >= _MAX_COMPILED:
+                self._schemas.clear()
+            compiled = self._schemas.setdefault(schema, compiled)
+        return compiled
+
+    def cache_info(self) -> CacheInfo | None:
+        """Return cache statistics, or None if caching is disabled.
+
+        Returns:
+            A CacheInfo snapshot of hits, misses, evictions and size.
+
+        Examples:
+            >>> from uuid_forge.core import UUIDGenerator
+            >>> gen = UUIDGenerator(cache_size=2)
+            >>> for key in ["a", "b", "a", "c"]:
+            ...     _ = gen.generate("user", key)
+            >>> info = gen.cache_info()
+            >>> info.hits, info.misses, info.evictions, info.currsize
+            (1, 3, 1, 2)
+            >>> UUIDGenerator().cache_info() is None
+            True
+        """
+        return None if self._cache is None else self._cache.info()
+
+    def stats(self) -> GeneratorStats | None:
+        """Return instrumentation counters, or None if instrumentation is off.
+
+        Counts cover generate, generate_int, generate_bytes,
+        generate_with_prefix, generate_many and the for_entity generators.
+        Schema generators from for_schema are not instrumented. Render the
+        result with uuid_forge.metrics.to_prometheus.
+
+        Returns:
+            A GeneratorStats snapshot with counters per entity type and, if
+            caching is enabled, the cache statistics.
+
+        Examples:
+            >>> from uuid_forge.core import UUIDGenerator
+            >>> gen = UUIDGenerator(cache_size=10, instrument=True)
+            >>> for key in ["a", "b", "a"]:
+            ...     _ = gen.generate("user", key)
+            >>> stats = gen.stats()
+            >>> stats.entities["user"].calls, stats.entities["user"].latency.count
+            (3, 3)
+            >>> round(stats.cache.hit_rate, 2)
+            0.33
+            >>> UUIDGenerator().stats() is None
+            True
+        """
+        if self._recorder is None:
+            return None
+        return self._recorder.snapshot(self.cache_info())
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset its statistics. No-op if caching is disabled."""
+        if self._cache is not None:
+            self._cache.clear()
 
     def generate(self, entity_type: str, *args: Any, **kwargs: Any) -> uuid_module.UUID:
         """Generate a deterministic UUID using this generator's configuration.
 
-        This is a convenience method that calls generate_uuid_only with the
-        generator's stored configuration.
+        This is a convenience method equivalent to generate_uuid_only with the
+        generator's stored configuration, using the compiled per-entity
+        generator from for_entity.
 
         Args:
             entity_type: Type of entity being identified.
@@ -692,7 +2173,72 @@ class UUIDGenerator:
         Returns:
             A deterministic UUID.
         """
-        return generate_uuid_only(entity_type, *args, config=self.config, **kwargs)
+        return self.for_entity(entity_type)(*args, **kwargs)
+
+    def generate_int(self, entity_type: str, *args: Any, **kwargs: Any) -> int:
+        """Generate a deterministic UUID as a 128-bit integer.
+
+        Equivalent to ``generate(...).int`` without constructing a uuid.UUID.
+
+        Args:
+            entity_type: Type of entity being identified.
+            *args: Positional arguments contributing to the UUID.
+            **kwargs: Keyword arguments contributing to the UUID.
+
+        Returns:
+            The UUID as an integer, with version and variant bits set.
+        """
+        return self.for_entity(entity_type).generate_int(*args, **kwargs)
+
+    def generate_bytes(self, entity_type: str, *args: Any, **kwargs: Any) -> bytes:
+        """Generate a deterministic UUID as 16 raw bytes.
+
+        Equivalent to ``generate(...).bytes`` without constructing a uuid.UUID.
+
+        Args:
+            entity_type: Type of entity being identified.
+            *args: Positional arguments contributing to the UUID.
+            **kwargs: Keyword arguments contributing to the UUID.
+
+        Returns:
+            The 16 big-endian bytes of the UUID.
+        """
+        return self.for_entity(entity_type).generate_bytes(*args, **kwargs)
+
+    @overload
+    def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: None = None
+    ) -> list[uuid_module.UUID]: ...
+
+    @overload
+    def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: list[BatchRowError]
+    ) -> list[uuid_module.UUID | None]: ...
+
+    def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: list[BatchRowError] | None = None
+    ) -> list[uuid_module.UUID] | list[uuid_module.UUID | None]:
+        """Generate UUIDs for a batch of rows of one entity type.
+
+        Rows are mappings (keyword arguments) or tuples/lists (positional
+        arguments). Each row yields the same UUID as the equivalent call to
+        generate. See EntityUUIDGenerator.generate_many for details.
+
+        Args:
+            entity_type: Type of entity being identified.
+            rows: Iterable of mappings or tuples/lists.
+            errors: Optional list collecting per-row BatchRowError instances.
+                When given, failing rows produce None instead of aborting.
+
+        Returns:
+            UUIDs in input order.
+
+        Raises:
+            BatchRowError: If a row fails and ``errors`` is None.
+        """
+        if errors is None:
+            return self.for_entity(entity_type).generate_many(rows)
+        return self.for_entity(entity_type).generate_many(rows, errors=errors)
 
     def generate_with_prefix(
         self,
@@ -704,8 +2250,8 @@ class UUIDGenerator:
     ) -> str:
         """Generate a deterministic UUID with prefix using this generator's configuration.
 
-        This is a convenience method that calls generate_uuid_with_prefix with the
-        generator's stored configuration.
+        This is a convenience method equivalent to generate_uuid_with_prefix with
+        the generator's stored configuration.
 
         Args:
             entity_type: Type of entity being identified.
@@ -717,6 +2263,6 @@ class UUIDGenerator:
         Returns:
             A string with optional prefix and UUID.
         """
-        return generate_uuid_with_prefix(
-            entity_type, *args, prefix=prefix, separator=separator, config=self.config, **kwargs
+        return self.for_entity(entity_type).generate_with_prefix(
+            *args, prefix=prefix, separator=separator, **kwargs
         )
@@ -0,0 +1,459 @@
+"""Opt-in instrumentation of the generation hot path.
+
+Without instrumentation the only way to attribute latency inside UUID-Forge
+is to run a profiler. This module counts IDs per entity type and splits the
+time spent into the three phases of every generation:
+
+- **normalize**: turning the business data into the canonical name string,
+- **hash**: the SHA-1 of namespace and name (or, with a cache, the lookup),
+- **format**: building the UUID, integer or bytes from the digest.
+
+It also keeps fixed-bucket histograms of single-call latency and batch
+sizes. Counters are kept per thread and summed when read, so recording takes
+no lock and stays correct on free-threaded builds. The counters of a thread
+that has exited are folded into one total, so thread-per-request servers do
+not accumulate them.
+
+Instrumentation is off by default and then costs nothing: an uninstrumented
+UUIDGenerator runs exactly the same code as before, and the module-level
+functions in uuid_forge.core only check one global. Turn it on per generator
+with ``UUIDGenerator(instrument=True)``, or for the module-level functions
+with enable().
+
+Example:
+    ```python
+    from uuid_forge.core import IDConfig, UUIDGenerator
+    from uuid_forge.metrics import to_prometheus
+
+    generator = UUIDGenerator(IDConfig(salt="my-secret-salt"), instrument=True)
+    generator.generate("invoice", region="EUR", number=123)
+
+    stats = generator.stats()
+    print(stats.entities["invoice"].calls)
+    print(to_prometheus(stats, labels={"service": "billing"}))
+    ```
+"""
+
+import threading
+import weakref
+from bisect import bisect_left
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from uuid_forge.core import CacheInfo
+
+# Upper bounds of the single-call latency buckets, in nanoseconds
+LATENCY_BUCKETS_NS: tuple[int, ...] = (
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    25_000,
+    50_000,
+    100_000,
+    1_000_000,
+)
+
+# Upper bounds of the batch size buckets, in rows
+BATCH_SIZE_BUCKETS: tuple[int, ...] = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+@dataclass(frozen=True)
+class Histogram:
+    """Snapshot of a fixed-bucket histogram.
+
+    Attributes:
+        bounds: Inclusive upper bound of each bucket, in ascending order.
+        counts: Observations per bucket (not cumulative). There is one more
+            count than bounds: the last one counts observations above every
+            bound.
+        total: Sum of all observations.
+
+    Examples:
+        >>> from uuid_forge.metrics import Histogram
+        >>> histogram = Histogram(bounds=(10, 100), counts=(2, 1, 1), total=260)
+        >>> histogram.count, histogram.mean
+        (4, 65.0)
+        >>> histogram.quantile(0.5), histogram.quantile(1.0)
+        (10, inf)
+    """
+
+    bounds: tuple[int, ...]
+    counts: tuple[int, ...]
+    total: int
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    @property
+    def mean(self) -> float:
+        """Mean observation (0.0 before any observation)."""
+        count = self.count
+        return self.total / count if count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding the ``q`` quantile.
+
+        Args:
+            q: Quantile between 0 and 1, e.g. 0.99.
+
+        Returns:
+            The bucket's upper bound, ``inf`` for the overflow bucket, or 0.0
+            before any observation.
+
+        Raises:
+            ValueError: If q is not between 0 and 1.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"q must be between 0 and 1, got {q}")
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            seen += count
+            if seen and seen >= rank:
+                return bound
+        return float("inf") if self.count else 0.0
+
+
+@dataclass(frozen=True)
+class EntityStats:
+    """Counters for one entity type.
+
+    Phase times cover single calls and batches alike. In a batch the format
+    phase is the time the consumer spends between rows, which for
+    generate_many is building each UUID.
+
+    Attributes:
+        calls: IDs generated, counting each batch row.
+        batches: Batch calls (generate_many and everything built on it).
+        normalize_ns: Nanoseconds spent normalizing business data.
+        hash_ns: Nanoseconds spent hashing, or looking up the cache.
+        format_ns: Nanoseconds spent building results from digests.
+        latency: Latency of single-ID calls, in nanoseconds.
+        batch_sizes: Rows per batch call.
+    """
+
+    calls: int
+    batches: int
+    normalize_ns: int
+    hash_ns: int
+    format_ns: int
+    latency: Histogram
+    batch_sizes: Histogram
+
+
+@dataclass(frozen=True)
+class GeneratorStats:
+    """Snapshot of a generator's instrumentation.
+
+    Attributes:
+        entities: Counters per entity type, in order of first use.
+        cache: Cache statistics, or None if the generator has no cache. Use
+            ``cache.hit_rate`` for the hit rate.
+
+    Examples:
+        >>> from uuid_forge.core import UUIDGenerator
+        >>> gen = UUIDGenerator(instrument=True)
+        >>> _ = gen.generate("user", "alice")
+        >>> _ = gen.generate_many("order", [(1,), (2,)])
+        >>> stats = gen.stats()
+        >>> stats.calls, list(stats.entities)
+        (3, ['user', 'order'])
+        >>> stats.entities["order"].batch_sizes.count
+        1
+    """
+
+    entities: Mapping[str, EntityStats]
+    cache: "CacheInfo | None"
+
+    @property
+    def calls(self) -> int:
+        """IDs generated across all entity types."""
+        return sum(entity.calls for entity in self.entities.values())
+
+
+class _Shard:
+    """One thread's counters for one entity type. Only its thread writes it."""
+
+    __slots__ = (
+        "batch_rows",
+        "batch_sizes",
+        "batches",
+        "calls",
+        "format_ns",
+        "hash_ns",
+        "latency",
+        "latency_ns",
+        "normalize_ns",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.batches = 0
+        self.normalize_ns = 0
+        self.hash_ns = 0
+        self.format_ns = 0
+        self.latency = [0] * (len(LATENCY_BUCKETS_NS) + 1)
+        self.latency_ns = 0
+        self.batch_sizes = [0] * (len(BATCH_SIZE_BUCKETS) + 1)
+        self.batch_rows = 0
+
+    def add(self, other: "_Shard") -> None:
+        """Add the counters of another shard to this one."""
+        self.calls += other.calls
+        self.batches += other.batches
+        self.normalize_ns += other.normalize_ns
+        self.hash_ns += other.hash_ns
+        self.format_ns += other.format_ns
+        self.latency = [a + b for a, b in zip(self.latency, other.latency, strict=True)]
+        self.latency_ns += other.latency_ns
+        self.batch_sizes = [a + b for a, b in zip(self.batch_sizes, other.batch_sizes, strict=True)]
+        self.batch_rows += other.batch_rows
+
+
+class _ThreadToken:
+    """Lives in a thread's threading.local; collected when the thread exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _EntityRecorder:
+    """Records the counters of one entity type into per-thread shards."""
+
+    __slots__ = ("_local", "_lock", "_retired", "_shards")
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[_Shard] = []
+        # Counters of threads that have exited
+        self._retired = _Shard()
+
+    def _shard(self) -> _Shard:
+        """Return the calling thread's shard, creating it on first use."""
+        try:
+            shard: _Shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            self._local.token = token = _ThreadToken()
+            with self._lock:
+                self._shards.append(shard)
+            weakref.finalize(token, self._retire, shard)
+        return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        """Fold the shard of an exited thread into the retired counters."""
+        with self._lock:
+            self._retired.add(shard)
+            self._shards.remove(shard)
+
+    def record_call(self, start: int, normalized: int, hashed: int, end: int) -> None:
+        """Record a single-ID call from its four ``perf_counter_ns`` timestamps."""
+        shard = self._shard()
+        shard.calls += 1
+        shard.normalize_ns += normalized - start
+        shard.hash_ns += hashed - normalized
+        shard.format_ns += end - hashed
+        elapsed = end - start
+        shard.latency[bisect_left(LATENCY_BUCKETS_NS, elapsed)] += 1
+        shard.latency_ns += elapsed
+
+    def record_batch(self, rows: int, normalize_ns: int, hash_ns: int, format_ns: int) -> None:
+        """Record a finished batch of ``rows`` rows and its phase totals."""
+        shard = self._shard()
+        shard.calls += rows
+        shard.batches += 1
+        shard.normalize_ns += normalize_ns
+        shard.hash_ns += hash_ns
+        shard.format_ns += format_ns
+        shard.batch_sizes[bisect_left(BATCH_SIZE_BUCKETS, rows)] += 1
+        shard.batch_rows += rows
+
+    def snapshot(self) -> EntityStats:
+        """Sum the shards of every thread into an EntityStats."""
+        total = _Shard()
+        # Copied together, so a shard retired meanwhile is not counted twice
+        with self._lock:
+            total.add(self._retired)
+            shards = list(self._shards)
+        for shard in shards:
+            total.add(shard)
+        return EntityStats(
+            calls=total.calls,
+            batches=total.batches,
+            normalize_ns=total.normalize_ns,
+            hash_ns=total.hash_ns,
+            format_ns=total.format_ns,
+            latency=Histogram(LATENCY_BUCKETS_NS, tuple(total.latency), total.latency_ns),
+            batch_sizes=Histogram(BATCH_SIZE_BUCKETS, tuple(total.batch_sizes), total.batch_rows),
+        )
+
+
+class _Recorder:
+    """Holds an _EntityRecorder per entity type."""
+
+    __slots__ = ("_entities",)
+
+    def __init__(self) -> None:
+        self._entities: dict[str, _EntityRecorder] = {}
+
+    def entity(self, entity_type: str) -> _EntityRecorder:
+        """Return the recorder for an entity type, creating it on first use."""
+        recorder = self._entities.get(entity_type)
+        if recorder is None:
+            # setdefault keeps the first recorder if two threads race here
+            recorder = self._entities.setdefault(entity_type, _EntityRecorder())
+        return recorder
+
+    def snapshot(self, cache: "CacheInfo | None" = None) -> GeneratorStats:
+        """Return the counters of every entity type."""
+        entities = {name: recorder.snapshot() for name, recorder in list(self._entities.items())}
+        return GeneratorStats(entities=entities, cache=cache)
+
+
+def enable() -> None:
+    """Instrument the module-level functions of uuid_forge.core.
+
+    Covers generate_uuid_only, generate_uuid_int, generate_uuid_bytes,
+    generate_uuid_with_prefix and generate_iter. Counting starts from zero
+    on every call. UUIDGenerator instances are instrumented separately, with
+    ``instrument=True``.
+
+    Examples:
+        >>> from uuid_forge import metrics
+        >>> from uuid_forge.core import generate_uuid_only
+        >>> metrics.enable()
+        >>> _ = generate_uuid_only("invoice", number=1)
+        >>> metrics.stats().entities["invoice"].calls
+        1
+        >>> metrics.disable()
+        >>> metrics.stats() is None
+        True
+    """
+    # Imported here: uuid_forge.core imports this module
+    from uuid_forge import core
+
+    core._recorder = _Recorder()
+
+
+def disable() -> None:
+    """Stop instrumenting the module-level functions and drop their counters."""
+    from uuid_forge import core
+
+    core._recorder = None
+
+
+def stats() -> GeneratorStats | None:
+    """Return the module-level functions' counters, or None if not enabled."""
+    from uuid_forge import core
+
+    return None if core._recorder is None else core._recorder.snapshot()
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _seconds(nanoseconds: float) -> str:
+    """Format nanoseconds as seconds for a Prometheus sample."""
+    return f"{nanoseconds / 1e9:.9g}"
+
+
+def to_prometheus(
+    stats: GeneratorStats, *, prefix: str = "uuid_forge", labels: Mapping[str, str] | None = None
+) -> str:
+    """Render stats in the Prometheus text exposition format.
+
+    Produces these metric families, each labelled by ``entity_type``:
+
+    - ``<prefix>_ids_total`` (counter): IDs generated.
+    - ``<prefix>_batches_total`` (counter): batch calls.
+    - ``<prefix>_phase_seconds_total`` (counter): time per ``phase``
+      (normalize, hash, format).
+    - ``<prefix>_call_duration_seconds`` (histogram): single-call latency.
+    - ``<prefix>_batch_rows`` (histogram): rows per batch.
+
+    With a cache, ``<prefix>_cache_hits_total``, ``_cache_misses_total``,
+    ``_cache_evictions_total`` (counters), ``_cache_entries`` and
+    ``_cache_bytes`` (gauges) are added.
+
+    Args:
+        stats: Snapshot from UUIDGenerator.stats() or stats().
+        prefix: Prefix of every metric name.
+        labels: Constant labels added to every sample, e.g. to tell several
+            generators apart.
+
+    Returns:
+        The exposition text, ending with a newline.
+
+    Examples:
+        >>> from uuid_forge.core import UUIDGenerator
+        >>> from uuid_forge.metrics import to_prometheus
+        >>> gen = UUIDGenerator(instrument=True)
+        >>> _ = gen.generate("user", "alice")
+        >>> text = to_prometheus(gen.stats(), labels={"service": "auth"})
+        >>> print(text.splitlines()[2])
+        uuid_forge_ids_total{service="auth",entity_type="user"} 1
+    """
+    constant = [f'{name}="{_escape(value)}"' for name, value in (labels or {}).items()]
+    lines: list[str] = []
+
+    def family(name: str, kind: str, help_text: str) -> str:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        return f"{prefix}_{name}"
+
+    def sample(name: str, value: object, **extra: str) -> None:
+        pairs = constant + [f'{key}="{_escape(val)}"' for key, val in extra.items()]
+        lines.append(f"{name}{{{','.join(pairs)}}} {value}" if pairs else f"{name} {value}")
+
+    def histogram(name: str, data: Histogram, entity_type: str, *, seconds: bool) -> None:
+        cumulative = 0
+        for bound, count in zip(data.bounds, data.counts, strict=False):
+            cumulative += count
+            le = _seconds(bound) if seconds else str(bound)
+            sample(f"{name}_bucket", cumulative, entity_type=entity_type, le=le)
+        sample(f"{name}_bucket", data.count, entity_type=entity_type, le="+Inf")
+        total = _seconds(data.total) if seconds else data.total
+        sample(f"{name}_sum", total, entity_type=entity_type)
+        sample(f"{name}_count", data.count, entity_type=entity_type)
+
+    entities = stats.entities.items()
+    name = family("ids_total", "counter", "UUIDs generated.")
+    for entity_type, entity in entities:
+        sample(name, entity.calls, entity_type=entity_type)
+    name = family("batches_total", "counter", "Batch generation calls.")
+    for entity_type, entity in entities:
+        sample(name, entity.batches, entity_type=entity_type)
+    name = family("phase_seconds_total", "counter", "Time spent per generation phase.")
+    for entity_type, entity in entities:
+        for phase, nanoseconds in (
+            ("normalize", entity.normalize_ns),
+            ("hash", entity.hash_ns),
+            ("format", entity.format_ns),
+        ):
+            sample(name, _seconds(nanoseconds), entity_type=entity_type, phase=phase)
+    name = family("call_duration_seconds", "histogram", "Latency of single-ID calls.")
+    for entity_type, entity in entities:
+        histogram(name, entity.latency, entity_type, seconds=True)
+    name = family("batch_rows", "histogram", "Rows per batch call.")
+    for entity_type, entity in entities:
+        histogram(name, entity.batch_sizes, entity_type, seconds=False)
+
+    cache = stats.cache
+    if cache is not None:
+        for metric, help_text, value in (
+            ("cache_hits_total", "Cache lookups answered from the cache.", cache.hits),
+            ("cache_misses_total", "Cache lookups that had to hash.", cache.misses),
+            ("cache_evictions_total", "Cache entries evicted.", cache.evictions),
+        ):
+            sample(family(metric, "counter", help_text), value)
+        sample(family("cache_entries", "gauge", "UUIDs currently cached."), cache.currsize)
+        sample(family("cache_bytes", "gauge", "Memory of the cached entries."), cache.currbytes)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,589 @@
+"""Parallel batch generation for CPU-bound backfills.
+
+UUID generation is pure-Python normalization plus a SHA-1 over short inputs,
+so on a standard (GIL) build a single process is limited to one core. This
+module spreads batch work across a pool of workers while keeping results in
+input order and byte-identical to the single-process APIs:
+
+- ParallelUUIDGenerator uses worker processes and scales on any build. The
+  configuration is shipped to each worker once, when the pool starts.
+- ThreadedUUIDGenerator uses threads sharing one read-only UUIDGenerator. It
+  scales across cores on free-threaded (PEP 703) builds such as 3.13t, with
+  no pickling or process start-up; on GIL builds it gives no speed-up.
+
+Pools are kept alive and reused across calls until the generator is closed.
+
+process_file applies the same idea to files: a large CSV or JSONL input is
+memory-mapped, split into newline-aligned byte ranges and enriched by worker
+processes that each read and write their own shard.
+"""
+
+import csv
+import io
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import uuid as uuid_module
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self, overload
+
+from uuid_forge.core import BatchRowError, IDConfig, UUIDGenerator
+from uuid_forge.records import CHUNK_RECORDS, EnrichSpec, InputFormat, _Enricher
+
+_NULL_UUID_BYTES = bytes(16)
+
+# Chunk payload plus (chunk index, exception) for each failed row
+_ChunkResult = tuple[Any, list[tuple[int, Exception]]]
+
+# Per-process generator, populated by the pool initializer
+_worker_generator: UUIDGenerator | None = None
+
+
+def gil_enabled() -> bool:
+    """Report whether the running interpreter has the GIL enabled.
+
+    Returns:
+        False on a free-threaded build running without the GIL, True otherwise
+        (including every interpreter older than 3.13).
+
+    Examples:
+        >>> from uuid_forge.parallel import gil_enabled
+        >>> isinstance(gil_enabled(), bool)
+        True
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def _init_worker(config: IDConfig) -> None:
+    """Build the per-process generator once when a worker starts."""
+    global _worker_generator
+    _worker_generator = UUIDGenerator(config)
+
+
+def _generate_chunk(entity_type: str, rows: list[Any]) -> _ChunkResult:
+    """Generate one chunk in a worker process.
+
+    Results are returned as a single concatenated bytes object of raw digests
+    (16 bytes per row) because it pickles far more cheaply than a list of UUID
+    objects, and no UUID objects are built in the worker at all. Failed rows
+    are zero-filled and reported by chunk-relative index.
+    """
+    assert _worker_generator is not None, "worker pool was not initialized"
+    errors: list[BatchRowError] = []
+    digests = _worker_generator.for_entity(entity_type)._iter_digests(rows, errors)
+    blob = b"".join(_NULL_UUID_BYTES if digest is None else digest for digest in digests)
+    return blob, [(error.index, error.error) for error in errors]
+
+
+class _PooledUUIDGenerator(ABC):
+    """Shared chunking, ordering and pool lifecycle for the parallel engines."""
+
+    def __init__(self, config: IDConfig | None, workers: int | None, chunk_size: int) -> None:
+        config = config or IDConfig()
+        if not isinstance(config, IDConfig):
+            raise TypeError(f"config must be IDConfig, got {type(config).__name__}")
+        workers = workers if workers is not None else os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+        self.config = config
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _start_executor(self) -> Executor:
+        """Create the worker pool."""
+
+    @abstractmethod
+    def _submit(self, pool: Executor, entity_type: str, chunk: list[Any]) -> Future[_ChunkResult]:
+        """Schedule one chunk on the pool."""
+
+    @abstractmethod
+    def _unpack(self, payload: Any) -> Iterable[uuid_module.UUID | None]:
+        """Turn a chunk payload back into one UUID (or placeholder) per row."""
+
+    def _pool(self) -> Executor:
+        """Return the worker pool, starting it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._start_executor()
+            return self._executor
+
+    def _chunks(self, rows: Iterable[Any]) -> Iterator[list[Any]]:
+        """Split rows into chunks, spreading sized inputs over all workers."""
+        chunk_size = self.chunk_size
+        if isinstance(rows, Sequence):
+            chunk_size = max(1, min(chunk_size, -(-len(rows) // self.workers)))
+        iterator = iter(rows)
+        while chunk := list(islice(iterator, chunk_size)):
+            yield chunk
+
+    @overload
+    def generate_iter(
+        self, entity_type: str, rows: Iterable[Any], *, errors: None = None
+    ) -> Iterator[uuid_module.UUID]: ...
+
+    @overload
+    def generate_iter(
+        self, entity_type: str, rows: Iterable[Any], *, errors: list[BatchRowError]
+    ) -> Iterator[uuid_module.UUID | None]: ...
+
+    def generate_iter(
+        self, entity_type: str, rows: Iterable[Any], *, errors: list[BatchRowError] | None = None
+    ) -> Iterator[uuid_module.UUID | None]:
+        """Lazily generate UUIDs on the worker pool, in input order.
+
+        At most two chunks per worker are in flight at a time, so input is
+        consumed with backpressure and memory stays bounded.
+
+        Args:
+            entity_type: Type of entity being identified.
+            rows: Iterable of mappings or tuples/lists, as for
+                UUIDGenerator.generate_many.
+            errors: If None, a failing row raises BatchRowError. If a list is
+                given, failures are appended to it and None is yielded.
+
+        Yields:
+            UUIDs in input order.
+
+        Raises:
+            BatchRowError: If a row fails and ``errors`` is None.
+        """
+        pool = self._pool()
+        max_pending = self.workers * 2
+        pending: deque[tuple[list[Any], Future[_ChunkResult]]] = deque()
+        offset = 0
+
+        chunks = self._chunks(rows)
+        while True:
+            for chunk in islice(chunks, max_pending - len(pending)):
+                pending.append((chunk, self._submit(pool, entity_type, chunk)))
+            if not pending:
+                return
+
+            chunk, future = pending.popleft()
+            payload, chunk_errors = future.result()
+            failed = dict(chunk_errors)
+            for index, uid in enumerate(self._unpack(payload)):
+                if index in failed:
+                    error = BatchRowError(offset + index, chunk[index], failed[index])
+                    if errors is None:
+                        raise error from error.error
+                    errors.append(error)
+                    yield None
+                else:
+                    yield uid
+            offset += len(chunk)
+
+    @overload
+    def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: None = None
+    ) -> list[uuid_module.UUID]: ...
+
+    @overload
+    def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: list[BatchRowError]
+    ) -> list[uuid_module.UUID | None]: ...
+
+    def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: list[BatchRowError] | None = None
+    ) -> list[uuid_module.UUID] | list[uuid_module.UUID | None]:
+        """Generate UUIDs for a batch of rows on the worker pool.
+
+        Produces the same UUIDs, in the same order, as
+        UUIDGenerator.generate_many with the same configuration.
+
+        Args:
+            entity_type: Type of entity being identified.
+            rows: Iterable of mappings or tuples/lists.
+            errors: Optional list collecting per-row BatchRowError instances.
+                When given, failing rows produce None instead of aborting.
+
+        Returns:
+            UUIDs in input order.
+
+        Raises:
+            BatchRowError: If a row fails and ``errors`` is None.
+        """
+        return list(self.generate_iter(entity_type, rows, errors=errors))
+
+    def close(self) -> None:
+        """Shut down the worker pool. A later call starts a fresh pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Shut down the worker pool on exit."""
+        self.close()
+
+
+class ParallelUUIDGenerator(_PooledUUIDGenerator):
+    """Process-pool batch engine producing the same UUIDs as UUIDGenerator.
+
+    Rows are split into large chunks, hashed in worker processes and returned
+    in input order. The pool is created on first use and reused by later calls,
+    so start-up and config transfer are paid once. Close the generator (or
+    use it as a context manager) to shut the pool down.
+
+    Process pools only pay off for large batches; for a few thousand rows,
+    UUIDGenerator.generate_many in the calling process is faster.
+
+    Attributes:
+        config: The IDConfig shipped to every worker.
+        workers: Number of worker processes.
+        chunk_size: Maximum number of rows sent to a worker per task.
+
+    Example:
+        ```python
+        from uuid_forge import IDConfig
+        from uuid_forge.parallel import ParallelUUIDGenerator
+
+        config = IDConfig(salt="my-secret-salt")
+
+        with ParallelUUIDGenerator(config, workers=32) as generator:
+            for batch in batches:
+                uuids = generator.generate_many("invoice", batch)
+        ```
+    """
+
+    def __init__(
+        self,
+        config: IDConfig | None = None,
+        workers: int | None = None,
+        chunk_size: int = 50_000,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Configure the engine. The worker pool is started lazily.
+
+        Args:
+            config: Configuration for UUID generation. If None, uses default
+                configuration (DNS namespace, no salt).
+            workers: Number of worker processes. Defaults to the CPU count.
+            chunk_size: Maximum number of rows per task. Larger chunks amortize
+                inter-process overhead; smaller ones balance load better.
+            mp_context: Optional multiprocessing context (e.g. "spawn") used
+                to start workers.
+
+        Raises:
+            TypeError: If config is provided but is not an IDConfig instance.
+            ValueError: If workers or chunk_size is less than 1.
+        """
+        super().__init__(config, workers, chunk_size)
+        self._mp_context = mp_context
+
+    def _start_executor(self) -> Executor:
+        """Start worker processes, each building its generator from the config."""
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self.config,),
+        )
+
+    def _submit(self, pool: Executor, entity_type: str, chunk: list[Any]) -> Future[_ChunkResult]:
+        """Send one chunk to a worker process."""
+        return pool.submit(_generate_chunk, entity_type, chunk)
+
+    def _unpack(self, payload: Any) -> Iterable[uuid_module.UUID | None]:
+        """Split a worker's concatenated digests back into version 5 UUIDs."""
+        uuid_cls = uuid_module.UUID
+        return (uuid_cls(bytes=payload[i : i + 16], version=5) for i in range(0, len(payload), 16))
+
+
+class ThreadedUUIDGenerator(_PooledUUIDGenerator):
+    """Thread-pool batch engine for free-threaded (PEP 703) Python builds.
+
+    All threads share one UUIDGenerator, and so the precomputed namespace and
+    salt hash state, read-only: nothing is pickled and no worker processes are
+    started. On a free-threaded build (e.g. ``python3.13t``) chunks are hashed
+    in parallel across cores. On a standard GIL build the threads take turns,
+    so results are correct but no faster than UUIDGenerator.generate_many;
+    use gil_enabled() to pick an engine at runtime.
+
+    Attributes:
+        config: The IDConfig shared by all threads.
+        generator: The shared UUIDGenerator.
+        workers: Number of worker threads.
+        chunk_size: Maximum number of rows handed to a thread per task.
+
+    Example:
+        ```python
+        from uuid_forge import IDConfig
+        from uuid_forge.parallel import (
+            ParallelUUIDGenerator,
+            ThreadedUUIDGenerator,
+            gil_enabled,
+        )
+
+        config = IDConfig(salt="my-secret-salt")
+        engine_cls = ParallelUUIDGenerator if gil_enabled() else ThreadedUUIDGenerator
+
+        with engine_cls(config, workers=8) as generator:
+            uuids = generator.generate_many("invoice", rows)
+        ```
+    """
+
+    def __init__(
+        self,
+        config: IDConfig | None = None,
+        workers: int | None = None,
+        chunk_size: int = 10_000,
+    ) -> None:
+        """Configure the engine. The thread pool is started lazily.
+
+        Args:
+            config: Configuration for UUID generation. If None, uses default
+                configuration (DNS namespace, no salt).
+            workers: Number of worker threads. Defaults to the CPU count.
+            chunk_size: Maximum number of rows per task.
+
+        Raises:
+            TypeError: If config is provided but is not an IDConfig instance.
+            ValueError: If workers or chunk_size is less than 1.
+        """
+        super().__init__(config, workers, chunk_size)
+        self.generator = UUIDGenerator(self.config)
+
+    def _start_executor(self) -> Executor:
+        """Start the worker threads."""
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="uuid-forge")
+
+    def _submit(self, pool: Executor, entity_type: str, chunk: list[Any]) -> Future[_ChunkResult]:
+        """Hand one chunk to a worker thread."""
+        return pool.submit(self._generate_chunk, entity_type, chunk)
+
+    def _generate_chunk(self, entity_type: str, rows: list[Any]) -> _ChunkResult:
+        """Generate one chunk in a worker thread."""
+        errors: list[BatchRowError] = []
+        uuids = self.generator.generate_many(entity_type, rows, errors=errors)
+        return uuids, [(error.index, error.error) for error in errors]
+
+    def _unpack(self, payload: Any) -> Iterable[uuid_module.UUID | None]:
+        """Thread results are already UUIDs."""
+        return payload  # type: ignore[no-any-return]
+
+
+# Target size of the text blocks a shard worker decodes and parses at a time
+_SHARD_BLOCK_BYTES = 1 << 20
+
+# A failed shard: (shard-relative record index, record, underlying exception)
+_ShardFailure = tuple[int, Any, Exception]
+
+
+def _shard_lines(mm: mmap.mmap, start: int, end: int) -> Iterator[str]:
+    """Yield the text lines in ``mm[start:end]``, decoded block by block.
+
+    Blocks end on a newline, so no line or UTF-8 sequence is ever split.
+    Lines are split as a file opened with ``newline=""`` would split them.
+    """
+    position = start
+    while position < end:
+        stop = mm.rfind(b"\n", position, min(position + _SHARD_BLOCK_BYTES, end))
+        if stop == -1:
+            # A single line longer than a block
+            stop = mm.find(b"\n", position + _SHARD_BLOCK_BYTES, end)
+            if stop == -1:
+                stop = end - 1
+        block = mm[position : stop + 1].decode("utf-8")
+        yield from io.StringIO(block, newline="")
+        position = stop + 1
+
+
+def _process_shard(
+    path: str,
+    start: int,
+    end: int,
+    shard_path: str,
+    spec: EnrichSpec,
+    config: IDConfig,
+    header: list[str] | None,
+    chunk_size: int,
+) -> tuple[int, int, _ShardFailure | None]:
+    """Enrich the records in one byte range of a file into a shard file.
+
+    Returns:
+        ``(processed, failed, failure)``. ``failure`` is set when the spec's
+        on_error is FAIL and a record failed, in which case the shard holds
+        the output of all records before it.
+    """
+    enricher = _Enricher(spec, config, header)
+    with (
+        Path(path).open("rb") as source,
+        mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        Path(shard_path).open("w", encoding="utf-8", newline="") as out,
+    ):
+        records = enricher.records(_shard_lines(mm, start, end))
+        try:
+            processed, failed = enricher.run(records, out, chunk_size)
+        except BatchRowError as error:
+            return error.index, 0, (error.index, error.row, error.error)
+    return processed, failed, None
+
+
+def _shard_ranges(mm: mmap.mmap, start: int, size: int, shards: int) -> list[tuple[int, int]]:
+    """Split ``[start, size)`` into up to ``shards`` ranges ending on newlines."""
+    bounds = [start]
+    for i in range(1, shards):
+        target = start + (size - start) * i // shards
+        if target <= bounds[-1]:
+            continue
+        newline = mm.find(b"\n", target - 1)
+        if newline == -1:
+            break
+        if newline + 1 > bounds[-1]:
+            bounds.append(newline + 1)
+    if bounds[-1] < size:
+        bounds.append(size)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:], strict=False) if hi > lo]
+
+
+def process_file(
+    input_path: str | os.PathLike[str],
+    output_path: str | os.PathLike[str],
+    spec: EnrichSpec,
+    *,
+    config: IDConfig | None = None,
+    workers: int | None = None,
+    shards: int | None = None,
+    mp_context: BaseContext | None = None,
+    chunk_size: int = CHUNK_RECORDS,
+) -> tuple[int, int]:
+    """Enrich a large CSV or JSONL file using several worker processes.
+
+    The input is memory-mapped and split into byte ranges aligned to newline
+    boundaries. Each worker process maps the file itself, then parses, hashes
+    and writes its own range to a temporary shard file next to the output, so
+    no single process reads or writes all of the data. The shards are then
+    concatenated in order. The output is byte-identical to
+    uuid_forge.records.enrich_stream on the same input.
+
+    For CSV the header is read once by the parent. Shards split on newlines,
+    so CSV input must not contain quoted fields that span lines.
+
+    Args:
+        input_path: File of CSV (with a header row) or JSONL records.
+        output_path: File to write; replaced if it exists.
+        spec: What to generate for each record and how to write it.
+        config: Configuration for UUID generation. If None, uses default config.
+        workers: Number of worker processes. Defaults to the CPU count.
+        shards: Number of byte ranges to split the input into. Defaults to
+            ``workers``.
+        mp_context: Optional multiprocessing context used to start workers.
+        chunk_size: Records processed and written per chunk within a worker.
+
+    Returns:
+        A ``(processed, failed)`` pair of record counts.
+
+    Raises:
+        TypeError: If config is provided but is not an IDConfig instance.
+        ValueError: If workers or shards is less than 1, a key column is not
+            in the CSV header, or the id column already is.
+        BatchRowError: On the first bad record when ``spec.on_error`` is
+            FAIL. The output then holds everything before that record and the
+            index is 0-based over the whole file.
+
+    Example:
+        ```python
+        from uuid_forge import IDConfig
+        from uuid_forge.parallel import process_file
+        from uuid_forge.records import EnrichSpec, InputFormat, parse_keys
+
+        spec = EnrichSpec("order", parse_keys(["order_id"]), InputFormat.JSONL)
+        processed, failed = process_file(
+            "export.jsonl", "enriched.jsonl", spec,
+            config=IDConfig(salt="my-secret-salt"), workers=16,
+        )
+        ```
+    """
+    config = config or IDConfig()
+    if not isinstance(config, IDConfig):
+        raise TypeError(f"config must be IDConfig, got {type(config).__name__}")
+    workers = workers if workers is not None else os.cpu_count() or 1
+    shards = shards if shards is not None else workers
+    if workers < 1 or shards < 1:
+        raise ValueError(f"workers and shards must be at least 1, got {workers} and {shards}")
+
+    input_path = os.fspath(input_path)
+    output_path = Path(output_path)
+    with Path(input_path).open("rb") as source:
+        size = os.fstat(source.fileno()).st_size
+        if size == 0:
+            ranges: list[tuple[int, int]] = []
+            header_line = b""
+        else:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data_start = 0
+                if spec.input_format is InputFormat.CSV:
+                    newline = mm.find(b"\n")
+                    data_start = size if newline == -1 else newline + 1
+                header_line = mm[:data_start]
+                ranges = _shard_ranges(mm, data_start, size, shards)
+
+    header = None
+    if spec.input_format is InputFormat.CSV:
+        header = next(csv.reader(io.StringIO(header_line.decode("utf-8"), newline="")), [])
+    # Validate keys against the header before starting any worker
+    header_text = _Enricher(spec, config, header).header_text()
+
+    with tempfile.TemporaryDirectory(
+        dir=output_path.parent, prefix=f".{output_path.name}."
+    ) as shard_dir:
+        shard_paths = [str(Path(shard_dir) / f"{i:05d}.part") for i in range(len(ranges))]
+        results: list[tuple[int, int, _ShardFailure | None]] = []
+        if ranges:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(ranges)), mp_context=mp_context
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _process_shard, input_path, lo, hi, shard, spec, config, header, chunk_size
+                    )
+                    for (lo, hi), shard in zip(ranges, shard_paths, strict=True)
+                ]
+                for future in futures:
+                    results.append(future.result())
+                    if results[-1][2] is not None:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+        processed = failed = 0
+        with output_path.open("wb") as out:
+            out.write(header_text.encode("utf-8"))
+            for shard_path, (count, shard_failed, failure) in zip(
+                shard_paths, results, strict=False
+            ):
+                with Path(shard_path).open("rb") as shard:
+                    shutil.copyfileobj(shard, out, _SHARD_BLOCK_BYTES)
+                if failure is not None:
+                    index, row, error = failure
+                    raise BatchRowError(processed + index, row, error) from error
+                processed += count
+                failed += shard_failed
+    return processed, failed
@@ -0,0 +1,550 @@
+"""Streaming enrichment of CSV and JSONL records with deterministic IDs.
+
+This module holds the record handling behind the ``uuid-forge batch``
+command and uuid_forge.parallel.process_file. Each record contributes one
+or more key fields (CSV columns or dotted JSON paths), which become the
+attributes of a deterministic UUID. Each record is written back with the ID
+appended, or just the ID is written.
+
+IDs are identical to the rest of the library. CSV values are strings. JSONL
+values keep their JSON types: a record ``{"region": "EUR", "number": 12345}``
+with keys ``region`` and ``number`` gets
+``generate_uuid_only(entity_type, region="EUR", number=12345)``.
+
+Records are processed in chunks. The IDs for a chunk are formatted straight
+from the hash digests, without creating uuid.UUID objects, and each chunk's
+output is written with a single write call.
+
+enrich_file adds checkpointing for long jobs: after every few chunks it
+records how far it has read and written, so an interrupted job can resume
+where it stopped. Because IDs are deterministic, the resumed output is
+identical to that of an uninterrupted run.
+"""
+
+import csv
+import io
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from itertools import islice
+from os import PathLike
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+from uuid_forge.core import (
+    BatchRowError,
+    EntityUUIDGenerator,
+    IDConfig,
+    _uuid5_int,
+    _uuid_str,
+)
+
+# Records processed (and written) per chunk
+CHUNK_RECORDS = 10_000
+
+# Records between checkpoints written by enrich_file
+CHECKPOINT_RECORDS = 100_000
+
+
+class InputFormat(StrEnum):
+    """Record formats understood by the enrichment helpers."""
+
+    CSV = "csv"
+    JSONL = "jsonl"
+
+    @classmethod
+    def from_path(cls, path: str | PathLike[str]) -> "InputFormat":
+        """Guess the format from a file extension: JSONL for .jsonl/.ndjson, else CSV.
+
+        Examples:
+            >>> from uuid_forge.records import InputFormat
+            >>> InputFormat.from_path("orders.ndjson")
+            <InputFormat.JSONL: 'jsonl'>
+            >>> InputFormat.from_path("invoices.csv")
+            <InputFormat.CSV: 'csv'>
+        """
+        suffix = Path(path).suffix.lower()
+        return cls.JSONL if suffix in (".jsonl", ".ndjson") else cls.CSV
+
+
+class OnError(StrEnum):
+    """How bulk operations handle records that cannot be processed."""
+
+    SKIP = "skip"
+    FAIL = "fail"
+    EMIT_EMPTY = "emit-empty"
+
+
+def parse_keys(keys: Iterable[str]) -> tuple[tuple[str, str], ...]:
+    """Split key specifications into ``(name, column_or_path)`` pairs.
+
+    ``"region"`` uses the column (or JSON path) ``region`` as attribute
+    ``region``; ``"customer_id=customer.id"`` renames it.
+
+    Args:
+        keys: Key specifications as ``NAME`` or ``NAME=COLUMN``.
+
+    Returns:
+        The parsed pairs, in the given order.
+
+    Raises:
+        ValueError: If a name is empty or appears more than once.
+
+    Examples:
+        >>> from uuid_forge.records import parse_keys
+        >>> parse_keys(["region", "customer_id=customer.id"])
+        (('region', 'region'), ('customer_id', 'customer.id'))
+    """
+    pairs: list[tuple[str, str]] = []
+    for key in keys:
+        name, _, source = key.partition("=")
+        name = name.strip()
+        if not name:
+            raise ValueError(f"Invalid key: {key!r}. Use NAME or NAME=COLUMN.")
+        pairs.append((name, source.strip() or name))
+    names = [name for name, _ in pairs]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate key names: {', '.join(names)}")
+    return tuple(pairs)
+
+
+def _json_lookup(record: Any, path: str) -> Any:
+    """Return the value at a dotted path (e.g. ``customer.id``) in a JSON object."""
+    if isinstance(record, dict) and path in record:
+        return record[path]
+    value = record
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            raise KeyError(f"missing key {path!r}")
+        value = value[part]
+    return value
+
+
+@dataclass(frozen=True)
+class EnrichSpec:
+    """What to generate for each record and how to write it.
+
+    Attributes:
+        entity_type: Type of entity being identified.
+        keys: ``(name, column_or_path)`` pairs, e.g. from parse_keys.
+        input_format: CSV (with a header row) or JSONL.
+        id_column: Name of the appended ID column or JSON field.
+        ids_only: Write only the IDs, one per line, instead of the records.
+        prefix: Optional human-readable prefix for each ID.
+        separator: Separator between prefix and UUID.
+        on_error: What to do with records that are malformed or miss a key.
+    """
+
+    entity_type: str
+    keys: tuple[tuple[str, str], ...]
+    input_format: InputFormat = InputFormat.CSV
+    id_column: str = "id"
+    ids_only: bool = False
+    prefix: str | None = None
+    separator: str = "-"
+    on_error: OnError = OnError.FAIL
+
+
+class _Enricher:
+    """Per-stream state for applying an EnrichSpec to chunks of records."""
+
+    def __init__(self, spec: EnrichSpec, config: IDConfig | None, header: list[str] | None) -> None:
+        """Compile the generator and, for CSV, resolve key columns in the header.
+
+        Raises:
+            ValueError: If a key column is not in the CSV header, or the id
+                column already is.
+        """
+        self.spec = spec
+        self.entity = EntityUUIDGenerator(spec.entity_type, config)
+        self.id_prefix = f"{spec.prefix}{spec.separator}" if spec.prefix else ""
+        self.header = header
+        self.positions: list[tuple[str, int]] = []
+        if spec.input_format is InputFormat.CSV:
+            header = header or []
+            for name, column in spec.keys:
+                if column not in header:
+                    raise ValueError(f"Column {column!r} not found in CSV header")
+                self.positions.append((name, header.index(column)))
+            if not spec.ids_only and spec.id_column in header:
+                raise ValueError(
+                    f"Column {spec.id_column!r} already exists; choose another id column"
+                )
+
+    def header_text(self) -> str:
+        """Return the output header (CSV with IDs appended), or ``""`` if none."""
+        if self.spec.input_format is not InputFormat.CSV or self.spec.ids_only:
+            return ""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow([*(self.header or []), self.spec.id_column])
+        return buffer.getvalue()
+
+    def records(self, lines: Iterable[str]) -> Iterator[Any]:
+        """Turn text lines (after any CSV header) into records."""
+        if self.spec.input_format is InputFormat.CSV:
+            return csv.reader(lines)
+        return (line for line in lines if line.strip())
+
+    def _decode(self, record: Any) -> tuple[Any, dict[str, Any]]:
+        """Return the record to render and its UUID attributes, raising if it is bad.
+
+        A JSONL line is parsed once here, and its object is what gets rendered.
+        """
+        if self.spec.input_format is InputFormat.CSV:
+            return record, {name: record[position] for name, position in self.positions}
+        value = json.loads(record)
+        if not isinstance(value, dict):
+            raise TypeError(f"expected a JSON object, got {type(value).__name__}")
+        return value, {name: _json_lookup(value, path) for name, path in self.spec.keys}
+
+    def _render(self, pairs: list[tuple[Any, str | None]]) -> str:
+        """Render ``(record, id)`` pairs (``id`` None on failure) as output text."""
+        if self.spec.ids_only:
+            return "".join([f"{uuid or ''}\n" for _, uuid in pairs])
+        if self.spec.input_format is InputFormat.CSV:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows([[*row, uuid or ""] for row, uuid in pairs])
+            return buffer.getvalue()
+        return "".join([self._render_json(record, uuid) for record, uuid in pairs])
+
+    def _render_json(self, record: dict[str, Any] | str, uuid: str | None) -> str:
+        """Render one JSONL record with its ID; unparseable lines pass through.
+
+        ``record`` is the decoded object, or the line itself if it failed
+        before it was decoded.
+        """
+        value: Any = record
+        if isinstance(record, str):
+            try:
+                value = json.loads(record)
+            except ValueError:
+                value = None
+            if not isinstance(value, dict):
+                return record if record.endswith("\n") else f"{record}\n"
+        value[self.spec.id_column] = uuid
+        return json.dumps(value, ensure_ascii=False) + "\n"
+
+    def run(
+        self,
+        records: Iterator[Any],
+        out: TextIO,
+        chunk_size: int,
+        on_chunk: Callable[[int, int], None] | None = None,
+    ) -> tuple[int, int]:
+        """Generate an ID for each record and write the output in chunks.
+
+        ``on_chunk`` is called with the running ``(processed, failed)`` counts
+        after each chunk has been written.
+
+        Returns:
+            A ``(processed, failed)`` pair of record counts.
+
+        Raises:
+            BatchRowError: On the first bad record when ``on_error`` is FAIL,
+                after writing the output for all preceding records. The index
+                is 0-based over all records of this call.
+        """
+        on_error = self.spec.on_error
+        decode = self._decode
+        processed = failed = 0
+        while chunk := list(islice(records, chunk_size)):
+            failures: dict[int, Exception] = {}
+            good: list[int] = []
+            rows: list[dict[str, Any]] = []
+            # What to render per record: the decoded form where decoding succeeded
+            documents = list(chunk)
+            for index, record in enumerate(chunk):
+                try:
+                    documents[index], attributes = decode(record)
+                    rows.append(attributes)
+                except Exception as exc:
+                    failures[index] = exc
+                else:
+                    good.append(index)
+
+            errors: list[BatchRowError] = []
+            ids: list[str | None] = [None] * len(chunk)
+            digests = self.entity._iter_digests(rows, errors)
+            for index, digest in zip(good, digests, strict=True):
+                if digest is not None:
+                    ids[index] = f"{self.id_prefix}{_uuid_str(_uuid5_int(digest))}"
+            for error in errors:
+                failures[good[error.index]] = error.error
+
+            end = min(failures) if failures and on_error is OnError.FAIL else len(chunk)
+            keep = [i for i in range(end) if ids[i] or on_error is not OnError.SKIP]
+            out.write(self._render([(documents[i], ids[i]) for i in keep]))
+            if end < len(chunk):
+                raise BatchRowError(processed + end, chunk[end], failures[end])
+            processed += len(chunk)
+            failed += len(failures)
+            if on_chunk is not None:
+                on_chunk(processed, failed)
+        return processed, failed
+
+
+def enrich_stream(
+    source: TextIO,
+    sink: TextIO,
+    spec: EnrichSpec,
+    *,
+    config: IDConfig | None = None,
+    chunk_size: int = CHUNK_RECORDS,
+) -> tuple[int, int]:
+    r"""Read records from ``source`` and write them with IDs to ``sink``.
+
+    For CSV, the first row of ``source`` is the header. Open files with
+    ``newline=""`` as recommended for the csv module.
+
+    Args:
+        source: Text stream of CSV or JSONL records.
+        sink: Text stream receiving the output.
+        spec: What to generate and how to write it.
+        config: Configuration for UUID generation. If None, uses default config.
+        chunk_size: Records processed and written per chunk.
+
+    Returns:
+        A ``(processed, failed)`` pair of record counts. Blank JSONL lines
+        are ignored and not counted.
+
+    Raises:
+        ValueError: If a key column is not in the CSV header, or the id
+            column already is.
+        BatchRowError: On the first bad record when ``spec.on_error`` is
+            FAIL, after writing the output for all preceding records.
+
+    Examples:
+        >>> import io
+        >>> from uuid_forge.records import EnrichSpec, InputFormat, enrich_stream, parse_keys
+        >>> spec = EnrichSpec("user", parse_keys(["email"]), InputFormat.JSONL, ids_only=True)
+        >>> out = io.StringIO()
+        >>> enrich_stream(io.StringIO('{"email": "a@example.com"}\n'), out, spec)
+        (1, 0)
+        >>> from uuid_forge.core import generate_uuid_only
+        >>> out.getvalue() == f"{generate_uuid_only('user', email='a@example.com')}\n"
+        True
+    """
+    # readline ends cleanly at EOF on every stream, while iterating some stdin
+    # wrappers (such as Click 8.2's CliRunner input) raises EOFError there
+    lines = iter(source.readline, "")
+    if spec.input_format is InputFormat.CSV:
+        reader = csv.reader(lines)
+        enricher = _Enricher(spec, config, next(reader, []))
+        records: Iterator[Any] = reader
+    else:
+        enricher = _Enricher(spec, config, None)
+        records = enricher.records(lines)
+    sink.write(enricher.header_text())
+    return enricher.run(records, sink, chunk_size)
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Progress of an enrich_file job, as persisted between runs.
+
+    Attributes:
+        input_offset: Bytes of input consumed by the records written so far.
+        output_offset: Bytes of output written for those records.
+        processed: Records processed so far.
+        failed: Records that failed so far.
+        fingerprint: Identifies the configuration and spec of the job; a
+            checkpoint only resumes a job with the same fingerprint.
+        input_id: Identifies the input file by path, size and modification
+            time; a checkpoint only resumes a job on the same, unchanged input.
+    """
+
+    input_offset: int
+    output_offset: int
+    processed: int
+    failed: int
+    fingerprint: str
+    input_id: str
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """Write the checkpoint atomically: a crash leaves the old or the new one."""
+        path = Path(path)
+        temporary = path.with_name(f"{path.name}.tmp")
+        with temporary.open("w", encoding="utf-8") as file:
+            json.dump({"version": 2, **asdict(self)}, file)
+            file.flush()
+            os.fsync(file.fileno())
+        temporary.replace(path)
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> "Checkpoint":
+        """Read a checkpoint written by save.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not a valid checkpoint.
+        """
+        with Path(path).open(encoding="utf-8") as file:
+            data = json.load(file)
+        if not isinstance(data, dict) or data.pop("version", None) != 2:
+            raise ValueError(f"{path} is not a uuid-forge checkpoint")
+        try:
+            return cls(**data)
+        except TypeError as e:
+            raise ValueError(f"{path} is not a uuid-forge checkpoint") from e
+
+
+def _fingerprint(spec: EnrichSpec, config: IDConfig | None) -> str:
+    """Return an ID for a job that changes whenever its output would change.
+
+    The fingerprint is itself a deterministic UUID, so it reveals no more
+    about the salt than any other generated ID.
+    """
+    entity = EntityUUIDGenerator("uuid_forge.records.checkpoint", config)
+    return str(entity(**{key: str(value) for key, value in asdict(spec).items()}))
+
+
+def _input_id(path: str | PathLike[str]) -> str:
+    """Return an ID for an input file that changes when the file is replaced or edited."""
+    path = Path(path)
+    info = path.stat()
+    return f"{path.resolve()}:{info.st_size}:{info.st_mtime_ns}"
+
+
+class _LineReader:
+    """Iterate over the decoded lines of a binary file, counting bytes consumed."""
+
+    def __init__(self, source: BinaryIO) -> None:
+        self.source = source
+        self.offset = source.tell()
+
+    def __iter__(self) -> "_LineReader":
+        return self
+
+    def __next__(self) -> str:
+        line = self.source.readline()
+        if not line:
+            raise StopIteration
+        self.offset += len(line)
+        return line.decode("utf-8")
+
+    def seek(self, offset: int) -> None:
+        """Continue reading at ``offset``."""
+        self.source.seek(offset)
+        self.offset = offset
+
+
+def enrich_file(
+    input_path: str | PathLike[str],
+    output_path: str | PathLike[str],
+    spec: EnrichSpec,
+    *,
+    config: IDConfig | None = None,
+    resume: bool = False,
+    checkpoint_path: str | PathLike[str] | None = None,
+    checkpoint_every: int = CHECKPOINT_RECORDS,
+    chunk_size: int = CHUNK_RECORDS,
+) -> tuple[int, int]:
+    """Enrich a CSV or JSONL file, checkpointing progress so it can resume.
+
+    Works like enrich_stream on files. Every ``checkpoint_every`` records,
+    at the end of a chunk, the output is flushed to disk and a Checkpoint
+    is written atomically to ``checkpoint_path``. With ``resume=True`` an
+    existing checkpoint is loaded, the output is truncated to the recorded
+    offset (dropping anything written after the checkpoint) and processing
+    continues at the recorded input offset, so no record is written twice
+    or skipped. The checkpoint is removed once the job completes, and a job
+    that starts from the beginning removes any checkpoint left by an earlier
+    one.
+
+    Args:
+        input_path: File of CSV (with a header row) or JSONL records.
+        output_path: File to write.
+        spec: What to generate for each record and how to write it.
+        config: Configuration for UUID generation. If None, uses default config.
+        resume: Continue from the checkpoint, if there is one. Without a
+            checkpoint the job starts from the beginning.
+        checkpoint_path: Where to keep the checkpoint. Defaults to the output
+            path with ``.checkpoint`` appended.
+        checkpoint_every: Records between checkpoints.
+        chunk_size: Records processed and written per chunk.
+
+    Returns:
+        A ``(processed, failed)`` pair of record counts for the whole job,
+        including records processed before resuming.
+
+    Raises:
+        ValueError: If checkpoint_every is less than 1, a key column is not in
+            the CSV header, the id column already is, or the checkpoint does
+            not match this job or its files.
+        BatchRowError: On the first bad record when ``spec.on_error`` is
+            FAIL. The index is 0-based over the whole file.
+
+    Example:
+        ```python
+        from uuid_forge.records import EnrichSpec, enrich_file, parse_keys
+
+        spec = EnrichSpec("invoice", parse_keys(["region", "number"]))
+        # Rerun the same call after an interruption to pick up where it stopped
+        enrich_file("invoices.csv", "invoices_with_ids.csv", spec, resume=True)
+        ```
+    """
+    if checkpoint_every < 1:
+        raise ValueError(f"checkpoint_every must be at least 1, got {checkpoint_every}")
+    output_path = Path(output_path)
+    checkpoint_path = Path(checkpoint_path or f"{output_path}.checkpoint")
+    fingerprint = _fingerprint(spec, config)
+    input_id = _input_id(input_path)
+    checkpoint = None
+    if resume and checkpoint_path.exists():
+        checkpoint = Checkpoint.load(checkpoint_path)
+        if checkpoint.fingerprint != fingerprint:
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} was written with a different configuration"
+            )
+        if checkpoint.input_id != input_id:
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} was written for another input, "
+                f"or {input_path} has changed since"
+            )
+    else:
+        # A checkpoint of an earlier job must not be resumed into this output
+        checkpoint_path.unlink(missing_ok=True)
+
+    with Path(input_path).open("rb") as source:
+        lines = _LineReader(source)
+        header = None
+        if spec.input_format is InputFormat.CSV:
+            header = next(csv.reader(lines), [])
+        enricher = _Enricher(spec, config, header)
+        if checkpoint is None:
+            base = (0, 0)
+            sink = output_path.open("w", encoding="utf-8", newline="")
+            sink.write(enricher.header_text())
+        else:
+            if output_path.stat().st_size < checkpoint.output_offset:
+                raise ValueError(f"{output_path} is shorter than when checkpointed")
+            base = (checkpoint.processed, checkpoint.failed)
+            lines.seek(checkpoint.input_offset)
+            os.truncate(output_path, checkpoint.output_offset)
+            sink = output_path.open("a", encoding="utf-8", newline="")
+
+        last = base[0]
+
+        def save(processed: int, failed: int) -> None:
+            nonlocal last
+            processed, failed = processed + base[0], failed + base[1]
+            if processed - last < checkpoint_every:
+                return
+            last = processed
+            sink.flush()
+            os.fsync(sink.fileno())
+            Checkpoint(lines.offset, sink.tell(), processed, failed, fingerprint, input_id).save(
+                checkpoint_path
+            )
+
+        with sink:
+            try:
+                processed, failed = enricher.run(
+                    enricher.records(lines), sink, chunk_size, on_chunk=save
+                )
+            except BatchRowError as e:
+                raise BatchRowError(base[0] + e.index, e.row, e.error) from e.error
+    checkpoint_path.unlink(missing_ok=True)
+    return base[0] + processed, base[1] + failed
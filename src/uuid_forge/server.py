@@ -0,0 +1,443 @@
+"""Local HTTP ID service for callers outside Python.
+
+IDs depend on the exact repr-based normalization of the business data, which
+is hard to reproduce in other languages. This module serves the Python
+implementation over HTTP/1.1 instead, so services written in Go, Java or
+anything else get byte-identical IDs from a local sidecar. It uses only
+asyncio from the standard library.
+
+Endpoints, all exchanging JSON:
+
+- ``GET /health``: ``{"status": "ok", "version": ...}``. Answered without
+  touching the generator, for liveness probes.
+- ``POST /v1/id``: one ID. The body is ``{"entity_type": ..., "args": [...],
+  "kwargs": {...}, "prefix": ..., "separator": ...}``; everything except
+  ``entity_type`` is optional. Answers ``{"id": ...}``, exactly as
+  generate_uuid_with_prefix with the server's config.
+- ``POST /v1/ids``: many IDs. The body is ``{"entity_type": ..., "rows":
+  [...], "prefix": ..., "separator": ...}``, where each row is an object
+  (keyword arguments) or an array (positional arguments), as in
+  UUIDGenerator.generate_many. Answers ``{"ids": [...], "errors": [...]}``
+  with null in place of each failed row and ``{"index": ..., "error": ...}``
+  for it in ``errors``.
+
+Values are passed to the generator as decoded by the json module, so an ID
+equals the Python API called with the same JSON values (``1`` and ``1.0``
+stay distinct). Connections are kept alive and requests may be pipelined;
+responses come back in request order.
+
+Example:
+    ```python
+    from uuid_forge.config import load_config_from_env
+    from uuid_forge.server import serve
+
+    serve(load_config_from_env(), host="127.0.0.1", port=8765, workers=4)
+    ```
+
+    ```bash
+    curl -s localhost:8765/v1/ids -d '{"entity_type": "invoice", "rows": [[1], [2]]}'
+    ```
+"""
+
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import socket
+from collections.abc import Callable
+from typing import Any
+
+from uuid_forge.core import (
+    BatchRowError,
+    IDConfig,
+    UUIDGenerator,
+    _uuid5_int,
+    _uuid_str,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Limits protecting the server from oversized or stalled requests
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 16 * 1024 * 1024
+IDLE_TIMEOUT = 60.0
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Content Too Large",
+    431: "Request Header Fields Too Large",
+    501: "Not Implemented",
+}
+
+
+class _HTTPError(Exception):
+    """An error answered with ``status`` and a JSON ``{"error": message}`` body."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+_JSON_TYPES: dict[type, str] = {str: "string", list: "array", dict: "object"}
+
+
+def _field(body: dict[str, Any], name: str, kind: type, default: Any) -> Any:
+    """Return an optional field of the request body, checking its JSON type."""
+    value = body.get(name, default)
+    if value is not default and not isinstance(value, kind):
+        raise _HTTPError(400, f"{name} must be a JSON {_JSON_TYPES[kind]}")
+    return value
+
+
+class _IDService:
+    """Routes parsed requests to the generator and renders JSON responses."""
+
+    def __init__(self, config: IDConfig) -> None:
+        from uuid_forge import __version__
+
+        self.generator = UUIDGenerator(config)
+        self.health = json.dumps({"status": "ok", "version": __version__}).encode()
+        self.routes: dict[str, tuple[str, Callable[[bytes], bytes]]] = {
+            "/health": ("GET", lambda _: self.health),
+            "/v1/id": ("POST", self.one),
+            "/v1/ids": ("POST", self.many),
+        }
+
+    def handle(self, method: str, path: str, body: bytes) -> bytes:
+        """Return the response body for a request.
+
+        Raises:
+            _HTTPError: For unknown paths, wrong methods and invalid bodies.
+        """
+        route = self.routes.get(path.partition("?")[0])
+        if route is None:
+            raise _HTTPError(404, f"no such endpoint: {path}")
+        allowed, handler = route
+        if method != allowed:
+            raise _HTTPError(405, f"{path} only accepts {allowed}")
+        return handler(body)
+
+    @staticmethod
+    def _parse(body: bytes) -> tuple[dict[str, Any], str, str]:
+        """Decode a request body into the object, entity type and ID prefix."""
+        try:
+            request = json.loads(body)
+        except ValueError as exc:
+            raise _HTTPError(400, f"invalid JSON: {exc}") from exc
+        if not isinstance(request, dict):
+            raise _HTTPError(400, "request body must be a JSON object")
+        entity_type = request.get("entity_type")
+        if not isinstance(entity_type, str):
+            raise _HTTPError(400, "entity_type must be a JSON string")
+        prefix = _field(request, "prefix", str, None)
+        separator = _field(request, "separator", str, "-")
+        return request, entity_type, f"{prefix}{separator}" if prefix else ""
+
+    def one(self, body: bytes) -> bytes:
+        """Handle ``POST /v1/id``."""
+        request, entity_type, id_prefix = self._parse(body)
+        args = _field(request, "args", list, [])
+        kwargs = _field(request, "kwargs", dict, {})
+        try:
+            value = self.generator.generate_int(entity_type, *args, **kwargs)
+        except Exception as exc:
+            raise _HTTPError(400, str(exc)) from exc
+        return json.dumps({"id": f"{id_prefix}{_uuid_str(value)}"}).encode()
+
+    def many(self, body: bytes) -> bytes:
+        """Handle ``POST /v1/ids``."""
+        request, entity_type, id_prefix = self._parse(body)
+        rows = request.get("rows")
+        if not isinstance(rows, list):
+            raise _HTTPError(400, "rows must be a JSON array")
+        errors: list[BatchRowError] = []
+        digests = self.generator.for_entity(entity_type)._iter_digests(rows, errors)
+        ids = [
+            None if digest is None else f"{id_prefix}{_uuid_str(_uuid5_int(digest))}"
+            for digest in digests
+        ]
+        failures = [{"index": error.index, "error": str(error.error)} for error in errors]
+        return json.dumps({"ids": ids, "errors": failures}, separators=(",", ":")).encode()
+
+
+def _response(status: int, body: bytes, *, close: bool) -> bytes:
+    """Render a complete HTTP/1.1 response."""
+    head = (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+    )
+    if close:
+        head += "Connection: close\r\n"
+    return f"{head}\r\n".encode() + body
+
+
+class _HTTPProtocol(asyncio.Protocol):
+    """HTTP/1.1 connection: keep-alive, pipelining and ``Expect: 100-continue``.
+
+    Requests are handled as soon as they are complete, in arrival order, so
+    pipelined requests are answered in order. Reading pauses while the
+    client is not reading its responses.
+    """
+
+    def __init__(self, service: _IDService) -> None:
+        self.service = service
+        self.transport: asyncio.Transport | None = None
+        self.buffer = bytearray()
+        self.continued = False
+        self.idle: asyncio.TimerHandle | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Start the idle timer for a new connection."""
+        assert isinstance(transport, asyncio.Transport)
+        self.transport = transport
+        sock = transport.get_extra_info("socket")
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reset_idle()
+
+    def connection_lost(self, _exc: Exception | None) -> None:
+        """Stop the idle timer."""
+        if self.idle is not None:
+            self.idle.cancel()
+
+    def pause_writing(self) -> None:
+        """Stop reading requests while responses are not being read."""
+        assert self.transport is not None
+        self.transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        """Read requests again once the client caught up."""
+        assert self.transport is not None
+        self.transport.resume_reading()
+
+    def _reset_idle(self) -> None:
+        if self.idle is not None:
+            self.idle.cancel()
+        assert self.transport is not None
+        self.idle = asyncio.get_running_loop().call_later(IDLE_TIMEOUT, self.transport.close)
+
+    def data_received(self, data: bytes) -> None:
+        """Buffer data and answer every complete request in it."""
+        assert self.transport is not None
+        self.buffer += data
+        self._reset_idle()
+        try:
+            while not self.transport.is_closing() and self._next_request():
+                pass
+        except _HTTPError as exc:
+            # Malformed framing: the rest of the stream cannot be trusted
+            self._send(exc.status, json.dumps({"error": str(exc)}).encode(), close=True)
+
+    def _next_request(self) -> bool:
+        """Answer the first request in the buffer, if it is complete.
+
+        Returns:
+            True if a request was answered and the buffer may hold another.
+
+        Raises:
+            _HTTPError: If the request cannot be framed.
+        """
+        buffer = self.buffer
+        end = buffer.find(b"\r\n\r\n")
+        if end < 0:
+            if len(buffer) > MAX_HEADER_BYTES:
+                raise _HTTPError(431, "request headers too large")
+            return False
+        if end > MAX_HEADER_BYTES:
+            raise _HTTPError(431, "request headers too large")
+
+        try:
+            request_line, *header_lines = buffer[:end].decode("latin-1").split("\r\n")
+            method, target, version = request_line.split(" ")
+        except ValueError as exc:
+            raise _HTTPError(400, "malformed request line") from exc
+        if not version.startswith("HTTP/1."):
+            raise _HTTPError(400, f"unsupported protocol: {version}")
+        headers: dict[str, str] = {}
+        for line in header_lines:
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise _HTTPError(400, "malformed header line")
+            headers[name.strip().lower()] = value.strip()
+
+        if "transfer-encoding" in headers:
+            raise _HTTPError(501, "chunked request bodies are not supported")
+        length_header = headers.get("content-length")
+        if length_header is None:
+            if method == "POST":
+                raise _HTTPError(411, "Content-Length is required")
+            length = 0
+        # isdigit() alone also accepts non-ASCII digits such as "²", which int() rejects
+        elif length_header.isascii() and length_header.isdigit():
+            length = int(length_header)
+        else:
+            raise _HTTPError(400, "invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise _HTTPError(413, f"request body over {MAX_BODY_BYTES} bytes")
+
+        start = end + 4
+        if len(buffer) < start + length:
+            if headers.get("expect", "").lower() == "100-continue" and not self.continued:
+                assert self.transport is not None
+                self.transport.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                self.continued = True
+            return False
+        body = bytes(buffer[start : start + length])
+        del buffer[: start + length]
+        self.continued = False
+
+        connection = headers.get("connection", "").lower()
+        close = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+        try:
+            status, response = 200, self.service.handle(method, target, body)
+        except _HTTPError as exc:
+            status, response = exc.status, json.dumps({"error": str(exc)}).encode()
+        self._send(status, response, close=close)
+        return not close
+
+    def _send(self, status: int, body: bytes, *, close: bool) -> None:
+        assert self.transport is not None
+        self.transport.write(_response(status, body, close=close))
+        if close:
+            self.transport.close()
+
+
+async def start_server(
+    config: IDConfig | None = None,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    *,
+    reuse_port: bool = False,
+) -> asyncio.Server:
+    """Start the ID service on the running event loop.
+
+    Args:
+        config: Configuration for UUID generation. If None, uses default
+            configuration (DNS namespace, no salt).
+        host: Interface to listen on.
+        port: TCP port to listen on; 0 picks a free port.
+        reuse_port: Set SO_REUSEPORT, so several processes can share the
+            port (Linux and BSD only).
+
+    Returns:
+        The listening asyncio.Server; its ``sockets`` give the bound address.
+
+    Raises:
+        TypeError: If config is provided but is not an IDConfig instance.
+        OSError: If the address cannot be bound.
+
+    Examples:
+        >>> import asyncio, json, urllib.request
+        >>> from uuid_forge.core import generate_uuid_only
+        >>> from uuid_forge.server import start_server
+        >>> async def main():
+        ...     server = await start_server(port=0)
+        ...     port = server.sockets[0].getsockname()[1]
+        ...     request = urllib.request.Request(
+        ...         f"http://127.0.0.1:{port}/v1/id",
+        ...         data=b'{"entity_type": "invoice", "kwargs": {"number": 1}}',
+        ...     )
+        ...     response = await asyncio.to_thread(urllib.request.urlopen, request)
+        ...     server.close()
+        ...     return json.load(response)["id"]
+        >>> asyncio.run(main()) == str(generate_uuid_only("invoice", number=1))
+        True
+    """
+    if config is None:
+        config = IDConfig()
+    elif not isinstance(config, IDConfig):
+        raise TypeError(f"config must be IDConfig, got {type(config).__name__}")
+    service = _IDService(config)
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(
+        lambda: _HTTPProtocol(service), host, port, reuse_port=reuse_port or None
+    )
+
+
+async def _serve_forever(
+    config: IDConfig, host: str, port: int, reuse_port: bool, ready: Callable[[int], None] | None
+) -> None:
+    """Run one server until cancelled."""
+    server = await start_server(config, host, port, reuse_port=reuse_port)
+    if ready is not None:
+        ready(server.sockets[0].getsockname()[1])
+    async with server:
+        await server.serve_forever()
+
+
+def _run_worker(config: IDConfig, host: str, port: int) -> None:
+    """Entry point of a worker process sharing the port."""
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve_forever(config, host, port, True, None))
+
+
+def serve(
+    config: IDConfig | None = None,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    *,
+    workers: int = 1,
+    ready: Callable[[int], None] | None = None,
+) -> None:
+    """Run the ID service until interrupted.
+
+    Each worker is a single-threaded process with its own event loop; use one
+    worker per core to scale. With several workers the processes share the
+    port through SO_REUSEPORT and the kernel spreads connections across them.
+
+    Args:
+        config: Configuration for UUID generation. If None, uses default
+            configuration (DNS namespace, no salt).
+        host: Interface to listen on.
+        port: TCP port to listen on; 0 picks a free port (one worker only).
+        workers: Number of server processes.
+        ready: Called with the bound port once the server is listening.
+
+    Raises:
+        TypeError: If config is provided but is not an IDConfig instance.
+        ValueError: If workers is less than 1, or port is 0 with several
+            workers.
+        OSError: If the address cannot be bound, or SO_REUSEPORT is not
+            available for several workers.
+    """
+    if config is None:
+        config = IDConfig()
+    elif not isinstance(config, IDConfig):
+        raise TypeError(f"config must be IDConfig, got {type(config).__name__}")
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if workers == 1:
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(_serve_forever(config, host, port, False, ready))
+        return
+    if port == 0:
+        raise ValueError("port 0 cannot be shared by several workers")
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise OSError("several workers need SO_REUSEPORT, which this platform lacks")
+
+    # Bind once here so that address errors surface before workers start
+    with socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET) as probe:
+        probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        probe.bind((host, port))
+    processes = [
+        multiprocessing.Process(target=_run_worker, args=(config, host, port), daemon=True)
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    if ready is not None:
+        ready(port)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
@@ -0,0 +1,342 @@
+"""Shared-memory UUID cache for pre-forked servers.
+
+A UUIDGenerator cache lives in one process, so 32 forked workers keep 32
+copies of the same hot keys, and each worker only hits on the keys it has
+already seen itself. SharedUUIDCache keeps one table in a
+``multiprocessing.shared_memory`` segment that every worker on the host reads
+and fills, so a key generated by any worker is a hit for all of them:
+
+- Create the cache in the server's master process before it forks, or under
+  a fixed name that workers attach to.
+- Pass it to UUIDGenerator as ``cache`` in each worker.
+
+The table is a fixed-size set-associative hash table: each entry maps a
+64-bit fingerprint of the entity type and normalized input to its 16-byte
+UUID, and each fingerprint may live in one bucket of 8 entries. A full
+bucket replaces one of its entries, so the table never grows or rehashes.
+
+Readers and writers take no locks. Each entry carries a checksum over its
+fingerprint and UUID, so an entry that a concurrent writer has half updated
+fails the check and is treated as a miss; the UUID is then computed and
+written again.
+
+Two inputs with the same fingerprint would share an entry. The fingerprint
+is a keyed BLAKE2s hash, and the key is drawn at random when the cache is
+created and kept in the segment, which only processes of the creating user
+can read. Whoever supplies the business data therefore cannot construct two
+inputs with the same fingerprint. By chance, with 64-bit fingerprints
+compared against the 8 of one bucket, a lookup returns another input's UUID
+less than once in 10^18 lookups.
+
+Example:
+    ```python
+    # gunicorn.conf.py, with preload_app = True
+    from uuid_forge.shared_cache import SharedUUIDCache
+
+    cache = SharedUUIDCache(1_000_000)
+
+    # app.py, imported by the master before forking
+    from uuid_forge.config import load_config_from_env
+    from uuid_forge.core import UUIDGenerator
+
+    generator = UUIDGenerator(load_config_from_env(), cache=cache)
+    ```
+"""
+
+import hashlib
+import os
+import secrets
+import struct
+import sys
+import uuid as uuid_module
+from collections.abc import Callable
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Self
+
+from uuid_forge.core import _MAX_COMPILED, CacheInfo, IDConfig, _uuid5_int
+
+# Entries per bucket
+WAYS = 8
+
+# Segment header: magic, layout version, bucket count, the random key of the
+# fingerprint hash and the digest of the bound config (zero until bound). The
+# entries follow at _HEADER_SIZE.
+_MAGIC = b"UFSH"
+_LAYOUT = 2
+_HEADER = struct.Struct("<4sBxxxI16s16s")
+_HEADER_SIZE = 64
+_CONFIG_AT = 28
+_UNBOUND = bytes(16)
+_KEY_SIZE = 16
+
+# An entry is four native 64-bit words: fingerprint (zero when empty), UUID
+# high and low halves, and a checksum over the other three
+_WORDS = 4
+_ENTRY_SIZE = _WORDS * 8
+
+_MASK = (1 << 64) - 1
+
+# uuid.UUID is immutable, so stored values are set with object.__setattr__
+_new_uuid = object.__new__
+_set = object.__setattr__
+
+# Segments created in this process, which stay tracked when attached
+_created: set[str] = set()
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to an existing segment without taking responsibility for it."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    shm = SharedMemory(name)
+    # Before 3.13 attaching registers the segment with this process's
+    # resource tracker, which would unlink it when the process exits
+    if name not in _created:
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+def _buffer(shm: SharedMemory) -> memoryview:
+    """Return the memory of an open segment."""
+    assert shm.buf is not None
+    return shm.buf
+
+
+def _uuid_from_int(value: int) -> uuid_module.UUID:
+    """Build a uuid.UUID from a stored value, skipping the constructor's checks."""
+    result = _new_uuid(uuid_module.UUID)
+    _set(result, "int", value)
+    _set(result, "is_safe", uuid_module.SafeUUID.unknown)
+    return result
+
+
+def _config_digest(config: IDConfig) -> bytes:
+    """Return 16 bytes identifying the UUIDs a config generates."""
+    return hashlib.sha256(config.namespace_uuid.bytes + config.salt.encode()).digest()[:16]
+
+
+class SharedUUIDCache:
+    """UUIDGenerator cache in shared memory, filled and read by many processes.
+
+    The constructor creates a new segment; attach() opens an existing one by
+    name. A cache holds the UUIDs of one IDConfig, fixed by the first
+    generator that uses it. Statistics from info() count the lookups of this
+    process, while ``currsize`` counts the entries of all processes.
+
+    A cache is safe to share between threads and between processes. Its
+    counters are not locked, so threads racing on one cache may miss a
+    count. Close it in every process that opened it, and unlink it once in
+    the process that created it, or use it as a context manager, which does
+    both.
+
+    Attributes:
+        name: Name of the shared memory segment.
+        maxsize: Number of entries, ``maxsize`` rounded up to a multiple of 8.
+
+    Example:
+        ```python
+        from uuid_forge.core import IDConfig, UUIDGenerator
+        from uuid_forge.shared_cache import SharedUUIDCache
+
+        with SharedUUIDCache(100_000, name="ids-cache") as cache:
+            generator = UUIDGenerator(IDConfig(salt="my-secret-salt"), cache=cache)
+            ...  # fork workers that use generator
+
+        # or, in an unrelated process of the same user
+        generator = UUIDGenerator(config, cache=SharedUUIDCache.attach("ids-cache"))
+        ```
+    """
+
+    def __init__(self, maxsize: int, *, name: str | None = None) -> None:
+        """Create a cache in a new shared memory segment.
+
+        Each entry takes 32 bytes of shared memory.
+
+        Args:
+            maxsize: Number of UUIDs to keep, at least 1.
+            name: Name of the segment for attach(). If None (default), a
+                unique name is chosen.
+
+        Raises:
+            ValueError: If maxsize is less than 1.
+            FileExistsError: If a segment with this name already exists.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        buckets = -(-maxsize // WAYS)
+        size = _HEADER_SIZE + buckets * WAYS * _ENTRY_SIZE
+        shm = SharedMemory(name, create=True, size=size)
+        _created.add(shm.name)
+        key = secrets.token_bytes(_KEY_SIZE)
+        _HEADER.pack_into(_buffer(shm), 0, _MAGIC, _LAYOUT, buckets, key, _UNBOUND)
+        self._open(shm, owner=os.getpid())
+
+    @classmethod
+    def attach(cls, name: str) -> Self:
+        """Open a cache created by another process.
+
+        Args:
+            name: Name of the cache's segment.
+
+        Returns:
+            A SharedUUIDCache using the existing segment.
+
+        Raises:
+            FileNotFoundError: If no segment has this name.
+            ValueError: If the segment is not a cache of this layout.
+        """
+        shm = _attach(name)
+        try:
+            if shm.size < _HEADER_SIZE:
+                raise ValueError(f"{name!r} is not a uuid-forge shared cache")
+            magic, layout, *_ = _HEADER.unpack_from(_buffer(shm))
+            if magic != _MAGIC or layout != _LAYOUT:
+                raise ValueError(f"{name!r} is not a uuid-forge shared cache of layout {_LAYOUT}")
+        except BaseException:
+            shm.close()
+            raise
+        cache = cls.__new__(cls)
+        cache._open(shm, owner=None)
+        return cache
+
+    def _open(self, shm: SharedMemory, owner: int | None) -> None:
+        buf = _buffer(shm)
+        _, _, self._buckets, key, _ = _HEADER.unpack_from(buf)
+        self.maxsize = self._buckets * WAYS
+        self._key: bytes = key
+        # Keyed hash states with the entity type already fed, copied per lookup
+        self._hashers: dict[str, hashlib.blake2s] = {}
+        # Views first: a cache dropped without close() frees them before the
+        # segment, which cannot close while they exist
+        self._raw = buf[_HEADER_SIZE : _HEADER_SIZE + self.maxsize * _ENTRY_SIZE]
+        self._table = self._raw.cast("Q")
+        self._buf = buf
+        self._shm = shm
+        self._owner = owner
+        self.name = shm.name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def bind(self, config: IDConfig) -> None:
+        """Reserve the cache for ``config``; called by UUIDGenerator.
+
+        Args:
+            config: Configuration of the generator using this cache.
+
+        Raises:
+            ValueError: If the cache already holds UUIDs of another config.
+        """
+        digest = _config_digest(config)
+        buf = self._buf
+        bound = bytes(buf[_CONFIG_AT : _CONFIG_AT + 16])
+        if bound == _UNBOUND:
+            buf[_CONFIG_AT : _CONFIG_AT + 16] = digest
+        elif bound != digest:
+            raise ValueError(f"shared cache {self.name!r} holds UUIDs of another namespace or salt")
+
+    def uuid_for(
+        self, entity_type: str, normalized: str, digest: Callable[[str], bytes]
+    ) -> uuid_module.UUID:
+        """Return the cached UUID for the input, computing it with ``digest`` on a miss."""
+        hasher = self._hashers.get(entity_type)
+        if hasher is None:
+            if len(self._hashers) >= _MAX_COMPILED:
+                self._hashers.clear()
+            # Length-prefixed, so the entity type and input cannot run together
+            hasher = hashlib.blake2s(
+                f"{len(entity_type)}:{entity_type}".encode(), digest_size=8, key=self._key
+            )
+            self._hashers[entity_type] = hasher
+        hasher = hasher.copy()
+        hasher.update(normalized.encode())
+        fingerprint = int.from_bytes(hasher.digest(), "little") or 1
+        table = self._table
+        first = at = fingerprint % self._buckets * WAYS * _WORDS
+        end = first + WAYS * _WORDS
+        evict = False
+        # No entry is ever removed, so the first empty way ends the search
+        while True:
+            stored = table[at]
+            if stored == fingerprint:
+                high, low = table[at + 1], table[at + 2]
+                # A mismatch means a writer is updating the entry right now
+                if table[at + 3] == fingerprint ^ high ^ low:
+                    self.hits += 1
+                    return _uuid_from_int(high << 64 | low)
+                break
+            if stored == 0:
+                break
+            at += _WORDS
+            if at == end:
+                # Full bucket: evict the way picked by bits the bucket index ignores
+                at = first + (fingerprint >> 32) % WAYS * _WORDS
+                evict = True
+                break
+
+        self.misses += 1
+        if evict:
+            self.evictions += 1
+        value = _uuid5_int(digest(normalized))
+        high, low = value >> 64, value & _MASK
+        # Fingerprint last, so readers of a half-written entry fail the check
+        table[at + 1] = high
+        table[at + 2] = low
+        table[at + 3] = fingerprint ^ high ^ low
+        table[at] = fingerprint
+        return _uuid_from_int(value)
+
+    def info(self) -> CacheInfo:
+        """Return this process's counters and the entries of all processes.
+
+        Returns:
+            A CacheInfo snapshot; ``currsize`` counts the occupied entries,
+            and the byte counts are those of the entry table.
+        """
+        currsize = self.maxsize - self._table[::_WORDS].tolist().count(0)
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.maxsize,
+            currsize,
+            self.maxsize * _ENTRY_SIZE,
+            currsize * _ENTRY_SIZE,
+        )
+
+    def clear(self) -> None:
+        """Drop all entries, for every process, and reset this process's counters."""
+        self._raw[:] = bytes(len(self._raw))
+        self.hits = self.misses = self.evictions = 0
+
+    def close(self) -> None:
+        """Detach this process from the segment; the cache cannot be used afterwards."""
+        self._table.release()
+        self._raw.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Remove the segment's name; processes still attached keep using it."""
+        self._shm.unlink()
+        _created.discard(self.name)
+
+    def __enter__(self) -> Self:
+        """Return the cache."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the cache, and unlink it in the process that created it."""
+        self.close()
+        if self._owner == os.getpid():
+            self.unlink()
+
+    def __repr__(self) -> str:
+        """Return a representation showing the segment name and size."""
+        return f"SharedUUIDCache(name={self.name!r}, maxsize={self.maxsize})"
@@ -0,0 +1,748 @@
+"""Shared-memory sidecar for forked worker processes.
+
+Gunicorn and uWSGI fork many workers per host, and a UUIDGenerator cache in
+each worker holds the same hot keys many times over. In sidecar mode one
+process owns the generator, its cache and its compiled per-entity state, and
+the workers on the host send it requests through shared memory instead of a
+socket:
+
+- SidecarServer creates a ``multiprocessing.shared_memory`` segment and
+  answers requests until stopped.
+- SidecarClient attaches to the segment by name and mirrors the
+  UUIDGenerator calls: generate, generate_int, generate_bytes and
+  generate_many.
+
+The segment is a ring of fixed-size slots. A client claims one slot, writes a
+request into it and flips the slot's state byte; the server walks the ring,
+answers each pending request in place and flips the state back. Python
+cannot sleep on a shared-memory word, so both sides poll, yielding the CPU
+between polls, and back off to short sleeps when idle.
+
+Ownership and liveness rest on advisory file locks, which the kernel drops
+when a process dies. Each client holds the lock of its slot and the server
+holds a lock of its own, so:
+
+- the slot of a crashed worker is free again for the next client;
+- clients waiting on a crashed server raise SidecarUnavailableError instead
+  of hanging;
+- a restarted server retires the old segment, and clients move to the new
+  one on their next call. A request cut off by the restart is sent again,
+  which is safe because IDs are deterministic.
+
+Requests are pickled, as with multiprocessing, so only processes of the same
+user can attach: the segment and lock files are private to the user that
+started the server. POSIX only.
+
+Example:
+    ```python
+    # sidecar process: uuid-forge sidecar, or
+    from uuid_forge.config import load_config_from_env
+    from uuid_forge.sidecar import SidecarServer
+
+    with SidecarServer(load_config_from_env(), cache_size=1_000_000) as server:
+        server.serve_forever()
+
+    # in each worker
+    from uuid_forge.sidecar import SidecarClient
+
+    ids = SidecarClient()
+    invoice_uuid = ids.generate("invoice", region="EUR", number=12345)
+    ```
+"""
+
+import contextlib
+import fcntl
+import os
+import pickle
+import stat
+import struct
+import tempfile
+import threading
+import time
+import uuid as uuid_module
+from collections.abc import Iterable
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self, overload
+
+from uuid_forge.core import BatchRowError, IDConfig, UUIDGenerator, _uuid5_bytes
+from uuid_forge.shared_cache import _attach, _buffer, _created
+
+DEFAULT_NAME = "uuid-forge"
+DEFAULT_SLOTS = 64
+DEFAULT_SLOT_SIZE = 64 * 1024
+IDLE_SLEEP = 0.0005
+
+# Segment header: magic, layout version, segment state, slot count, slot size
+# and server pid. Slot state bytes follow at _STATES, then the slots.
+_MAGIC = b"UFSC"
+_LAYOUT = 1
+_HEADER = struct.Struct("<4sBBxxIII")
+_STATES = 64
+_OPEN, _CLOSED = 1, 2
+
+# Slot header: request sequence number, operation, status, payload length
+_SLOT = struct.Struct("<QBBxxI")
+
+# Slot states, written by the client (_IDLE, _REQUEST) or the server
+_IDLE, _REQUEST, _BUSY, _DONE = 0, 1, 2, 3
+_REQUEST_BYTE = bytes([_REQUEST])
+
+# Operations and response statuses
+_GENERATE, _GENERATE_MANY = 1, 2
+_OK, _FAILED, _TOO_LARGE = 0, 1, 2
+
+# Client waiting: polls before the first sleep, longest sleep, and how often
+# to check that the server is still alive. Polls yield the CPU, so a client
+# and the server sharing one core hand over at once instead of spinning.
+_SPIN = 2_000
+_MAX_WAIT_SLEEP = 0.001
+_LIVENESS_INTERVAL = 0.05
+
+# Server polling: empty scans of the ring before the first sleep
+_IDLE_SCANS = 1_000
+
+# Rows per generate_many request before splitting on size
+_MANY_CHUNK = 4_096
+
+_NULL_UUID = bytes(16)
+
+_fence_lock = threading.Lock()
+
+
+def _fence() -> None:
+    """Order shared-memory stores against the state byte that publishes them.
+
+    Acquiring and releasing a lock is a full memory barrier, which keeps a
+    slot's payload visible before its state flips on weakly ordered CPUs.
+    """
+    _fence_lock.acquire()
+    _fence_lock.release()
+
+
+class SidecarUnavailableError(ConnectionError):
+    """No sidecar server is answering under the requested name.
+
+    Raised when no server is running, when it stopped or crashed, or when
+    all of its slots are taken by other clients.
+    """
+
+
+class _RetiredError(Exception):
+    """The segment was closed by its server, which may have been restarted."""
+
+
+def _lock_dir(name: str) -> Path:
+    """Return the directory holding the server and slot lock files.
+
+    It lives in XDG_RUNTIME_DIR when that is set, since only its user can
+    write there, and in the temporary directory otherwise.
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(base) / f"{name}.locks"
+
+
+def _check_lock_dir(locks: Path) -> None:
+    """Refuse a lock directory that another user made or could write to.
+
+    A shared temporary directory lets anyone create ``<name>.locks`` first,
+    so its owner and mode are checked before any lock in it is trusted.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+        PermissionError: If it is not a directory of this user with mode 0700.
+    """
+    info = os.lstat(locks)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"{locks} is not a directory owned by this user")
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        raise PermissionError(f"{locks} must have mode 0700, not {stat.S_IMODE(info.st_mode):o}")
+
+
+def _try_lock(fd: int, operation: int) -> bool:
+    """Take an advisory lock without blocking; return whether it was taken."""
+    try:
+        fcntl.flock(fd, operation | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _portable(exc: Exception) -> Exception:
+    """Return ``exc`` if it survives pickling, else a RuntimeError describing it."""
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+    return exc
+
+
+def _check_name(name: str) -> None:
+    if not name or "/" in name:
+        raise ValueError(f"name must be non-empty and contain no '/', got {name!r}")
+
+
+class SidecarServer:
+    """Owns a UUIDGenerator and answers clients through shared memory.
+
+    Create one per host (or per config) and run serve_forever() in its own
+    process; ``uuid-forge sidecar`` does both. Creating the server claims the
+    name: a second server under the same name fails while the first runs,
+    and a server started after a crash takes over the stale segment.
+
+    Attributes:
+        name: Name of the segment and lock files clients attach to.
+        generator: The UUIDGenerator shared by all clients.
+        slots: Number of slots, the most clients attached at once.
+        slot_size: Bytes per slot, which bounds the size of one request.
+
+    Example:
+        ```python
+        import signal
+
+        from uuid_forge import IDConfig
+        from uuid_forge.sidecar import SidecarServer
+
+        with SidecarServer(IDConfig(salt="my-secret-salt"), cache_size=100_000) as server:
+            signal.signal(signal.SIGTERM, lambda *_: server.stop())
+            server.serve_forever()
+        ```
+    """
+
+    def __init__(
+        self,
+        config: IDConfig | None = None,
+        name: str = DEFAULT_NAME,
+        *,
+        slots: int = DEFAULT_SLOTS,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        cache_size: int | None = None,
+        idle_sleep: float = IDLE_SLEEP,
+    ) -> None:
+        """Create the segment and claim ``name``.
+
+        Args:
+            config: Configuration for UUID generation. If None, uses default
+                configuration (DNS namespace, no salt).
+            name: Name clients attach to. Must not contain ``/``.
+            slots: Most clients attached at once; a worker uses one.
+            slot_size: Bytes per slot. A single ID needs well under 1 KiB;
+                generate_many requests are split to fit.
+            cache_size: Size of the shared LRU cache; see UUIDGenerator.
+            idle_sleep: Longest sleep, in seconds, between scans of the ring
+                while no requests arrive. Bounds the extra latency of the
+                first request after a quiet period.
+
+        Raises:
+            TypeError: If config is provided but is not an IDConfig instance.
+            ValueError: If an argument is out of range.
+            SidecarUnavailableError: If a server is already running under
+                ``name``.
+            PermissionError: If the lock directory for ``name`` belongs to
+                another user or is not private.
+        """
+        if config is not None and not isinstance(config, IDConfig):
+            raise TypeError(f"config must be IDConfig, got {type(config).__name__}")
+        _check_name(name)
+        if slots < 1:
+            raise ValueError(f"slots must be at least 1, got {slots}")
+        if slot_size < 1024:
+            raise ValueError(f"slot_size must be at least 1024, got {slot_size}")
+        if idle_sleep < 0:
+            raise ValueError(f"idle_sleep must not be negative, got {idle_sleep}")
+        self.name = name
+        self.generator = UUIDGenerator(config, cache_size=cache_size)
+        self.slots = slots
+        self.slot_size = slot_size
+        self.idle_sleep = idle_sleep
+        self._stopping = False
+        self._serving = threading.Lock()
+
+        locks = _lock_dir(name)
+        locks.mkdir(mode=0o700, exist_ok=True)
+        _check_lock_dir(locks)
+        self._lock_fd = os.open(locks / "server", os.O_RDWR | os.O_CREAT, 0o600)
+        if not _try_lock(self._lock_fd, fcntl.LOCK_EX):
+            os.close(self._lock_fd)
+            raise SidecarUnavailableError(f"a sidecar named {name!r} is already running")
+        for index in range(slots):
+            os.close(os.open(locks / f"slot-{index}", os.O_RDWR | os.O_CREAT, 0o600))
+
+        self._retire()
+        states = -(-slots // 64) * 64
+        self._shm: SharedMemory | None = SharedMemory(
+            name, create=True, size=_STATES + states + slots * slot_size
+        )
+        self._buf = _buffer(self._shm)
+        _created.add(name)
+        self._slots_at = _STATES + states
+        _HEADER.pack_into(self._buf, 0, _MAGIC, _LAYOUT, _OPEN, slots, slot_size, os.getpid())
+
+    def _retire(self) -> None:
+        """Close and remove a segment left behind by a crashed server."""
+        try:
+            stale = SharedMemory(self.name)
+        except FileNotFoundError:
+            return
+        if stale.size >= _HEADER.size and bytes(_buffer(stale)[:4]) == _MAGIC:
+            # Attached clients see the segment close and move to the new one
+            _buffer(stale)[5] = _CLOSED
+        stale.close()
+        stale.unlink()
+
+    def serve_forever(self) -> None:
+        """Answer requests until stop() or close() is called.
+
+        Runs on the calling thread. Each pending slot is answered in ring
+        order, so no client can starve another.
+
+        Raises:
+            RuntimeError: If the server is closed or already serving.
+        """
+        if self._shm is None:
+            raise RuntimeError("server is closed")
+        if not self._serving.acquire(blocking=False):
+            raise RuntimeError("server is already serving")
+        try:
+            buf = self._buf
+            end = _STATES + self.slots
+            answer, yield_cpu = self._answer, os.sched_yield
+            scans, delay = 0, 0.0
+            while not self._stopping:
+                states = bytes(buf[_STATES:end])
+                index = states.find(_REQUEST_BYTE)
+                if index < 0:
+                    scans += 1
+                    if scans > _IDLE_SCANS:
+                        delay = min(delay * 2 or 1e-5, self.idle_sleep)
+                        time.sleep(delay)
+                    else:
+                        yield_cpu()
+                    continue
+                scans, delay = 0, 0.0
+                while index >= 0:
+                    answer(buf, index)
+                    index = states.find(_REQUEST_BYTE, index + 1)
+        finally:
+            self._serving.release()
+
+    def _answer(self, buf: memoryview, index: int) -> None:
+        """Answer the request pending in slot ``index``."""
+        buf[_STATES + index] = _BUSY
+        _fence()
+        base = self._slots_at + index * self.slot_size
+        start = base + _SLOT.size
+        capacity = self.slot_size - _SLOT.size
+        seq, op, _, length = _SLOT.unpack_from(buf, base)
+        # A copy, so that tracebacks of failed rows hold no view of the segment
+        request = bytes(buf[start : start + length])
+        try:
+            if op == _GENERATE:
+                entity_type, args, kwargs = pickle.loads(request)
+                status, response = _OK, self.generator.generate_bytes(entity_type, *args, **kwargs)
+            else:
+                status, response = _OK, self._generate_many(request)
+        except Exception as exc:
+            status, response = _FAILED, pickle.dumps(_portable(exc))
+        if len(response) > capacity:
+            status, response = _TOO_LARGE, b""
+        buf[start : start + len(response)] = response
+        _SLOT.pack_into(buf, base, seq, op, status, len(response))
+        _fence()
+        buf[_STATES + index] = _DONE
+
+    def _generate_many(self, request: bytes) -> bytes:
+        """Return 16 bytes per row, then the pickled failures if any row failed."""
+        entity_type, rows = pickle.loads(request)
+        errors: list[BatchRowError] = []
+        if self.generator.cache_info() is None:
+            digests = self.generator.for_entity(entity_type)._iter_digests(rows, errors)
+            ids = b"".join(_NULL_UUID if d is None else _uuid5_bytes(d) for d in digests)
+        else:
+            uuids = self.generator.generate_many(entity_type, rows, errors=errors)
+            ids = b"".join(_NULL_UUID if u is None else u.bytes for u in uuids)
+        if not errors:
+            return ids
+        return ids + pickle.dumps([(error.index, _portable(error.error)) for error in errors])
+
+    def stop(self) -> None:
+        """Ask serve_forever() to return after the request in progress.
+
+        Safe to call from a signal handler or another thread.
+        """
+        self._stopping = True
+
+    def close(self) -> None:
+        """Stop serving, close the segment and release the name.
+
+        Clients waiting on a request, and clients calling later, raise
+        SidecarUnavailableError unless another server takes over the name.
+        Calling close() more than once is harmless.
+        """
+        self._stopping = True
+        if self._shm is None:
+            return
+        with self._serving:
+            self._buf[5] = _CLOSED
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+            _created.discard(self.name)
+            locks = _lock_dir(self.name)
+            for path in [locks / "server", *(locks / f"slot-{i}" for i in range(self.slots))]:
+                path.unlink(missing_ok=True)
+            with contextlib.suppress(OSError):
+                locks.rmdir()
+            os.close(self._lock_fd)
+
+    def __enter__(self) -> Self:
+        """Return self; the server is closed on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the server."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"SidecarServer(name={self.name!r}, slots={self.slots}, slot_size={self.slot_size})"
+
+
+class _Channel:
+    """A client's claimed slot in one server's segment."""
+
+    def __init__(self, name: str, timeout: float | None) -> None:
+        locks = _lock_dir(name)
+        self.pid = os.getpid()
+        self.shm: SharedMemory | None = None
+        self.slot_fd = -1
+        try:
+            _check_lock_dir(locks)
+            self.server_fd = os.open(locks / "server", os.O_RDWR)
+        except FileNotFoundError:
+            raise SidecarUnavailableError(f"no sidecar named {name!r} is running") from None
+        try:
+            self.check_server()
+            try:
+                self.shm = _attach(name)
+            except FileNotFoundError:
+                raise SidecarUnavailableError(f"no sidecar named {name!r} is running") from None
+            self.buf = buf = _buffer(self.shm)
+            magic, layout, state, slots, slot_size, _ = _HEADER.unpack_from(buf)
+            if magic != _MAGIC or layout != _LAYOUT:
+                raise SidecarUnavailableError(f"{name!r} is not a uuid-forge sidecar segment")
+            if state != _OPEN:
+                raise SidecarUnavailableError(f"sidecar {name!r} is shutting down")
+            for index in range(slots):
+                fd = os.open(locks / f"slot-{index}", os.O_RDWR | os.O_CREAT, 0o600)
+                if _try_lock(fd, fcntl.LOCK_EX):
+                    self.slot_fd = fd
+                    break
+                os.close(fd)
+            else:
+                raise SidecarUnavailableError(f"all {slots} slots of sidecar {name!r} are in use")
+
+            self.index = index
+            self.state_at = _STATES + index
+            self.base = _STATES + -(-slots // 64) * 64 + index * slot_size
+            self.capacity = slot_size - _SLOT.size
+            self.seq = _SLOT.unpack_from(buf, self.base)[0]
+            # A crashed previous owner may have left a request behind
+            if buf[self.state_at] in (_REQUEST, _BUSY):
+                self.wait(timeout)
+            buf[self.state_at] = _IDLE
+        except BaseException:
+            self.close()
+            raise
+
+    def check_server(self) -> None:
+        """Raise if the server died or closed this segment."""
+        if _try_lock(self.server_fd, fcntl.LOCK_SH):
+            fcntl.flock(self.server_fd, fcntl.LOCK_UN)
+            raise SidecarUnavailableError("the sidecar server is not running")
+        if self.shm is not None and self.buf[5] != _OPEN:
+            raise _RetiredError
+
+    def wait(self, timeout: float | None) -> None:
+        """Wait for the server to answer the request in this slot.
+
+        Raises:
+            SidecarUnavailableError: If the server died.
+            _RetiredError: If the server closed the segment.
+            TimeoutError: If ``timeout`` seconds passed without an answer.
+        """
+        buf, state_at = self.buf, self.state_at
+        yield_cpu = os.sched_yield
+        for _ in range(_SPIN):
+            if buf[state_at] == _DONE:
+                return
+            yield_cpu()
+        now = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        check_at = now + _LIVENESS_INTERVAL
+        delay = 1e-6
+        while buf[state_at] != _DONE:
+            time.sleep(delay)
+            delay = min(delay * 2, _MAX_WAIT_SLEEP)
+            now = time.monotonic()
+            if now >= check_at:
+                self.check_server()
+                check_at = now + _LIVENESS_INTERVAL
+            if deadline is not None and now >= deadline:
+                raise TimeoutError(f"no answer from the sidecar within {timeout} seconds")
+
+    def call(self, op: int, request: bytes, timeout: float | None) -> tuple[int, bytes]:
+        """Send one request and return the response status and payload."""
+        buf = self.buf
+        if buf[5] != _OPEN:
+            raise _RetiredError
+        start = self.base + _SLOT.size
+        self.seq += 1
+        buf[start : start + len(request)] = request
+        _SLOT.pack_into(buf, self.base, self.seq, op, 0, len(request))
+        _fence()
+        buf[self.state_at] = _REQUEST
+        self.wait(timeout)
+        _fence()
+        seq, _, status, length = _SLOT.unpack_from(buf, self.base)
+        response = bytes(buf[start : start + length])
+        buf[self.state_at] = _IDLE
+        if seq != self.seq:
+            raise SidecarUnavailableError("the sidecar answered out of order")
+        return status, response
+
+    def close(self) -> None:
+        """Release the slot and detach from the segment."""
+        if self.shm is not None:
+            self.shm.close()
+            self.shm = None
+        if self.slot_fd >= 0:
+            os.close(self.slot_fd)
+            self.slot_fd = -1
+        if self.server_fd >= 0:
+            os.close(self.server_fd)
+            self.server_fd = -1
+
+
+class SidecarClient:
+    """Generates UUIDs by asking a SidecarServer on the same host.
+
+    Returns exactly what UUIDGenerator returns with the server's config. The
+    client attaches lazily, claims one slot, and re-attaches on its own after
+    a fork (the child gets its own slot) and after a server restart.
+
+    A client is thread-safe, but calls from several threads take turns on its
+    slot; give each thread its own client to send requests in parallel.
+
+    Attributes:
+        name: Name of the server to attach to.
+        timeout: Seconds to wait for an answer, or None to wait as long as
+            the server is alive.
+
+    Example:
+        ```python
+        from uuid_forge.sidecar import SidecarClient
+
+        ids = SidecarClient()  # e.g. at import time, before gunicorn forks
+
+        def handle(order):
+            return ids.generate("order", order_number=order.number)
+        ```
+    """
+
+    def __init__(self, name: str = DEFAULT_NAME, *, timeout: float | None = None) -> None:
+        """Create a client for the server called ``name``.
+
+        Args:
+            name: Name the server was created with.
+            timeout: Seconds to wait for each answer. None (default) waits as
+                long as the server process is alive.
+
+        Raises:
+            ValueError: If name is invalid or timeout is not positive.
+        """
+        _check_name(name)
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+        self.name = name
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._channel: _Channel | None = None
+
+    def _drop(self) -> None:
+        """Forget the current channel and close this process's handles to it.
+
+        Closing an inherited channel releases nothing in the parent, whose
+        descriptors keep holding the slot lock.
+        """
+        channel, self._channel = self._channel, None
+        if channel is not None:
+            channel.close()
+
+    def _call(self, op: int, request: bytes) -> tuple[int, bytes]:
+        """Send a request, attaching first and retrying once after a restart."""
+        with self._lock:
+            for attempt in range(2):
+                channel = self._channel
+                if channel is not None and channel.pid != os.getpid():
+                    # Inherited across fork: the lock stays with the parent
+                    self._drop()
+                    channel = None
+                if channel is None:
+                    channel = self._channel = _Channel(self.name, self.timeout)
+                if len(request) > channel.capacity:
+                    raise ValueError(
+                        f"request of {len(request)} bytes exceeds the sidecar's "
+                        f"{channel.capacity}-byte slots"
+                    )
+                try:
+                    return channel.call(op, request, self.timeout)
+                except _RetiredError:
+                    self._drop()
+                    if attempt:
+                        raise SidecarUnavailableError(
+                            f"sidecar {self.name!r} closed while answering"
+                        ) from None
+                except BaseException:
+                    # The slot may still hold our request; let the next owner wait it out
+                    self._drop()
+                    raise
+        raise AssertionError("unreachable")
+
+    def _request(self, entity_type: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bytes:
+        """Return the 16 UUID bytes for one generate call."""
+        request = pickle.dumps((entity_type, args, kwargs), pickle.HIGHEST_PROTOCOL)
+        status, response = self._call(_GENERATE, request)
+        if status == _FAILED:
+            raise pickle.loads(response)
+        return response
+
+    def generate(self, entity_type: str, *args: Any, **kwargs: Any) -> uuid_module.UUID:
+        """Generate a UUID with the server's configuration.
+
+        Args:
+            entity_type: Type of entity being identified.
+            *args: Positional business data, as for UUIDGenerator.generate.
+            **kwargs: Keyword business data, as for UUIDGenerator.generate.
+
+        Returns:
+            The UUID UUIDGenerator.generate returns with the server's config.
+
+        Raises:
+            SidecarUnavailableError: If no server is answering.
+            TimeoutError: If ``timeout`` is set and passed.
+            ValueError: If the pickled arguments do not fit in a slot.
+            Exception: Whatever UUIDGenerator.generate raised on the server.
+        """
+        return uuid_module.UUID(bytes=self._request(entity_type, args, kwargs))
+
+    def generate_int(self, entity_type: str, *args: Any, **kwargs: Any) -> int:
+        """Generate a UUID as a 128-bit integer; see generate()."""
+        return int.from_bytes(self._request(entity_type, args, kwargs))
+
+    def generate_bytes(self, entity_type: str, *args: Any, **kwargs: Any) -> bytes:
+        """Generate a UUID as 16 big-endian bytes; see generate()."""
+        return self._request(entity_type, args, kwargs)
+
+    @overload
+    def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: None = None
+    ) -> list[uuid_module.UUID]: ...
+
+    @overload
+    def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: list[BatchRowError]
+    ) -> list[uuid_module.UUID | None]: ...
+
+    def generate_many(
+        self, entity_type: str, rows: Iterable[Any], *, errors: list[BatchRowError] | None = None
+    ) -> list[uuid_module.UUID] | list[uuid_module.UUID | None]:
+        """Generate UUIDs for a batch of rows with the server's configuration.
+
+        Rows follow the rules of UUIDGenerator.generate_many. Batches are sent
+        in requests of up to 4096 rows, split further when a request or its
+        answer does not fit in a slot.
+
+        Args:
+            entity_type: Type of entity being identified.
+            rows: Iterable of mappings or tuples/lists. Consumed up front.
+            errors: If None, the first failing row raises BatchRowError. If a
+                list is given, failures are appended to it and the
+                corresponding result slot is None.
+
+        Returns:
+            UUIDs in input order.
+
+        Raises:
+            BatchRowError: If a row fails and ``errors`` is None.
+            SidecarUnavailableError: If no server is answering.
+            TimeoutError: If ``timeout`` is set and passed.
+            ValueError: If a single row does not fit in a slot.
+        """
+        rows = list(rows)
+        uuid_cls = uuid_module.UUID
+        results: list[uuid_module.UUID | None] = []
+        size = _MANY_CHUNK
+        while len(results) < len(rows):
+            offset = len(results)
+            chunk = rows[offset : offset + size]
+            request = pickle.dumps((entity_type, chunk), pickle.HIGHEST_PROTOCOL)
+            try:
+                status, response = self._call(_GENERATE_MANY, request)
+            except ValueError:
+                if len(chunk) == 1:
+                    raise
+                status = _TOO_LARGE
+            if status == _TOO_LARGE:
+                if len(chunk) == 1:
+                    raise ValueError(f"the answer for row {offset} does not fit in a slot")
+                size = len(chunk) // 2
+                continue
+            if status == _FAILED:
+                raise pickle.loads(response)
+
+            count = len(chunk)
+            failures: list[tuple[int, Exception]] = (
+                pickle.loads(response[count * 16 :]) if len(response) > count * 16 else []
+            )
+            failed = {index for index, _ in failures}
+            results += [
+                None if index in failed else uuid_cls(bytes=response[index * 16 : index * 16 + 16])
+                for index in range(count)
+            ]
+            for index, exc in failures:
+                error = BatchRowError(offset + index, rows[offset + index], exc)
+                if errors is None:
+                    raise error from exc
+                errors.append(error)
+        return results
+
+    def close(self) -> None:
+        """Release the slot. The client attaches again if used afterwards."""
+        with self._lock:
+            if self._channel is not None and self._channel.pid == os.getpid():
+                self._channel.close()
+            self._channel = None
+
+    def __enter__(self) -> Self:
+        """Return self; the slot is released on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release the slot."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"SidecarClient(name={self.name!r}, timeout={self.timeout!r})"
@@ -1,5 +1,9 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
+import threading
+from collections.abc import Iterator
+
 import pytest
 
 from uuid_forge.core import IDConfig
@@ -15,3 +19,28 @@ def test_config() -> IDConfig:
 def prod_config() -> IDConfig:
     """Fixture providing production-like configuration."""
     return IDConfig(salt="production-secret-salt-do-not-use-in-real-prod")
+
+
+@pytest.fixture
+def id_server(test_config: IDConfig) -> Iterator[int]:
+    """Fixture running the HTTP ID service in a thread, yielding its port."""
+    from uuid_forge.server import start_server
+
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    stop = loop.create_future()
+    port: list[int] = []
+
+    async def main() -> None:
+        async with await start_server(test_config, port=0) as server:
+            port.append(server.sockets[0].getsockname()[1])
+            started.set()
+            await stop
+
+    thread = threading.Thread(target=loop.run_until_complete, args=(main(),), daemon=True)
+    thread.start()
+    assert started.wait(10)
+    yield port[0]
+    loop.call_soon_threadsafe(stop.set_result, None)
+    thread.join(10)
+    loop.close()
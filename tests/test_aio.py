@@ -0,0 +1,366 @@
+"""Tests for uuid_forge.aio module."""
+
+import asyncio
+import gc
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from uuid_forge import aio
+from uuid_forge.aio import AsyncUUIDGenerator, agenerate, agenerate_many, generate_stream
+from uuid_forge.core import (
+    BatchRowError,
+    IDConfig,
+    UUIDGenerator,
+    generate_iter,
+    generate_uuid_only,
+)
+
+
+class TestAsyncGenerate:
+    """Tests for AsyncUUIDGenerator.generate."""
+
+    def test_matches_sync(self, test_config: IDConfig) -> None:
+        """Test coalesced results equal the synchronous API, in call order."""
+
+        async def main() -> list:
+            async with AsyncUUIDGenerator(test_config, inline_limit=4) as ids:
+                return await asyncio.gather(
+                    *(ids.generate("invoice", region="EUR", number=i) for i in range(100))
+                )
+
+        expected = [
+            generate_uuid_only("invoice", config=test_config, region="EUR", number=i)
+            for i in range(100)
+        ]
+        assert asyncio.run(main()) == expected
+
+    def test_coalesces_into_batches(self, test_config: IDConfig) -> None:
+        """Test concurrent calls are flushed in batches of max_batch_size."""
+        sizes = []
+        generate_calls = aio._generate_calls
+
+        def record(config: IDConfig, calls: list) -> list:
+            sizes.append(len(calls))
+            return generate_calls(config, calls)
+
+        async def main() -> None:
+            ids = AsyncUUIDGenerator(test_config, max_batch_size=10, max_wait_us=50_000)
+            await asyncio.gather(*(ids.generate("user", i) for i in range(25)))
+
+        with patch.object(aio, "_generate_calls", record):
+            asyncio.run(main())
+        assert sizes == [10, 10, 5]
+
+    def test_small_batches_run_inline(self, test_config: IDConfig) -> None:
+        """Test batches within inline_limit never reach the executor."""
+        executor = ThreadPoolExecutor(1)
+
+        async def main(inline_limit: int) -> None:
+            ids = AsyncUUIDGenerator(test_config, inline_limit=inline_limit, executor=executor)
+            await asyncio.gather(*(ids.generate("user", i) for i in range(3)))
+            await ids.generate_many("user", [(1,), (2,)])
+
+        with patch.object(executor, "submit", wraps=executor.submit) as submit:
+            asyncio.run(main(inline_limit=3))
+            assert submit.call_count == 0
+            asyncio.run(main(inline_limit=0))
+            assert submit.call_count == 2
+        executor.shutdown()
+
+    def test_errors_are_per_call(self, test_config: IDConfig) -> None:
+        """Test a failing call does not affect the rest of its batch."""
+
+        class Unrepresentable:
+            def __repr__(self) -> str:
+                raise TypeError("no repr")
+
+        async def main() -> list:
+            ids = AsyncUUIDGenerator(test_config, inline_limit=0)
+            return await asyncio.gather(
+                ids.generate("user", 1),
+                ids.generate("user", Unrepresentable()),
+                ids.generate("user", 3),
+                return_exceptions=True,
+            )
+
+        first, error, third = asyncio.run(main())
+        assert first == generate_uuid_only("user", 1, config=test_config)
+        assert isinstance(error, TypeError)
+        assert third == generate_uuid_only("user", 3, config=test_config)
+
+    def test_cancelled_caller_is_skipped(self, test_config: IDConfig) -> None:
+        """Test cancelling one waiting call leaves the others intact."""
+
+        async def main() -> tuple:
+            ids = AsyncUUIDGenerator(test_config, max_wait_us=10_000)
+            cancelled = asyncio.ensure_future(ids.generate("user", 1))
+            kept = asyncio.ensure_future(ids.generate("user", 2))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            await ids.aclose()
+            kept_uuid = await kept
+            return cancelled.cancelled(), kept_uuid
+
+        was_cancelled, kept = asyncio.run(main())
+        assert was_cancelled
+        assert kept == generate_uuid_only("user", 2, config=test_config)
+
+    def test_process_executor(self, test_config: IDConfig) -> None:
+        """Test batches can run in worker processes."""
+
+        async def main(pool: ProcessPoolExecutor) -> tuple:
+            ids = AsyncUUIDGenerator(test_config, inline_limit=0, executor=pool)
+            one = await ids.generate("user", "a")
+            many = await ids.generate_many("user", [("b",), ("c",)])
+            return one, many
+
+        with ProcessPoolExecutor(1) as pool:
+            one, many = asyncio.run(main(pool))
+        generator = UUIDGenerator(test_config)
+        assert one == generator.generate("user", "a")
+        assert many == generator.generate_many("user", [("b",), ("c",)])
+
+    def test_bound_to_one_loop(self, test_config: IDConfig) -> None:
+        """Test using an instance from a second event loop raises RuntimeError."""
+        ids = AsyncUUIDGenerator(test_config, max_wait_us=0)
+        asyncio.run(ids.generate("user", 1))
+        with pytest.raises(RuntimeError, match="different event loop"):
+            asyncio.run(ids.generate("user", 1))
+
+    def test_validates_arguments(self) -> None:
+        """Test invalid config and limits are rejected up front."""
+        with pytest.raises(TypeError, match="config must be IDConfig"):
+            AsyncUUIDGenerator("salt")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="max_batch_size"):
+            AsyncUUIDGenerator(max_batch_size=0)
+        with pytest.raises(ValueError, match="must not be negative"):
+            AsyncUUIDGenerator(max_wait_us=-1)
+
+
+class TestAsyncGenerateMany:
+    """Tests for AsyncUUIDGenerator.generate_many."""
+
+    def test_matches_sync_across_chunks(self, test_config: IDConfig) -> None:
+        """Test chunked results equal generate_many, in input order."""
+        rows = [{"number": i} for i in range(1000)]
+
+        async def main() -> list:
+            ids = AsyncUUIDGenerator(test_config, max_batch_size=64)
+            return await ids.generate_many("invoice", iter(rows))
+
+        assert asyncio.run(main()) == UUIDGenerator(test_config).generate_many("invoice", rows)
+
+    def test_does_not_block_the_loop(self, test_config: IDConfig) -> None:
+        """Test other coroutines run while a large batch is generated."""
+        ticks = []
+
+        async def ticker() -> None:
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def main() -> None:
+            task = asyncio.create_task(ticker())
+            ids = AsyncUUIDGenerator(test_config, max_batch_size=100)
+            await ids.generate_many("invoice", [(i,) for i in range(5000)])
+            task.cancel()
+
+        asyncio.run(main())
+        assert len(ticks) > 1
+
+    def test_row_errors(self, test_config: IDConfig) -> None:
+        """Test failing rows keep their global index in both error modes."""
+        rows: list = [(i,) for i in range(50)]
+        rows[7] = rows[33] = 42
+
+        async def main(errors: list | None) -> list:
+            ids = AsyncUUIDGenerator(test_config, max_batch_size=10)
+            if errors is None:
+                return await ids.generate_many("invoice", rows)
+            return await ids.generate_many("invoice", rows, errors=errors)
+
+        errors: list[BatchRowError] = []
+        uuids = asyncio.run(main(errors))
+        assert [error.index for error in errors] == [7, 33]
+        assert errors[0].row == 42
+        assert uuids[7] is None and uuids[8] is not None
+        with pytest.raises(BatchRowError) as exc_info:
+            asyncio.run(main(None))
+        assert exc_info.value.index == 7
+        assert isinstance(exc_info.value.__cause__, TypeError)
+
+
+class TestModuleFunctions:
+    """Tests for agenerate and agenerate_many."""
+
+    def test_share_a_generator_per_loop_and_config(self, test_config: IDConfig) -> None:
+        """Test calls on one loop with one config reuse the same instance."""
+
+        async def main() -> tuple:
+            first = await agenerate("user", 1, config=test_config)
+            many = await agenerate_many("user", [(1,)], config=test_config)
+            errors: list[BatchRowError] = []
+            failed = await agenerate_many("user", [42], config=test_config, errors=errors)
+            instances = aio._defaults[asyncio.get_running_loop()]
+            return first, many, failed, errors, instances
+
+        first, many, failed, errors, instances = asyncio.run(main())
+        assert [first] == many
+        assert failed == [None] and errors[0].index == 0
+        assert list(instances) == [test_config]
+
+    def test_shared_generators_do_not_outlive_their_loop(self, test_config: IDConfig) -> None:
+        """Test each loop's shared instances are dropped once the loop is gone."""
+        for number in range(5):
+            asyncio.run(agenerate("user", number, config=test_config))
+        gc.collect()
+        assert len(aio._defaults) == 0
+
+    def test_rejects_invalid_config(self) -> None:
+        """Test a non-IDConfig config raises TypeError."""
+        with pytest.raises(TypeError, match="config must be IDConfig"):
+            asyncio.run(agenerate("user", config="salt"))  # type: ignore[arg-type]
+
+
+async def _source(rows: list, read: list | None = None) -> AsyncIterator:
+    """Async iterable over rows, recording each row as it is read."""
+    for row in rows:
+        if read is not None:
+            read.append(row)
+        yield row
+
+
+async def _collect(stream: AsyncIterator) -> list:
+    return [pair async for pair in stream]
+
+
+class TestGenerateStream:
+    """Tests for generate_stream."""
+
+    def test_matches_generate_iter(self, test_config: IDConfig) -> None:
+        """Test ordered pairs equal generate_iter with rows, across chunks."""
+        rows = [{"number": i} for i in range(1000)]
+        stream = generate_stream(
+            "invoice", _source(rows), config=test_config, chunk_size=64, max_in_flight=3
+        )
+        expected = list(generate_iter("invoice", rows, config=test_config, with_rows=True))
+        assert asyncio.run(_collect(stream)) == expected
+
+    def test_unordered_yields_chunks_as_they_finish(self, test_config: IDConfig) -> None:
+        """Test a slow first chunk does not hold back later chunks."""
+        generate_rows = aio._generate_rows
+
+        def slow_first(config: IDConfig, entity_type: str, rows: list) -> tuple:
+            if rows[0] == (0,):
+                time.sleep(0.2)
+            return generate_rows(config, entity_type, rows)
+
+        rows = [(i,) for i in range(30)]
+        with patch.object(aio, "_generate_rows", slow_first):
+            stream = generate_stream(
+                "item", _source(rows), config=test_config, chunk_size=10, ordered=False
+            )
+            pairs = asyncio.run(_collect(stream))
+        assert sorted(pairs) == sorted(
+            generate_iter("item", rows, config=test_config, with_rows=True)
+        )
+        assert [row for row, _ in pairs[-10:]] == rows[:10]
+
+    def test_backpressure_bounds_reading(self, test_config: IDConfig) -> None:
+        """Test a paused consumer stops the source from being read."""
+        read: list = []
+
+        async def main() -> None:
+            stream = generate_stream(
+                "item",
+                _source([(i,) for i in range(10_000)], read),
+                config=test_config,
+                chunk_size=10,
+                max_in_flight=2,
+            )
+            await anext(stream)
+            await asyncio.sleep(0.2)
+            await stream.aclose()  # type: ignore[attr-defined]
+
+        asyncio.run(main())
+        assert len(read) <= (2 + 3) * 10
+
+    def test_quiet_source_flushes_after_max_wait(self, test_config: IDConfig) -> None:
+        """Test a partial chunk is generated when the source goes quiet."""
+
+        async def main() -> tuple:
+            resume = asyncio.Event()
+
+            async def source() -> AsyncIterator:
+                yield (1,)
+                await resume.wait()
+                yield (2,)
+
+            stream = generate_stream(
+                "item", source(), config=test_config, chunk_size=100, max_wait_us=1_000
+            )
+            first = await asyncio.wait_for(anext(stream), timeout=5)
+            resume.set()
+            return first, [pair async for pair in stream]
+
+        first, rest = asyncio.run(main())
+        assert first == ((1,), generate_uuid_only("item", 1, config=test_config))
+        assert [row for row, _ in rest] == [(2,)]
+
+    def test_source_error_after_earlier_rows(self, test_config: IDConfig) -> None:
+        """Test rows read before a source failure are yielded, then it is raised."""
+        seen: list = []
+
+        async def source() -> AsyncIterator:
+            yield (1,)
+            yield (2,)
+            raise ConnectionError("broker went away")
+
+        async def main() -> None:
+            async for row, _ in generate_stream("item", source(), config=test_config):
+                seen.append(row)
+
+        with pytest.raises(ConnectionError, match="broker"):
+            asyncio.run(main())
+        assert seen == [(1,), (2,)]
+
+    def test_row_errors(self, test_config: IDConfig) -> None:
+        """Test failing rows keep their position in the whole stream."""
+        rows: list = [(i,) for i in range(25)]
+        rows[17] = 42
+
+        errors: list[BatchRowError] = []
+        stream = generate_stream(
+            "item", _source(rows), config=test_config, chunk_size=10, errors=errors
+        )
+        pairs = asyncio.run(_collect(stream))
+        assert len(pairs) == 25
+        assert pairs[17] == (42, None)
+        assert [(error.index, error.row) for error in errors] == [(17, 42)]
+
+        seen: list = []
+
+        async def main() -> None:
+            stream = generate_stream("item", _source(rows), config=test_config, chunk_size=10)
+            async for row, _ in stream:
+                seen.append(row)
+
+        with pytest.raises(BatchRowError) as exc_info:
+            asyncio.run(main())
+        assert exc_info.value.index == 17
+        assert seen == rows[:17]
+
+    def test_validates_arguments(self) -> None:
+        """Test invalid arguments are rejected before the source is read."""
+        with pytest.raises(TypeError, match="config must be IDConfig"):
+            generate_stream("item", _source([]), config="salt")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="at least 1"):
+            generate_stream("item", _source([]), chunk_size=0)
+        with pytest.raises(ValueError, match="at least 1"):
+            generate_stream("item", _source([]), max_in_flight=0)
+        with pytest.raises(ValueError, match="must not be negative"):
+            generate_stream("item", _source([]), max_wait_us=-1)
@@ -0,0 +1,84 @@
+"""Tests for uuid_forge.arrays module."""
+
+import pytest
+
+from uuid_forge.core import BatchRowError, IDConfig, UUIDGenerator
+
+np = pytest.importorskip("numpy")
+
+from uuid_forge.arrays import (  # noqa: E402
+    from_uuids,
+    generate_array,
+    to_hex,
+    to_int_pairs,
+    to_uuids,
+)
+
+
+@pytest.fixture
+def rows() -> list:
+    """Fixture providing a mixed batch of rows."""
+    return [{"region": "EUR", "number": i} for i in range(20)] + [("EUR", 1), ()]
+
+
+class TestGenerateArray:
+    """Tests for generate_array."""
+
+    def test_matches_generate_many(self, test_config: IDConfig, rows: list) -> None:
+        """Test that array rows equal the bytes of the batch API results."""
+        expected = UUIDGenerator(test_config).generate_many("invoice", rows)
+        result = generate_array("invoice", rows, config=test_config)
+        assert result.shape == (len(rows), 16)
+        assert result.dtype == np.uint8
+        assert result.flags["C_CONTIGUOUS"]
+        assert result.tobytes() == b"".join(uid.bytes for uid in expected)
+
+    def test_empty_input(self) -> None:
+        """Test that empty input produces an empty (0, 16) array."""
+        assert generate_array("item", []).shape == (0, 16)
+
+    def test_failed_rows_are_nil(self) -> None:
+        """Test that collected failures leave nil UUID rows."""
+        errors: list[BatchRowError] = []
+        result = generate_array("item", [(1,), "bad", (3,)], errors=errors)
+        assert [error.index for error in errors] == [1]
+        assert not result[1].any()
+        assert result[0].any() and result[2].any()
+
+    def test_raises_on_bad_row(self) -> None:
+        """Test that a bad row raises by default."""
+        with pytest.raises(BatchRowError):
+            generate_array("item", [(1,), "bad"])
+
+
+class TestConversions:
+    """Tests for array conversion helpers."""
+
+    def test_to_hex(self, test_config: IDConfig, rows: list) -> None:
+        """Test hex conversion matches str() and .hex of UUIDs."""
+        expected = UUIDGenerator(test_config).generate_many("invoice", rows)
+        result = generate_array("invoice", rows, config=test_config)
+        assert to_hex(result).tolist() == [str(uid) for uid in expected]
+        assert to_hex(result, dashes=False).tolist() == [uid.hex for uid in expected]
+
+    def test_to_int_pairs(self, test_config: IDConfig, rows: list) -> None:
+        """Test that (hi, lo) pairs recombine to UUID.int."""
+        expected = UUIDGenerator(test_config).generate_many("invoice", rows)
+        pairs = to_int_pairs(generate_array("invoice", rows, config=test_config))
+        assert pairs.shape == (len(rows), 2)
+        assert pairs.dtype == np.uint64
+        assert [(int(hi) << 64) | int(lo) for hi, lo in pairs] == [uid.int for uid in expected]
+
+    def test_uuid_round_trip(self, test_config: IDConfig, rows: list) -> None:
+        """Test conversion to and from UUID objects."""
+        expected = UUIDGenerator(test_config).generate_many("invoice", rows)
+        array = from_uuids(expected)
+        assert list(to_uuids(array)) == expected
+        assert np.array_equal(array, generate_array("invoice", rows, config=test_config))
+
+    def test_rejects_wrong_shape(self) -> None:
+        """Test that non-(N, 16) uint8 input is rejected."""
+        with pytest.raises(ValueError, match=r"\(N, 16\) uint8"):
+            to_hex(np.zeros((3, 8), dtype=np.uint8))
+        with pytest.raises(ValueError, match=r"\(N, 16\) uint8"):
+            to_int_pairs(np.zeros((3, 16), dtype=np.int64))
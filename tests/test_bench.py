@@ -0,0 +1,88 @@
+"""Tests for uuid_forge.bench module."""
+
+import json
+
+import pytest
+
+from uuid_forge.bench import (
+    ENGINES,
+    EXTRACTION_BENCHMARKS,
+    GENERATION_BENCHMARKS,
+    PAYLOADS,
+    default_workers,
+    report,
+    run_benchmarks,
+)
+from uuid_forge.core import IDConfig
+
+
+class TestRunBenchmarks:
+    """Tests for run_benchmarks."""
+
+    def test_covers_every_benchmark(self, test_config: IDConfig) -> None:
+        """Test each API is measured per payload, plus extraction and scaling."""
+        seen = []
+        results = run_benchmarks(
+            config=test_config, count=20, repeat=1, workers=[1, 2], progress=seen.append
+        )
+        assert seen == results
+        keys = {(r.benchmark, r.payload, r.workers) for r in results}
+        assert len(keys) == len(results)
+        for benchmark in GENERATION_BENCHMARKS:
+            assert {(benchmark, p, None) for p in PAYLOADS} <= keys
+        for benchmark in EXTRACTION_BENCHMARKS:
+            assert (benchmark, None, None) in keys
+        for engine in ENGINES:
+            assert {(engine, "few-short", 1), (engine, "few-short", 2)} <= keys
+        for result in results:
+            assert result.count == 20
+            assert result.ids_per_second == pytest.approx(20 / result.seconds)
+            assert result.ns_per_id == pytest.approx(result.seconds * 1e9 / 20)
+
+    def test_selection(self) -> None:
+        """Test payload, benchmark and worker selection."""
+        results = run_benchmarks(
+            count=10,
+            repeat=2,
+            payloads=["many-long"],
+            benchmarks=["UUIDGenerator.generate", "ThreadedUUIDGenerator"],
+            workers=[3],
+        )
+        assert [(r.benchmark, r.payload, r.workers) for r in results] == [
+            ("UUIDGenerator.generate", "many-long", None),
+            ("ThreadedUUIDGenerator", "many-long", 3),
+        ]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error"),
+        [
+            ({"count": 0}, ValueError),
+            ({"repeat": 0}, ValueError),
+            ({"payloads": ["huge"]}, ValueError),
+            ({"benchmarks": ["nope"]}, ValueError),
+            ({"workers": [0]}, ValueError),
+            ({"config": "invalid"}, TypeError),
+        ],
+    )
+    def test_validation(self, kwargs, error) -> None:
+        """Test invalid arguments are rejected before measuring."""
+        with pytest.raises(error):
+            run_benchmarks(**kwargs)
+
+
+def test_default_workers() -> None:
+    """Test worker counts are increasing powers of two ending at the CPU count."""
+    import os
+
+    counts = default_workers()
+    assert counts[0] == 1
+    assert counts[-1] == (os.cpu_count() or 1)
+    assert counts == sorted(set(counts))
+
+
+def test_report_is_json_serializable() -> None:
+    """Test report output round-trips through JSON with machine information."""
+    results = run_benchmarks(count=5, repeat=1, payloads=["few-short"], workers=[])
+    data = json.loads(json.dumps(report(results)))
+    assert data["machine"]["cpu_count"] >= 1
+    assert data["results"][0]["benchmark"] == "generate_uuid_only"
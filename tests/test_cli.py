@@ -1,9 +1,11 @@
 """Tests for uuid_forge.cli module."""
 
+import json
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from uuid_forge.cli import app
@@ -75,6 +77,272 @@ class TestExtractCommand:
         assert result.exit_code == 1
 
 
+class TestExtractBulk:
+    """Tests for bulk extraction from files and stdin."""
+
+    UUIDS = [
+        "550e8400-e29b-41d4-a716-446655440000",
+        "6ba7b810-9dad-11d1-80b4-00c04fd430c8",
+    ]
+
+    def test_stdin_plain_output(self):
+        """Test IDs on stdin produce one plain UUID per line."""
+        stdin = f"INV-EUR-{self.UUIDS[0]}\nORD-{self.UUIDS[1]}\r\n"
+        result = runner.invoke(app, ["extract"], input=stdin)
+        assert result.exit_code == 0
+        assert result.stdout == f"{self.UUIDS[0]}\n{self.UUIDS[1]}\n"
+
+    def test_input_and_output_files(self, tmp_path):
+        """Test reading from --input and writing to --output."""
+        source = tmp_path / "ids.txt"
+        target = tmp_path / "uuids.txt"
+        source.write_text("".join(f"INV_{uuid}\n" for uuid in self.UUIDS * 3))
+        result = runner.invoke(
+            app, ["extract", "--input", str(source), "--output", str(target), "-s", "_"]
+        )
+        assert result.exit_code == 0
+        assert target.read_text().splitlines() == self.UUIDS * 3
+
+    def test_dash_means_stdin(self):
+        """Test --input - reads from stdin."""
+        result = runner.invoke(app, ["extract", "--input", "-"], input=f"X-{self.UUIDS[0]}\n")
+        assert result.exit_code == 0
+        assert result.stdout == f"{self.UUIDS[0]}\n"
+
+    def test_on_error_fail(self):
+        """Test the default policy stops at the first bad line."""
+        stdin = f"A-{self.UUIDS[0]}\nbogus\nB-{self.UUIDS[1]}\n"
+        result = runner.invoke(app, ["extract"], input=stdin)
+        assert result.exit_code == 1
+        assert result.stdout == f"{self.UUIDS[0]}\n"
+        assert "line 2" in result.stderr
+
+    def test_on_error_skip(self):
+        """Test skip drops bad lines and reports a count."""
+        stdin = f"A-{self.UUIDS[0]}\nbogus\n\nB-{self.UUIDS[1]}\n"
+        result = runner.invoke(app, ["extract", "--on-error", "skip"], input=stdin)
+        assert result.exit_code == 0
+        assert result.stdout == f"{self.UUIDS[0]}\n{self.UUIDS[1]}\n"
+        assert "Skipped 2 line(s)" in result.stderr
+
+    def test_on_error_emit_empty(self):
+        """Test emit-empty keeps output aligned with input lines."""
+        stdin = f"A-{self.UUIDS[0]}\nbogus\nB-{self.UUIDS[1]}\n"
+        result = runner.invoke(app, ["extract", "--on-error", "emit-empty"], input=stdin)
+        assert result.exit_code == 0
+        assert result.stdout == f"{self.UUIDS[0]}\n\n{self.UUIDS[1]}\n"
+
+    def test_fail_reports_line_across_chunks(self, monkeypatch):
+        """Test line numbers are global when input spans several chunks."""
+        monkeypatch.setattr("uuid_forge.cli._BULK_CHUNK_LINES", 2)
+        stdin = "".join(f"A-{self.UUIDS[0]}\n" for _ in range(4)) + "bogus\n"
+        result = runner.invoke(app, ["extract"], input=stdin)
+        assert result.exit_code == 1
+        assert result.stdout.count("\n") == 4
+        assert "line 5" in result.stderr
+
+    def test_missing_input_file(self, tmp_path):
+        """Test a missing input file is an error."""
+        result = runner.invoke(app, ["extract", "--input", str(tmp_path / "missing.txt")])
+        assert result.exit_code == 1
+
+    def test_argument_and_input_conflict(self, tmp_path):
+        """Test PREFIXED_ID and --input cannot be combined."""
+        source = tmp_path / "ids.txt"
+        source.write_text(f"{self.UUIDS[0]}\n")
+        result = runner.invoke(app, ["extract", self.UUIDS[0], "--input", str(source)])
+        assert result.exit_code == 1
+
+
+class TestBatchCommand:
+    """Tests for the batch command."""
+
+    CONFIG = ["--no-env", "--salt", "batch-test-salt"]
+
+    def _expected(self, entity_type, **kwargs):
+        from uuid_forge.core import IDConfig, generate_uuid_only
+
+        config = IDConfig(salt="batch-test-salt")
+        return str(generate_uuid_only(entity_type, config=config, **kwargs))
+
+    def test_csv_appends_id_column(self):
+        """Test CSV rows are written back with an id column."""
+        stdin = "region,number,amount\nEUR,12345,1.5\nUSD,7,2\n"
+        result = runner.invoke(
+            app, ["batch", "invoice", "-k", "region", "-k", "number", *self.CONFIG], input=stdin
+        )
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0] == "region,number,amount,id"
+        first = self._expected("invoice", region="EUR", number="12345")
+        assert lines[1] == f"EUR,12345,1.5,{first}"
+        assert lines[2].endswith(self._expected("invoice", region="USD", number="7"))
+
+    def test_csv_matches_generate_command(self):
+        """Test batch IDs equal those of the generate command."""
+        result = runner.invoke(
+            app,
+            ["batch", "invoice", "-k", "region", "--ids-only", *self.CONFIG],
+            input="region\nEUR\n",
+        )
+        generated = runner.invoke(
+            app, ["generate", "invoice", "--attr", "region=EUR", *self.CONFIG]
+        )
+        assert result.stdout.strip() in generated.output
+
+    def test_csv_renamed_key_and_prefix(self, tmp_path):
+        """Test NAME=COLUMN keys, prefixes, custom id column and file I/O."""
+        source = tmp_path / "in.csv"
+        target = tmp_path / "out.csv"
+        source.write_text("Invoice No,other\n42,x\n")
+        result = runner.invoke(
+            app,
+            [
+                "batch", "invoice", "-k", "number=Invoice No", "-i", str(source),
+                "-o", str(target), "--prefix", "INV", "--id-column", "invoice_id", *self.CONFIG,
+            ],
+        )  # fmt: skip
+        assert result.exit_code == 0
+        lines = target.read_text().splitlines()
+        assert lines[0] == "Invoice No,other,invoice_id"
+        assert lines[1] == f"42,x,INV-{self._expected('invoice', number='42')}"
+
+    def test_jsonl_paths_keep_types(self, tmp_path):
+        """Test JSONL input with nested paths keeps JSON value types."""
+        source = tmp_path / "orders.jsonl"
+        source.write_text('{"customer": {"id": 5}, "total": 9.5}\n\n{"customer": {"id": 6}}\n')
+        result = runner.invoke(
+            app,
+            ["batch", "order", "-k", "customer_id=customer.id", "-i", str(source), *self.CONFIG],
+        )
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert records[0] == {
+            "customer": {"id": 5},
+            "total": 9.5,
+            "id": self._expected("order", customer_id=5),
+        }
+        assert records[1]["id"] == self._expected("order", customer_id=6)
+
+    def test_jsonl_format_option_on_stdin(self):
+        """Test --format jsonl for stdin input."""
+        result = runner.invoke(
+            app,
+            ["batch", "user", "-k", "email", "--format", "jsonl", "--ids-only", *self.CONFIG],
+            input='{"email": "a@example.com"}\n',
+        )
+        assert result.exit_code == 0
+        assert result.stdout == f"{self._expected('user', email='a@example.com')}\n"
+
+    def test_on_error_fail(self):
+        """Test the first bad record stops the batch after earlier output."""
+        stdin = "a,b\n1,2\n3\n4,5\n"
+        result = runner.invoke(
+            app, ["batch", "x", "-k", "b", "--ids-only", *self.CONFIG], input=stdin
+        )
+        assert result.exit_code == 1
+        assert result.stdout == f"{self._expected('x', b='2')}\n"
+        assert "record 2" in result.stderr
+
+    def test_on_error_skip_and_emit_empty(self):
+        """Test skip drops bad records and emit-empty writes empty IDs."""
+        stdin = '{"k": 1}\nnot json\n{"other": 1}\n{"k": 2}\n'
+        base = ["batch", "x", "-k", "k", "--format", "jsonl", *self.CONFIG]
+        skipped = runner.invoke(app, [*base, "--on-error", "skip", "--ids-only"], input=stdin)
+        assert skipped.exit_code == 0
+        assert skipped.stdout.splitlines() == [self._expected("x", k=1), self._expected("x", k=2)]
+        assert "Skipped 2 record(s)" in skipped.stderr
+
+        emitted = runner.invoke(app, [*base, "--on-error", "emit-empty"], input=stdin)
+        assert emitted.exit_code == 0
+        lines = emitted.stdout.splitlines()
+        assert lines[1] == "not json"
+        assert json.loads(lines[2]) == {"other": 1, "id": None}
+
+    def test_missing_column(self):
+        """Test an unknown key column is reported before processing."""
+        result = runner.invoke(app, ["batch", "x", "-k", "nope", *self.CONFIG], input="a\n1\n")
+        assert result.exit_code == 1
+        assert "not found in CSV header" in result.stderr
+
+    def test_existing_id_column(self):
+        """Test the id column may not clash with an input column."""
+        result = runner.invoke(app, ["batch", "x", "-k", "a", *self.CONFIG], input="a,id\n1,2\n")
+        assert result.exit_code == 1
+
+    def test_invalid_keys(self):
+        """Test empty or duplicate key names are rejected."""
+        for keys in (["-k", "=a"], ["-k", "a", "-k", "a=b"]):
+            result = runner.invoke(app, ["batch", "x", *keys, *self.CONFIG], input="a,b\n1,2\n")
+            assert result.exit_code == 1
+
+    def test_chunked_output(self, monkeypatch):
+        """Test output is correct and ordered across several chunks."""
+        monkeypatch.setattr("uuid_forge.cli._BULK_CHUNK_LINES", 3)
+        stdin = "n\n" + "".join(f"{i}\n" for i in range(10))
+        result = runner.invoke(
+            app, ["batch", "x", "-k", "n", "--ids-only", *self.CONFIG], input=stdin
+        )
+        assert result.stdout.splitlines() == [self._expected("x", n=str(i)) for i in range(10)]
+
+    def test_workers_matches_single_process(self, tmp_path):
+        """Test --workers output equals single-process output."""
+        source = tmp_path / "in.csv"
+        source.write_text("n\n" + "".join(f"{i}\n" for i in range(100)))
+        outputs = []
+        for workers in ("1", "2"):
+            target = tmp_path / f"out{workers}.csv"
+            base = ["batch", "x", "-k", "n", "-i", str(source), "-o", str(target)]
+            result = runner.invoke(app, [*base, "--workers", workers, *self.CONFIG])
+            assert result.exit_code == 0
+            outputs.append(target.read_text())
+        assert outputs[0] == outputs[1]
+
+    def test_workers_needs_files(self):
+        """Test --workers is rejected for stdin input."""
+        result = runner.invoke(app, ["batch", "x", "-k", "n", "-w", "2", *self.CONFIG], input="n\n")
+        assert result.exit_code == 1
+        assert "--workers" in result.stderr
+
+    def test_resume(self, tmp_path):
+        """Test --resume completes a run from its checkpoint."""
+        from uuid_forge.core import IDConfig
+        from uuid_forge.records import (
+            Checkpoint,
+            EnrichSpec,
+            _fingerprint,
+            _input_id,
+            parse_keys,
+        )
+
+        source = tmp_path / "in.csv"
+        source.write_text("n\n0\n1\n2\n")
+        done = f"n,id\n0,{self._expected('x', n='0')}\n"
+        target = tmp_path / "out.csv"
+        target.write_text(f"{done}1,partial")
+        fingerprint = _fingerprint(
+            EnrichSpec("x", parse_keys(["n"])), IDConfig(salt="batch-test-salt")
+        )
+        Checkpoint(4, len(done), 1, 0, fingerprint, _input_id(source)).save(
+            tmp_path / "out.csv.checkpoint"
+        )
+        base = ["batch", "x", "-k", "n", "-i", str(source), "-o", str(target), *self.CONFIG]
+        result = runner.invoke(app, [*base, "--resume"])
+        assert result.exit_code == 0
+        assert target.read_text().splitlines()[1:] == [
+            f"{i},{self._expected('x', n=str(i))}" for i in range(3)
+        ]
+        assert not (tmp_path / "out.csv.checkpoint").exists()
+
+    def test_resume_needs_files(self):
+        """Test --resume is rejected for stdin input."""
+        result = runner.invoke(
+            app, ["batch", "x", "-k", "n", "--resume", *self.CONFIG], input="n\n"
+        )
+        assert result.exit_code == 1
+        assert "--resume" in result.stderr
+
+
 class TestNewSaltCommand:
     """Tests for the new-salt command."""
 
@@ -316,3 +584,264 @@ class TestMainApp:
         """Test invalid command."""
         result = runner.invoke(app, ["invalid-command"])
         assert result.exit_code != 0
+
+    def test_python_m_entry_point(self):
+        """Test python -m uuid_forge runs the CLI."""
+        import subprocess
+        import sys
+
+        uuid = "550e8400-e29b-41d4-a716-446655440000"
+        result = subprocess.run(
+            [sys.executable, "-m", "uuid_forge", "--plain", "extract", f"INV-{uuid}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout == f"{uuid}\n"
+
+    def test_missing_dependencies_hint(self, monkeypatch):
+        """Test the entry point explains how to install missing CLI dependencies."""
+        import sys
+
+        from uuid_forge.__main__ import main
+
+        monkeypatch.setitem(sys.modules, "typer", None)
+        monkeypatch.delitem(sys.modules, "uuid_forge.cli")
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert 'pip install "uuid-forge[cli]"' in str(exc_info.value.code)
+
+
+class TestBenchCommand:
+    """Tests for the bench command."""
+
+    ARGS = ["bench", "-c", "20", "-r", "1", "--payload", "few-short"]
+
+    def test_json(self, tmp_path):
+        """Test --json prints a report and --output writes the same report."""
+        target = tmp_path / "bench.json"
+        result = runner.invoke(app, [*self.ARGS, "-w", "1", "--json", "-o", str(target)])
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert json.loads(target.read_text())["results"] == data["results"]
+        assert {"cpu_count", "python", "gil_enabled"} <= data["machine"].keys()
+        workers = {
+            r["workers"] for r in data["results"] if r["benchmark"].endswith("UUIDGenerator")
+        }
+        assert workers == {1}
+
+    def test_table_and_plain(self):
+        """Test the table and the plain tab-separated output."""
+        result = runner.invoke(app, [*self.ARGS, "--only", "generate_uuid_only"])
+        assert result.exit_code == 0
+        assert "generate_uuid_only" in result.stdout
+        result = runner.invoke(app, ["--plain", *self.ARGS, "--no-scaling"])
+        assert result.exit_code == 0
+        fields = [line.split("\t") for line in result.stdout.splitlines()]
+        assert fields[0][:3] == ["generate_uuid_only", "few-short", "-"]
+        assert not any(row[0].endswith("UUIDGenerator") for row in fields)
+
+    def test_unknown_benchmark(self):
+        """Test an unknown benchmark name is an error."""
+        result = runner.invoke(app, [*self.ARGS, "--only", "nope"])
+        assert result.exit_code == 1
+        assert "Unknown name" in result.stderr
+
+    def test_server(self, id_server):
+        """Test --server measures a running ID service."""
+        args = ["--plain", "bench", "-c", "200", "-r", "1", "--batch-size", "100", "-w", "2"]
+        result = runner.invoke(app, [*args, "--server", f"127.0.0.1:{id_server}"])
+        assert result.exit_code == 0
+        fields = result.stdout.strip().split("\t")
+        assert fields[:3] == ["serve /v1/ids", "few-short", "2"]
+
+    def test_server_address(self):
+        """Test --server must be HOST:PORT."""
+        result = runner.invoke(app, ["bench", "--server", "localhost"])
+        assert result.exit_code == 1
+        assert "HOST:PORT" in result.stderr
+
+
+class TestServeCommand:
+    """Tests for the serve command."""
+
+    def test_reports_address(self, monkeypatch):
+        """Test serve starts the server with the CLI config and prints its address."""
+        from uuid_forge import server
+        from uuid_forge.core import IDConfig
+
+        calls = []
+
+        def fake_serve(config, host, port, *, workers, ready):
+            calls.append((config, host, port, workers))
+            ready(4321)
+
+        monkeypatch.setattr(server, "serve", fake_serve)
+        result = runner.invoke(
+            app, ["--plain", "serve", "-p", "0", "-w", "2", "--no-env", "--salt", "s"]
+        )
+        assert result.exit_code == 0
+        assert result.stdout == "http://127.0.0.1:4321\n"
+        assert calls == [(IDConfig(salt="s"), "127.0.0.1", 0, 2)]
+        result = runner.invoke(app, ["serve", "-w", "3", "--no-env"])
+        assert "Serving IDs on" in result.stdout
+        assert "3 workers" in result.stdout
+
+    def test_invalid_arguments(self):
+        """Test serve reports argument errors with exit code 1."""
+        result = runner.invoke(app, ["serve", "--port", "0", "--workers", "2", "--no-env"])
+        assert result.exit_code == 1
+        assert "port 0" in result.stderr
+
+
+class TestSidecarCommand:
+    """Tests for the sidecar command."""
+
+    def test_serves_and_closes(self, monkeypatch):
+        """Test sidecar reports its name, serves with the CLI config and cleans up."""
+        import signal
+        import threading
+        import uuid
+
+        from uuid_forge.core import IDConfig, UUIDGenerator
+        from uuid_forge.sidecar import SidecarClient, SidecarServer, SidecarUnavailableError
+
+        name = f"uuid-forge-cli-{uuid.uuid4().hex[:12]}"
+        answers = []
+        serve_forever = SidecarServer.serve_forever
+
+        def serve_briefly(server):
+            serving = threading.Thread(target=serve_forever, args=(server,))
+            serving.start()
+            with SidecarClient(name) as client:
+                answers.append(client.generate("user", 1))
+            server.stop()
+            serving.join()
+
+        monkeypatch.setattr(SidecarServer, "serve_forever", serve_briefly)
+        previous = signal.getsignal(signal.SIGTERM)
+        try:
+            result = runner.invoke(
+                app,
+                ["--plain", "sidecar", "--name", name, "--slots", "2", "--no-env", "--salt", "x"],
+            )
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+        assert result.exit_code == 0
+        assert result.stdout == f"{name}\n"
+        assert answers == [UUIDGenerator(IDConfig(salt="x")).generate("user", 1)]
+        with pytest.raises(SidecarUnavailableError):
+            SidecarClient(name).generate("user", 1)
+
+    def test_invalid_name(self):
+        """Test an invalid name is reported with exit code 1."""
+        result = runner.invoke(app, ["sidecar", "--name", "a/b", "--no-env"])
+        assert result.exit_code == 1
+        assert "name" in result.stderr
+
+
+class TestPlainOutput:
+    """Tests for the --plain output mode."""
+
+    CONFIG = ["--no-env", "--salt", "plain-test-salt"]
+
+    def test_generate(self):
+        """Test generate prints only the UUID."""
+        from uuid_forge.core import IDConfig, generate_uuid_only
+
+        result = runner.invoke(
+            app, ["--plain", "generate", "user", "-a", "email=a@b.c", *self.CONFIG]
+        )
+        assert result.exit_code == 0
+        config = IDConfig(salt="plain-test-salt")
+        assert result.stdout == f"{generate_uuid_only('user', config=config, email='a@b.c')}\n"
+
+    def test_quiet_alias_and_prefix(self):
+        """Test --quiet and -q behave like --plain."""
+        for flag in ("--quiet", "-q"):
+            args = [flag, "generate", "invoice", "-p", "INV", "-a", "n=1", *self.CONFIG]
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0
+            assert result.stdout.startswith("INV-")
+            assert len(result.stdout.splitlines()) == 1
+
+    def test_extract_and_new_salt(self):
+        """Test extract and new-salt print bare values."""
+        uuid = "550e8400-e29b-41d4-a716-446655440000"
+        result = runner.invoke(app, ["--plain", "extract", f"INV-{uuid}"])
+        assert result.stdout == f"{uuid}\n"
+        result = runner.invoke(app, ["--plain", "new-salt"])
+        assert result.exit_code == 0
+        assert len(result.stdout.split()) == 1
+
+    def test_info(self, monkeypatch):
+        """Test info prints key: value lines."""
+        monkeypatch.setenv("UUID_FORGE_SALT", "test-salt")
+        result = runner.invoke(app, ["--plain", "info"])
+        assert result.exit_code == 0
+        assert "salt: set" in result.stdout.splitlines()
+
+    def test_errors_on_stderr(self):
+        """Test errors are plain text on stderr."""
+        result = runner.invoke(app, ["--plain", "generate", "user", "-a", "bad", *self.CONFIG])
+        assert result.exit_code == 1
+        assert result.stdout == ""
+        assert result.stderr.startswith("Error: Invalid attribute format")
+
+    def test_validate_exit_code(self, monkeypatch):
+        """Test validate keeps its exit code."""
+        monkeypatch.delenv("UUID_FORGE_SALT", raising=False)
+        result = runner.invoke(app, ["--plain", "validate"])
+        assert result.exit_code == 1
+        assert "CRITICAL" in result.stdout
+
+
+class TestStartup:
+    """Tests for CLI import cost."""
+
+    # Heavy modules only specific commands may import
+    DEFERRED = ("rich", "multiprocessing", "concurrent.futures", "uuid_forge.parallel")
+
+    # The CLI may at most double the cost of importing typer and the library.
+    # Importing Rich and the process pool eagerly used to add about 150%.
+    IMPORT_BUDGET = 1.0
+
+    def _run(self, code: str, *options: str) -> str:
+        import subprocess
+        import sys
+
+        result = subprocess.run(
+            [sys.executable, *options, "-c", code], capture_output=True, text=True, check=True
+        )
+        return result.stdout + result.stderr
+
+    def test_heavy_modules_deferred(self):
+        """Test importing the CLI and a --plain command never loads Rich."""
+        code = (
+            "import sys\n"
+            "from uuid_forge.cli import app\n"
+            f"loaded = lambda: sorted(m for m in {self.DEFERRED!r} if m in sys.modules)\n"
+            "print(loaded())\n"
+            "app(['--plain', 'generate', 'user', '-a', 'k=v'], standalone_mode=False)\n"
+            "print(loaded())\n"
+        )
+        lines = self._run(code).splitlines()
+        assert lines[0] == "[]"
+        assert lines[2] == "[]"
+
+    def test_import_time_budget(self):
+        """Test the CLI's own import time stays within budget.
+
+        The budget is relative to typer and the library, which the CLI cannot
+        avoid, so it holds on fast and slow machines alike.
+        """
+        overheads = []
+        for _ in range(3):
+            cumulative = {}
+            for line in self._run("import uuid_forge.cli", "-X", "importtime").splitlines():
+                _, total, name = line.split("|") if line.count("|") == 2 else ("", "", "")
+                if total.strip().isdigit():
+                    cumulative.setdefault(name.strip(), int(total))
+            base = cumulative["typer"] + cumulative["uuid_forge"]
+            overheads.append((cumulative["uuid_forge.cli"] - base) / base)
+        assert min(overheads) <= self.IMPORT_BUDGET
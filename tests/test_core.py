@@ -5,15 +5,30 @@ This test module ensures deterministic UUID generation works correctly
 across all scenarios including idempotency, security, and edge cases.
 """
 
+import datetime
+import decimal
+import enum
 import uuid as uuid_module
 
 import pytest
 
 from uuid_forge.core import (
+    _CACHE_ENTRY_BYTES,
+    BatchRowError,
+    CacheInfo,
+    EntitySchema,
+    EntityUUIDGenerator,
     IDConfig,
+    Namespace,
     UUIDGenerator,
+    _normalize_input,
+    _normalize_row,
     extract_uuid_from_prefixed,
+    extract_uuids_from_prefixed,
+    generate_iter,
     generate_salt,
+    generate_uuid_bytes,
+    generate_uuid_int,
     generate_uuid_only,
     generate_uuid_with_prefix,
 )
@@ -87,6 +102,155 @@ class TestGenerateSalt:
         assert re.match(r"^[A-Za-z0-9_-]+$", salt), "Salt should be URL-safe"
 
 
+def _reference_normalize(*args, **kwargs) -> str:
+    """Original generic normalizer, kept verbatim as the differential oracle."""
+    parts = []
+    for arg in args:
+        if hasattr(arg, "__repr__"):
+            parts.append(repr(arg))
+        else:
+            parts.append(str(arg))
+    for key in sorted(kwargs.keys()):
+        value = kwargs[key]
+        if hasattr(value, "__repr__"):
+            parts.append(f"{key}={repr(value)}")
+        else:
+            parts.append(f"{key}={value}")
+    return "|".join(parts)
+
+
+class _Str(str):
+    pass
+
+
+class _Int(int):
+    pass
+
+
+class _UUID(uuid_module.UUID):
+    pass
+
+
+class _Color(enum.Enum):
+    RED = 1
+
+
+_TZ = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+
+NORMALIZE_CORPUS = [
+    "",
+    "EUR",
+    "it's",
+    'say "hi"',
+    "both ' and \"",
+    "tab\tnew\nline\\",
+    "Zoë 🚀 \u200b",
+    "\x00\x7f",
+    0,
+    -1,
+    12345,
+    2**100,
+    -(2**64),
+    True,
+    False,
+    None,
+    0.0,
+    -0.0,
+    1.5,
+    1e300,
+    1e-300,
+    float("inf"),
+    float("-inf"),
+    float("nan"),
+    0.1 + 0.2,
+    uuid_module.UUID(int=0),
+    uuid_module.UUID(int=2**128 - 1),
+    uuid_module.UUID("550e8400-e29b-41d4-a716-446655440000"),
+    uuid_module.uuid5(uuid_module.NAMESPACE_DNS, "example.com"),
+    decimal.Decimal("9.99"),
+    decimal.Decimal("-0"),
+    decimal.Decimal("1E+3"),
+    decimal.Decimal("NaN"),
+    decimal.Decimal("-Infinity"),
+    datetime.date(2024, 2, 29),
+    datetime.date(1, 1, 1),
+    datetime.datetime(2024, 1, 2),
+    datetime.datetime(2024, 1, 2, 3, 4),
+    datetime.datetime(2024, 1, 2, 3, 4, 5),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, 6),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=_TZ),
+    datetime.datetime(2024, 11, 3, 1, 30, fold=1),
+    _Str("sub"),
+    _Int(7),
+    _UUID(int=42),
+    _Color.RED,
+    b"bytes\x00",
+    (1, "a"),
+    [1, 2.5, None],
+    {"b": 1, "a": [uuid_module.UUID(int=3)]},
+    frozenset(),
+    1 + 2j,
+]
+
+
+class TestNormalizeInput:
+    """Differential tests proving the fast normalizer matches the original."""
+
+    @pytest.mark.parametrize("value", NORMALIZE_CORPUS, ids=repr)
+    def test_single_value(self, value) -> None:
+        """Test each corpus value positionally and as a keyword."""
+        assert _normalize_input(value) == _reference_normalize(value)
+        assert _normalize_input(key=value) == _reference_normalize(key=value)
+
+    def test_whole_corpus(self) -> None:
+        """Test the full corpus as positional and keyword arguments together."""
+        kwargs = {f"k{i:02d}": value for i, value in enumerate(NORMALIZE_CORPUS)}
+        expected = _reference_normalize(*NORMALIZE_CORPUS, **kwargs)
+        assert _normalize_input(*NORMALIZE_CORPUS, **kwargs) == expected
+        assert _normalize_input() == _reference_normalize() == ""
+
+    def test_batch_rows_match(self) -> None:
+        """Test that batch row normalization uses the same formatting."""
+        kwargs = {f"k{i:02d}": value for i, value in enumerate(NORMALIZE_CORPUS)}
+        key_order: list = [None, ()]
+        assert _normalize_row(kwargs, key_order) == _reference_normalize(**kwargs)
+        assert _normalize_row(NORMALIZE_CORPUS, key_order) == _reference_normalize(
+            *NORMALIZE_CORPUS
+        )
+
+    @pytest.mark.parametrize(
+        ("args", "kwargs", "expected"),
+        [
+            (
+                ("invoice",),
+                {"region": "EUR", "number": 12345},
+                "207652ee-b669-5737-bfe0-2d49dbf83cbe",
+            ),
+            (("user", "alice@example.com"), {}, "0a364a93-7a27-58a8-98a7-9d3f8d12b326"),
+            (
+                ("order",),
+                {
+                    "id": uuid_module.UUID(int=1),
+                    "amount": decimal.Decimal("9.99"),
+                    "ts": datetime.datetime(2024, 1, 2, 3, 4, 5),
+                },
+                "6afa15fb-eb6c-5256-9d61-c61df2295f04",
+            ),
+            (("event", 1.5, None, True), {}, "0585f63e-2aec-53e1-bc95-a63c71075bd4"),
+            (
+                ("day",),
+                {"date": datetime.date(2024, 2, 29)},
+                "c78d6eef-083f-5162-8f12-cccc368604b8",
+            ),
+        ],
+    )
+    def test_golden_uuids(self, args, kwargs, expected) -> None:
+        """Test that previously issued UUIDs never change."""
+        config = IDConfig(salt="golden-salt")
+        assert str(generate_uuid_only(*args, config=config, **kwargs)) == expected
+
+
 class TestGenerateUUIDOnly:
     """Tests for generate_uuid_only function."""
 
@@ -176,6 +340,34 @@ class TestGenerateUUIDOnly:
         assert uuid1 == uuid2
 
 
+class TestRawOutput:
+    """Tests for bytes and int output that skip UUID construction."""
+
+    @pytest.mark.parametrize("config", [None, IDConfig(salt="test-salt")])
+    def test_functions_match_uuid(self, config: IDConfig | None) -> None:
+        """Test raw functions match the UUID object's bytes and int."""
+        for args, kwargs in [((), {}), (("EUR", 1), {}), ((), {"region": "EUR", "n": 1})]:
+            expected = generate_uuid_only("invoice", *args, config=config, **kwargs)
+            raw_bytes = generate_uuid_bytes("invoice", *args, config=config, **kwargs)
+            raw_int = generate_uuid_int("invoice", *args, config=config, **kwargs)
+            assert raw_bytes == expected.bytes
+            assert raw_int == expected.int
+            assert uuid_module.UUID(bytes=raw_bytes).version == 5
+
+    def test_generator_methods_match_uuid(self) -> None:
+        """Test raw generator methods match generate()."""
+        generator = UUIDGenerator(IDConfig(salt="test-salt"))
+        for i in range(50):
+            expected = generator.generate("item", i, tag="x")
+            assert generator.generate_bytes("item", i, tag="x") == expected.bytes
+            assert generator.generate_int("item", i, tag="x") == expected.int
+
+    def test_invalid_config_type(self) -> None:
+        """Test that non-IDConfig config raises TypeError."""
+        with pytest.raises(TypeError, match="config must be IDConfig"):
+            generate_uuid_bytes("test", config="invalid")  # type: ignore
+
+
 class TestGenerateUUIDWithPrefix:
     """Tests for generate_uuid_with_prefix function."""
 
@@ -284,6 +476,123 @@ class TestExtractUUIDFromPrefixed:
         assert extracted == regenerated
 
 
+def _reference_extract(prefixed_id: str, separator: str = "-") -> uuid_module.UUID:
+    """Original extraction loop, kept verbatim as the differential oracle."""
+    parts = prefixed_id.split(separator)
+    for i in range(len(parts)):
+        potential_uuid = separator.join(parts[i:])
+        try:
+            return uuid_module.UUID(potential_uuid)
+        except ValueError:
+            continue
+    raise ValueError(f"No valid UUID found in '{prefixed_id}'")
+
+
+_SAMPLE_UUID = "550e8400-e29b-41d4-a716-446655440000"
+_SAMPLE_HEX = _SAMPLE_UUID.replace("-", "")
+
+EXTRACT_CORPUS = [
+    (_SAMPLE_UUID, "-"),
+    (_SAMPLE_HEX, "-"),
+    (_SAMPLE_UUID.upper(), "-"),
+    (f"INV-{_SAMPLE_UUID}", "-"),
+    (f"INV-EUR-2024-{_SAMPLE_UUID}", "-"),
+    (f"INV-EUR-{_SAMPLE_HEX}", "-"),
+    (f"INV_{_SAMPLE_UUID}", "_"),
+    (f"INV_EUR_{_SAMPLE_HEX}", "_"),
+    (f"INV::{_SAMPLE_UUID}", "::"),
+    (f"INV--{_SAMPLE_UUID}", "--"),
+    (f"INV---{_SAMPLE_UUID}", "--"),
+    (f"INV-{_SAMPLE_UUID}", "_"),
+    (f"INVX{_SAMPLE_UUID}", "-"),
+    (f"INVX{_SAMPLE_HEX}", "-"),
+    (f"INV-{{{_SAMPLE_UUID}}}", "-"),
+    (f"INV-urn:uuid:{_SAMPLE_UUID}", "-"),
+    (f"urn:uuid:{_SAMPLE_UUID}", "-"),
+    (f"uuid:{_SAMPLE_UUID}", ":"),
+    (f"{{-{_SAMPLE_UUID}", "-"),
+    (f"--{_SAMPLE_UUID}", "-"),
+    (f"{_SAMPLE_UUID}-", "-"),
+    (f"{_SAMPLE_UUID}-INV", "-"),
+    (f"INV-{_SAMPLE_HEX[:-1]}", "-"),
+    (f"INV-{_SAMPLE_HEX}0", "-"),
+    (f"INV-{_SAMPLE_UUID[:-1]}g", "-"),
+    (f"INV-{_SAMPLE_HEX[:8]}-{_SAMPLE_HEX[8:]}", "-"),
+    ("INV-" + "0" * 36, "-"),
+    ("not-a-uuid", "-"),
+    ("", "-"),
+    ("-", "-"),
+    (f"INV 5{_SAMPLE_UUID[1:]}", "5"),
+]
+
+
+class TestExtractUUIDFastPath:
+    """Differential tests for the single-pass extraction parser."""
+
+    @pytest.mark.parametrize(("prefixed_id", "separator"), EXTRACT_CORPUS)
+    def test_matches_reference(self, prefixed_id: str, separator: str) -> None:
+        """Test results and failures match the original implementation."""
+        try:
+            expected = _reference_extract(prefixed_id, separator)
+        except ValueError:
+            with pytest.raises(ValueError):
+                extract_uuid_from_prefixed(prefixed_id, separator)
+        else:
+            assert extract_uuid_from_prefixed(prefixed_id, separator) == expected
+
+    def test_matches_reference_randomized(self) -> None:
+        """Test random prefixes and separators against the original."""
+        import random
+
+        rng = random.Random(1234)
+        alphabet = "abcdefABCDEF0123456789-_:{}xyz "
+        for _ in range(2_000):
+            separator = rng.choice(["-", "_", ":", "::", "--", "-x-", "a"])
+            prefix = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            uid = uuid_module.UUID(int=rng.getrandbits(128))
+            body = rng.choice([str(uid), uid.hex, str(uid).upper(), f"{{{uid}}}"])
+            prefixed_id = f"{prefix}{separator}{body}" if prefix else body
+            try:
+                expected = _reference_extract(prefixed_id, separator)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    extract_uuid_from_prefixed(prefixed_id, separator)
+            else:
+                assert extract_uuid_from_prefixed(prefixed_id, separator) == expected
+
+    def test_empty_separator_still_raises(self) -> None:
+        """Test an empty separator is rejected as before."""
+        with pytest.raises(ValueError):
+            extract_uuid_from_prefixed(_SAMPLE_UUID, "")
+
+
+class TestExtractUUIDsFromPrefixed:
+    """Tests for the batch extraction variant."""
+
+    def test_matches_single_calls(self) -> None:
+        """Test batch results match per-ID extraction, from a list or iterator."""
+        ids = [generate_uuid_with_prefix("invoice", prefix="INV-EUR", n=i) for i in range(20)]
+        expected = [extract_uuid_from_prefixed(prefixed_id) for prefixed_id in ids]
+        assert extract_uuids_from_prefixed(ids) == expected
+        assert extract_uuids_from_prefixed(iter(ids)) == expected
+
+    def test_custom_separator(self) -> None:
+        """Test the separator is passed through."""
+        ids = [f"INV_{_SAMPLE_UUID}", f"ORD_{_SAMPLE_HEX}"]
+        assert extract_uuids_from_prefixed(ids, "_") == [uuid_module.UUID(_SAMPLE_UUID)] * 2
+
+    def test_error_collection(self) -> None:
+        """Test failures are collected or raised with their index."""
+        ids = [f"INV-{_SAMPLE_UUID}", "bogus", f"ORD-{_SAMPLE_UUID}"]
+        errors: list[BatchRowError] = []
+        result = extract_uuids_from_prefixed(ids, errors=errors)
+        assert result == [uuid_module.UUID(_SAMPLE_UUID), None, uuid_module.UUID(_SAMPLE_UUID)]
+        assert [(error.index, error.row) for error in errors] == [(1, "bogus")]
+
+        with pytest.raises(BatchRowError, match="row 1"):
+            extract_uuids_from_prefixed(ids)
+
+
 class TestUUIDGenerator:
     """Tests for UUIDGenerator class."""
 
@@ -348,6 +657,439 @@ class TestUUIDGenerator:
 
         assert uuid1 != uuid2
 
+    def test_reassigning_config(self) -> None:
+        """Test that a new config applies to compiled generators and the cache."""
+        schema = EntitySchema("invoice", fields=("number",))
+        for generator in (UUIDGenerator(IDConfig(salt="a")), UUIDGenerator(cache_size=10)):
+            generator.generate("test", key="value")
+            generator.for_schema(schema)(1)
+            generator.config = IDConfig(salt="b")
+            assert generator.generate("test", key="value") == (
+                generate_uuid_only("test", config=IDConfig(salt="b"), key="value")
+            )
+            assert generator.for_schema(schema)(1) == (
+                generate_uuid_only("invoice", config=IDConfig(salt="b"), number=1)
+            )
+
+    def test_compiled_generators_are_bounded(self) -> None:
+        """Test that dynamic entity types do not grow the generator without limit."""
+        generator = UUIDGenerator()
+        for i in range(2000):
+            generator.generate(f"entity-{i}", 1)
+        assert len(generator._entities) <= 1024
+        assert generator.generate("entity-1", 1) == generate_uuid_only("entity-1", 1)
+
+
+class TestEntityUUIDGenerator:
+    """Tests for compiled per-entity generators."""
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            IDConfig(),
+            IDConfig(salt="test-salt"),
+            IDConfig(namespace=Namespace("example.com"), salt="sält-ünïcode"),
+        ],
+    )
+    def test_matches_generate_uuid_only(self, config: IDConfig) -> None:
+        """Test compiled output is byte-identical to the functional API."""
+        entity = EntityUUIDGenerator("invoice", config)
+        cases = [
+            ((), {}),
+            (("EUR", 123), {}),
+            ((), {"region": "EUR", "number": 123}),
+            (("x",), {"b": None, "a": 1.5}),
+            ((), {"name": "Zoë 🚀"}),
+        ]
+        for args, kwargs in cases:
+            expected = generate_uuid_only("invoice", *args, config=config, **kwargs)
+            assert entity(*args, **kwargs).bytes == expected.bytes
+            assert entity.generate(*args, **kwargs) == expected
+
+    def test_generate_with_prefix(self) -> None:
+        """Test prefixed output matches the functional API."""
+        config = IDConfig(salt="test-salt")
+        entity = EntityUUIDGenerator("invoice", config)
+        assert entity.generate_with_prefix(
+            prefix="INV", separator="_", number=1
+        ) == generate_uuid_with_prefix(
+            "invoice", prefix="INV", separator="_", config=config, number=1
+        )
+        assert entity.generate_with_prefix(number=1) == str(entity(number=1))
+
+    def test_invalid_config_type(self) -> None:
+        """Test that non-IDConfig config raises TypeError."""
+        with pytest.raises(TypeError, match="config must be IDConfig"):
+            EntityUUIDGenerator("invoice", config="invalid")  # type: ignore
+
+    def test_shared_generator_across_threads(self) -> None:
+        """Test concurrent use of one generator from many threads."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        config = IDConfig(salt="test-salt")
+        generator = UUIDGenerator(config)
+        expected = [generate_uuid_only(f"type{i % 5}", i, config=config) for i in range(400)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            result = list(pool.map(lambda i: generator.generate(f"type{i % 5}", i), range(400)))
+
+        assert result == expected
+        assert len(generator._entities) == 5
+
+    def test_for_entity_is_reused(self) -> None:
+        """Test that UUIDGenerator compiles each entity type once."""
+        generator = UUIDGenerator(IDConfig(salt="test-salt"))
+        invoice = generator.for_entity("invoice")
+        assert generator.for_entity("invoice") is invoice
+        assert generator.for_entity("order") is not invoice
+        assert invoice.config is generator.config
+
+
+class TestEntitySchema:
+    """Tests for EntitySchema and CompiledSchema."""
+
+    SCHEMA = EntitySchema("invoice", fields=("region", "number", "amount"), prefix="INV")
+
+    @pytest.mark.parametrize("config", [None, IDConfig(salt="test-salt")])
+    def test_matches_kwargs_form(self, config: IDConfig | None) -> None:
+        """Test compiled output is identical to the keyword-argument form."""
+        invoice = self.SCHEMA.compile(config)
+        for values in [
+            ("EUR", 1, 9.99),
+            ("USD", -5, None),
+            ("it's", 2**70, uuid_module.UUID(int=7)),
+        ]:
+            kwargs = dict(zip(self.SCHEMA.fields, values, strict=True))
+            expected = generate_uuid_only("invoice", config=config, **kwargs)
+            assert invoice(*values) == expected
+            assert invoice.generate(*values) == expected
+            assert invoice.generate_int(*values) == expected.int
+            assert invoice.generate_bytes(*values) == expected.bytes
+            assert invoice.generate_with_prefix(*values) == generate_uuid_with_prefix(
+                "invoice", prefix="INV", config=config, **kwargs
+            )
+
+    def test_golden_uuid(self) -> None:
+        """Test against a UUID pinned from the keyword form."""
+        schema = EntitySchema("invoice", fields=("region", "number"))
+        invoice = schema.compile(IDConfig(salt="golden-salt"))
+        assert str(invoice("EUR", 12345)) == "207652ee-b669-5737-bfe0-2d49dbf83cbe"
+
+    def test_no_fields_and_no_prefix(self) -> None:
+        """Test an empty schema matches a call with no business data."""
+        config = IDConfig(salt="test-salt")
+        singleton = EntitySchema("singleton", fields=()).compile(config)
+        assert singleton() == generate_uuid_only("singleton", config=config)
+        assert singleton.generate_with_prefix() == str(singleton())
+
+    def test_custom_separator(self) -> None:
+        """Test the schema separator is used in prefixed output."""
+        order = EntitySchema("order", fields=("id",), prefix="ORD", separator="_").compile()
+        assert order.generate_with_prefix(1) == f"ORD_{order(1)}"
+
+    def test_wrong_value_count(self) -> None:
+        """Test that a value count mismatch raises TypeError."""
+        invoice = self.SCHEMA.compile()
+        with pytest.raises(TypeError, match="expects 3 values"):
+            invoice("EUR", 1)
+
+    @pytest.mark.parametrize("fields", [("a", "a"), ("a", "not valid"), ("a", 1)])
+    def test_invalid_fields(self, fields: tuple) -> None:
+        """Test that duplicate or non-identifier fields are rejected."""
+        with pytest.raises(ValueError):
+            EntitySchema("bad", fields=fields)
+
+    def test_fields_list_is_normalized(self) -> None:
+        """Test that a list of fields is stored as a hashable tuple."""
+        schema = EntitySchema("invoice", fields=["region", "number"])  # type: ignore[arg-type]
+        assert schema.fields == ("region", "number")
+        assert hash(schema) == hash(EntitySchema("invoice", ("region", "number")))
+
+    def test_invalid_config_type(self) -> None:
+        """Test that non-IDConfig config raises TypeError."""
+        with pytest.raises(TypeError, match="config must be IDConfig"):
+            self.SCHEMA.compile("invalid")  # type: ignore[arg-type]
+
+    def test_generate_many(self) -> None:
+        """Test batch generation and per-row error collection."""
+        invoice = self.SCHEMA.compile(IDConfig(salt="test-salt"))
+        rows = [("EUR", i, 1.0) for i in range(20)]
+        assert invoice.generate_many(rows) == [invoice(*row) for row in rows]
+
+        errors: list[BatchRowError] = []
+        result = invoice.generate_many(
+            [("EUR", 1, 1.0), ("EUR",), {"region": "EUR"}], errors=errors
+        )
+        assert result[0] == invoice("EUR", 1, 1.0)
+        assert result[1:] == [None, None]
+        assert [error.index for error in errors] == [1, 2]
+
+        with pytest.raises(BatchRowError, match="row 1"):
+            invoice.generate_many([("EUR", 1, 1.0), ("EUR",)])
+
+    def test_for_schema_is_cached(self) -> None:
+        """Test UUIDGenerator.for_schema compiles once and matches generate()."""
+        generator = UUIDGenerator(IDConfig(salt="test-salt"))
+        invoice = generator.for_schema(self.SCHEMA)
+        assert generator.for_schema(self.SCHEMA) is invoice
+        assert invoice("EUR", 1, 2.5) == generator.generate(
+            "invoice", region="EUR", number=1, amount=2.5
+        )
+        assert "CompiledSchema" in repr(invoice)
+
+
+class TestUUIDGeneratorCache:
+    """Tests for the opt-in LRU cache on UUIDGenerator."""
+
+    def test_cached_results_match_uncached(self) -> None:
+        """Test every API returns identical results with and without a cache."""
+        config = IDConfig(salt="test-salt")
+        plain = UUIDGenerator(config)
+        cached = UUIDGenerator(config, cache_size=100)
+        schema = EntitySchema("invoice", fields=("region", "number"), prefix="INV")
+        for _ in range(2):
+            assert cached.generate("invoice", region="EUR", number=1) == plain.generate(
+                "invoice", region="EUR", number=1
+            )
+            assert cached.generate_int("user", "a") == plain.generate_int("user", "a")
+            assert cached.generate_bytes("user", "a") == plain.generate_bytes("user", "a")
+            assert cached.generate_with_prefix("user", "a", prefix="U") == (
+                plain.generate_with_prefix("user", "a", prefix="U")
+            )
+            rows = [{"region": "EUR", "number": i} for i in range(5)]
+            assert cached.generate_many("invoice", rows) == plain.generate_many("invoice", rows)
+            compiled, reference = cached.for_schema(schema), plain.for_schema(schema)
+            assert compiled("EUR", 1) == reference("EUR", 1)
+            assert compiled.generate_int("EUR", 1) == reference.generate_int("EUR", 1)
+            assert compiled.generate_bytes("EUR", 1) == reference.generate_bytes("EUR", 1)
+            assert compiled.generate_with_prefix("EUR", 1) == reference.generate_with_prefix(
+                "EUR", 1
+            )
+            assert compiled.generate_many([("EUR", 2)]) == reference.generate_many([("EUR", 2)])
+        info = cached.cache_info()
+        assert info is not None
+        assert info.hits > 0
+        assert info.hit_rate > 0.5
+
+    def test_schema_and_kwargs_share_entries(self) -> None:
+        """Test the compiled schema form hits entries made by the keyword form."""
+        generator = UUIDGenerator(cache_size=10)
+        generator.generate("invoice", region="EUR", number=1)
+        invoice = generator.for_schema(EntitySchema("invoice", ("region", "number")))
+        invoice("EUR", 1)
+        info = generator.cache_info()
+        assert info is not None
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_equal_values_with_different_repr_do_not_collide(self) -> None:
+        """Test that 1, 1.0 and True keep their distinct UUIDs."""
+        plain = UUIDGenerator()
+        cached = UUIDGenerator(cache_size=10)
+        for value in [1, 1.0, True, 0.0, -0.0]:
+            assert cached.generate("n", value) == plain.generate("n", value)
+
+    def test_lru_eviction(self) -> None:
+        """Test least recently used entries are evicted first."""
+        generator = UUIDGenerator(cache_size=2)
+        generator.generate("user", "a")
+        generator.generate("user", "b")
+        generator.generate("user", "a")  # a is now most recent
+        generator.generate("user", "c")  # evicts b
+        generator.generate("user", "a")
+        info = generator.cache_info()
+        assert info is not None
+        assert (info.hits, info.misses, info.evictions, info.currsize) == (2, 3, 1, 2)
+        generator.generate("user", "b")
+        info = generator.cache_info()
+        assert info is not None
+        assert info.misses == 4
+
+    def test_cache_clear(self) -> None:
+        """Test that cache_clear empties the cache and resets counters."""
+        generator = UUIDGenerator(cache_size=5)
+        generator.generate("user", "a")
+        generator.cache_clear()
+        assert generator.cache_info() == CacheInfo(0, 0, 0, 5, 0)
+        UUIDGenerator().cache_clear()  # no-op without a cache
+
+    def test_byte_budget(self) -> None:
+        """Test cache_bytes evicts by memory, alone or with cache_size."""
+        plain = UUIDGenerator()
+        keys = [f"{i:03d}" + "x" * 97 for i in range(10)]
+        probe = UUIDGenerator(cache_size=1)
+        probe.generate("user", keys[0])
+        entry = probe.cache_info().currbytes  # type: ignore[union-attr]
+        assert entry > 100 + _CACHE_ENTRY_BYTES
+        generator = UUIDGenerator(cache_bytes=3 * entry)
+        assert [generator.generate("user", key) for key in keys] == [
+            plain.generate("user", key) for key in keys
+        ]
+        info = generator.cache_info()
+        assert info is not None
+        assert (info.currsize, info.evictions, info.maxsize) == (3, 7, None)
+        assert (info.currbytes, info.maxbytes) == (3 * entry, 3 * entry)
+
+        # Long inputs take more of the budget; one larger than all of it is not cached
+        generator.generate("user", "y" * 250)
+        assert generator.cache_info().currsize == 2  # type: ignore[union-attr]
+        generator.generate("user", "z" * 10_000)
+        assert generator.cache_info().currsize == 2  # type: ignore[union-attr]
+        generator.cache_clear()
+        assert generator.cache_info() == CacheInfo(0, 0, 0, None, 0, 3 * entry, 0)
+
+        both = UUIDGenerator(cache_size=2, cache_bytes=10 * entry)
+        for key in keys:
+            both.generate("user", key)
+        info = both.cache_info()
+        assert info is not None
+        assert (info.currsize, info.currbytes) == (2, 2 * entry)
+
+    def test_disabled_by_default(self) -> None:
+        """Test that no cache exists unless requested."""
+        assert UUIDGenerator().cache_info() is None
+        assert CacheInfo(0, 0, 0, 1, 0).hit_rate == 0.0
+
+    def test_invalid_cache_size(self) -> None:
+        """Test that a non-positive cache size is rejected."""
+        with pytest.raises(ValueError, match="cache_size"):
+            UUIDGenerator(cache_size=0)
+        with pytest.raises(ValueError, match="cache_bytes"):
+            UUIDGenerator(cache_bytes=0)
+
+    def test_batch_errors_with_cache(self) -> None:
+        """Test per-row error collection works through the cache."""
+        generator = UUIDGenerator(cache_size=5)
+        errors: list[BatchRowError] = []
+        result = generator.generate_many("invoice", [{"n": 1}, 42], errors=errors)
+        assert result[1] is None
+        assert errors[0].index == 1
+
+    def test_shared_across_threads(self) -> None:
+        """Test concurrent use keeps results correct and the size bounded."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        config = IDConfig(salt="test-salt")
+        plain = UUIDGenerator(config)
+        cached = UUIDGenerator(config, cache_size=50)
+        expected = {i: plain.generate("user", i) for i in range(100)}
+
+        def work(offset: int) -> bool:
+            return all(
+                cached.generate("user", (i + offset) % 100) == expected[(i + offset) % 100]
+                for i in range(2_000)
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(work, range(8)))
+        info = cached.cache_info()
+        assert info is not None
+        assert info.currsize <= 50
+        assert info.hits + info.misses == 16_000
+
+
+class TestGenerateMany:
+    """Tests for batch generation."""
+
+    def test_matches_single_calls(self) -> None:
+        """Test that batch output matches single calls in input order."""
+        generator = UUIDGenerator(IDConfig(salt="test-salt"))
+        rows = [
+            {"region": "EUR", "number": 1},
+            {"number": 2, "region": "USD"},
+            {"region": "EUR", "number": 3},
+            ("EUR", 4),
+            ["EUR", 5],
+            (),
+            {},
+        ]
+        expected = []
+        for row in rows:
+            if isinstance(row, dict):
+                expected.append(generator.generate("invoice", **row))
+            else:
+                expected.append(generator.generate("invoice", *row))
+        assert generator.generate_many("invoice", rows) == expected
+
+    def test_accepts_iterators(self) -> None:
+        """Test that any iterable of rows is accepted."""
+        generator = UUIDGenerator()
+        result = generator.generate_many("item", ((i,) for i in range(3)))
+        assert result == [generator.generate("item", i) for i in range(3)]
+
+    def test_raises_on_bad_row_by_default(self) -> None:
+        """Test that a bad row raises BatchRowError with its index."""
+        generator = UUIDGenerator()
+        with pytest.raises(BatchRowError, match="row 1") as exc_info:
+            generator.generate_many("item", [(1,), 2, (3,)])
+        assert exc_info.value.index == 1
+        assert exc_info.value.row == 2
+        assert isinstance(exc_info.value.__cause__, TypeError)
+
+    def test_collects_errors(self) -> None:
+        """Test that collected errors keep results aligned with input."""
+        generator = UUIDGenerator()
+        errors: list[BatchRowError] = []
+        result = generator.generate_many("item", [(1,), "bad", {1: "x"}, (4,)], errors=errors)
+        assert result[0] == generator.generate("item", 1)
+        assert result[1] is None
+        assert result[2] is None
+        assert result[3] == generator.generate("item", 4)
+        assert [error.index for error in errors] == [1, 2]
+        assert all(isinstance(error.error, TypeError) for error in errors)
+
+
+class TestGenerateIter:
+    """Tests for streaming generation."""
+
+    def test_matches_generate_many(self) -> None:
+        """Test that streaming output matches the batch API across chunks."""
+        config = IDConfig(salt="test-salt")
+        rows = [{"number": i} for i in range(7)]
+        expected = UUIDGenerator(config).generate_many("invoice", rows)
+        assert list(generate_iter("invoice", rows, config=config, chunk_size=3)) == expected
+
+    def test_with_rows(self) -> None:
+        """Test that (row, uuid) pairs are yielded when requested."""
+        rows = [(i,) for i in range(3)]
+        pairs = list(generate_iter("item", rows, with_rows=True, chunk_size=2))
+        assert [row for row, _ in pairs] == rows
+        assert [uid for _, uid in pairs] == [generate_uuid_only("item", i) for i in range(3)]
+
+    def test_is_lazy(self) -> None:
+        """Test that rows are pulled no further than the current chunk."""
+        consumed = []
+
+        def source():
+            for i in range(100):
+                consumed.append(i)
+                yield (i,)
+
+        stream = generate_iter("item", source(), chunk_size=10)
+        assert consumed == []
+        next(stream)
+        assert len(consumed) == 10
+
+    def test_error_index_is_stream_relative(self) -> None:
+        """Test that collected errors report their position in the stream."""
+        errors: list[BatchRowError] = []
+        rows = [(0,), (1,), (2,), "bad", (4,)]
+        result = list(generate_iter("item", rows, chunk_size=2, errors=errors))
+        assert result[3] is None
+        assert [error.index for error in errors] == [3]
+
+    def test_raises_after_preceding_rows(self) -> None:
+        """Test that rows before a failure are yielded before it raises."""
+        stream = generate_iter("item", [(0,), (1,), (2,), "bad"], chunk_size=4)
+        assert len([next(stream) for _ in range(3)]) == 3
+        with pytest.raises(BatchRowError) as exc_info:
+            next(stream)
+        assert exc_info.value.index == 3
+
+    def test_invalid_chunk_size(self) -> None:
+        """Test that chunk_size must be positive."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            generate_iter("item", [], chunk_size=0)
+
 
 class TestIntegration:
     """Integration tests for cross-system UUID coordination scenarios."""
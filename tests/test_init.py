@@ -58,3 +58,19 @@ class TestBasicFunctionality:
         generator = uuid_forge.UUIDGenerator(config)
         result = generator.generate("test", key="value")
         assert isinstance(result, uuid_forge.core.uuid_module.UUID)
+
+
+def test_library_does_not_import_cli_dependencies() -> None:
+    """Test the library never imports the optional CLI dependencies."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import uuid_forge, uuid_forge.config, uuid_forge.records, uuid_forge.parallel\n"
+        "print(sorted(m for m in ('typer', 'click', 'rich') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout == "[]\n"
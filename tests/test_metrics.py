@@ -0,0 +1,246 @@
+"""Tests for uuid_forge.metrics module."""
+
+import gc
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from uuid_forge import core, metrics
+from uuid_forge.core import (
+    EntityUUIDGenerator,
+    IDConfig,
+    UUIDGenerator,
+    generate_iter,
+    generate_uuid_bytes,
+    generate_uuid_int,
+    generate_uuid_only,
+    generate_uuid_with_prefix,
+)
+from uuid_forge.metrics import (
+    BATCH_SIZE_BUCKETS,
+    LATENCY_BUCKETS_NS,
+    GeneratorStats,
+    Histogram,
+    to_prometheus,
+)
+
+
+@pytest.fixture
+def enabled() -> Iterator[None]:
+    """Instrument the module-level functions for one test."""
+    metrics.enable()
+    yield
+    metrics.disable()
+
+
+class TestGeneratorInstrumentation:
+    """Tests for UUIDGenerator(instrument=True)."""
+
+    def test_disabled_by_default(self, test_config: IDConfig) -> None:
+        """Test plain generators record nothing and use the plain entity class."""
+        generator = UUIDGenerator(test_config)
+        assert generator.stats() is None
+        assert type(generator.for_entity("invoice")) is EntityUUIDGenerator
+
+    def test_results_match_uninstrumented(self, test_config: IDConfig) -> None:
+        """Test every API returns identical results with instrumentation on."""
+        plain = UUIDGenerator(test_config)
+        for generator in (
+            UUIDGenerator(test_config, instrument=True),
+            UUIDGenerator(test_config, instrument=True, cache_size=10),
+        ):
+            for _ in range(2):
+                assert generator.generate("user", "a") == plain.generate("user", "a")
+                assert generator.generate_int("user", "a") == plain.generate_int("user", "a")
+                assert generator.generate_bytes("user", "a") == plain.generate_bytes("user", "a")
+                assert generator.generate_with_prefix("user", "a", prefix="U") == (
+                    plain.generate_with_prefix("user", "a", prefix="U")
+                )
+                rows = [{"number": i} for i in range(5)]
+                assert generator.generate_many("invoice", rows) == plain.generate_many(
+                    "invoice", rows
+                )
+
+    def test_counts_calls_and_batches(self, test_config: IDConfig) -> None:
+        """Test IDs are counted per entity type, with batch rows included."""
+        generator = UUIDGenerator(test_config, instrument=True)
+        generator.generate("user", "a")
+        generator.generate_int("user", "b")
+        generator.for_entity("user").generate_bytes("c")
+        generator.generate_many("invoice", [(i,) for i in range(150)])
+        generator.generate_many("invoice", [(1,)])
+
+        stats = generator.stats()
+        assert stats is not None
+        assert stats.calls == 154
+        user, invoice = stats.entities["user"], stats.entities["invoice"]
+        assert (user.calls, user.batches, user.latency.count) == (3, 0, 3)
+        assert (invoice.calls, invoice.batches, invoice.latency.count) == (151, 2, 0)
+        assert invoice.batch_sizes.counts[BATCH_SIZE_BUCKETS.index(1)] == 1
+        assert invoice.batch_sizes.counts[BATCH_SIZE_BUCKETS.index(1_000)] == 1
+        assert invoice.batch_sizes.total == 151
+
+    def test_phase_times_add_up(self, test_config: IDConfig) -> None:
+        """Test single-call phase times sum to the recorded latency."""
+        generator = UUIDGenerator(test_config, instrument=True)
+        for i in range(20):
+            generator.generate("user", i)
+        user = generator.stats().entities["user"]  # type: ignore[union-attr]
+        assert min(user.normalize_ns, user.hash_ns, user.format_ns) > 0
+        assert user.normalize_ns + user.hash_ns + user.format_ns == user.latency.total
+        assert len(user.latency.counts) == len(LATENCY_BUCKETS_NS) + 1
+
+    def test_failed_rows_are_counted(self, test_config: IDConfig) -> None:
+        """Test failing rows still count as processed in a batch."""
+        generator = UUIDGenerator(test_config, instrument=True)
+        errors: list = []
+        generator.generate_many("invoice", [(1,), 42, (2,)], errors=errors)
+        assert len(errors) == 1
+        assert generator.stats().entities["invoice"].calls == 3  # type: ignore[union-attr]
+
+    def test_includes_cache_info(self, test_config: IDConfig) -> None:
+        """Test stats carry the cache statistics when a cache is enabled."""
+        generator = UUIDGenerator(test_config, instrument=True, cache_size=10)
+        for key in ["a", "b", "a", "a"]:
+            generator.generate("user", key)
+        stats = generator.stats()
+        assert stats is not None
+        assert stats.cache == generator.cache_info()
+        assert stats.cache is not None
+        assert stats.cache.hit_rate == 0.5
+        assert UUIDGenerator(instrument=True).stats().cache is None  # type: ignore[union-attr]
+
+    def test_threads_are_summed(self, test_config: IDConfig) -> None:
+        """Test per-thread counters are all included in the snapshot."""
+        generator = UUIDGenerator(test_config, instrument=True)
+        invoice = generator.for_entity("invoice")
+
+        def work() -> None:
+            for i in range(500):
+                invoice(i)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert generator.stats().entities["invoice"].calls == 2000  # type: ignore[union-attr]
+
+
+class TestModuleInstrumentation:
+    """Tests for enable(), disable() and stats()."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test nothing is recorded before enable()."""
+        generate_uuid_only("invoice", 1)
+        assert metrics.stats() is None
+
+    @pytest.mark.usefixtures("enabled")
+    def test_records_module_functions(self, test_config: IDConfig) -> None:
+        """Test the module-level functions are counted and still correct."""
+        expected = UUIDGenerator(test_config).generate("invoice", number=1)
+        assert generate_uuid_only("invoice", config=test_config, number=1) == expected
+        assert generate_uuid_int("invoice", config=test_config, number=1) == expected.int
+        assert generate_uuid_bytes("invoice", config=test_config, number=1) == expected.bytes
+        assert generate_uuid_with_prefix("invoice", prefix="INV", number=1).startswith("INV-")
+        assert list(generate_iter("order", [(i,) for i in range(5)], chunk_size=2)) == (
+            UUIDGenerator().generate_many("order", [(i,) for i in range(5)])
+        )
+
+        stats = metrics.stats()
+        assert stats is not None
+        assert stats.entities["invoice"].calls == 4
+        assert stats.entities["invoice"].latency.count == 4
+        order = stats.entities["order"]
+        assert (order.calls, order.batches) == (5, 3)
+
+    def test_enable_resets_counters(self) -> None:
+        """Test each enable() starts counting from zero."""
+        metrics.enable()
+        generate_uuid_only("invoice", 1)
+        metrics.enable()
+        try:
+            assert metrics.stats() == GeneratorStats(entities={}, cache=None)
+        finally:
+            metrics.disable()
+
+    @pytest.mark.usefixtures("enabled")
+    def test_exited_threads_are_folded(self) -> None:
+        """Test short-lived threads leave no shard behind and keep their counts."""
+        for number in range(500):
+            thread = threading.Thread(target=generate_uuid_only, args=("order", number))
+            thread.start()
+            thread.join()
+        gc.collect()
+        recorder = core._recorder
+        assert recorder is not None
+        assert len(recorder.entity("order")._shards) <= 1
+        stats = metrics.stats()
+        assert stats is not None
+        assert stats.entities["order"].calls == 500
+        assert stats.entities["order"].latency.count == 500
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_quantile(self) -> None:
+        """Test quantiles map to bucket upper bounds."""
+        histogram = Histogram(bounds=(10, 100, 1000), counts=(90, 9, 1, 0), total=0)
+        assert histogram.quantile(0.5) == 10
+        assert histogram.quantile(0.95) == 100
+        assert histogram.quantile(1.0) == 1000
+        assert Histogram(bounds=(10,), counts=(0, 0), total=0).quantile(0.5) == 0.0
+
+    def test_quantile_rejects_out_of_range(self) -> None:
+        """Test q outside [0, 1] raises ValueError."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            Histogram(bounds=(10,), counts=(1, 0), total=1).quantile(1.5)
+
+
+class TestToPrometheus:
+    """Tests for to_prometheus."""
+
+    def test_exposition_format(self, test_config: IDConfig) -> None:
+        """Test families, cumulative buckets and cache metrics are rendered."""
+        generator = UUIDGenerator(test_config, instrument=True, cache_size=10)
+        generator.generate("user", "a")
+        generator.generate("user", "a")
+        generator.generate_many("user", [("b",), ("c",)])
+        text = to_prometheus(generator.stats(), prefix="ids")  # type: ignore[arg-type]
+
+        assert text.endswith("\n")
+        lines = text.splitlines()
+        assert "# TYPE ids_ids_total counter" in lines
+        assert 'ids_ids_total{entity_type="user"} 4' in lines
+        assert "# TYPE ids_call_duration_seconds histogram" in lines
+        assert 'ids_call_duration_seconds_bucket{entity_type="user",le="+Inf"} 2' in lines
+        assert 'ids_call_duration_seconds_count{entity_type="user"} 2' in lines
+        assert 'ids_batch_rows_bucket{entity_type="user",le="1"} 0' in lines
+        assert 'ids_batch_rows_bucket{entity_type="user",le="10"} 1' in lines
+        assert 'ids_batch_rows_sum{entity_type="user"} 2' in lines
+        assert "ids_cache_hits_total 1" in lines
+        assert "ids_cache_entries 3" in lines
+        assert f"ids_cache_bytes {generator.cache_info().currbytes}" in lines  # type: ignore[union-attr]
+        phases = [line for line in lines if line.startswith("ids_phase_seconds_total{")]
+        assert len(phases) == 3
+
+        buckets = [
+            int(line.rsplit(" ", 1)[1])
+            for line in lines
+            if line.startswith("ids_call_duration_seconds_bucket")
+        ]
+        assert buckets == sorted(buckets)
+
+    def test_labels_are_escaped(self) -> None:
+        """Test constant and entity labels are escaped."""
+        generator = UUIDGenerator(instrument=True)
+        generator.generate('say "hi"\n', 1)
+        text = to_prometheus(generator.stats(), labels={"path": "C:\\ids"})  # type: ignore[arg-type]
+        assert 'uuid_forge_ids_total{path="C:\\\\ids",entity_type="say \\"hi\\"\\n"} 1' in text
+
+    def test_empty_stats(self) -> None:
+        """Test a generator with no calls renders only headers."""
+        text = to_prometheus(UUIDGenerator(instrument=True).stats())  # type: ignore[arg-type]
+        assert all(line.startswith("#") for line in text.splitlines())
@@ -0,0 +1,223 @@
+"""Tests for uuid_forge.parallel module."""
+
+import io
+import json
+import multiprocessing
+
+import pytest
+
+from uuid_forge.core import BatchRowError, IDConfig, UUIDGenerator
+from uuid_forge.parallel import (
+    ParallelUUIDGenerator,
+    ThreadedUUIDGenerator,
+    _PooledUUIDGenerator,
+    gil_enabled,
+    process_file,
+)
+from uuid_forge.records import EnrichSpec, InputFormat, OnError, enrich_stream, parse_keys
+
+
+@pytest.fixture
+def parallel_generator(test_config: IDConfig):
+    """Fixture providing a two-worker parallel generator."""
+    with ParallelUUIDGenerator(test_config, workers=2, chunk_size=7) as generator:
+        yield generator
+
+
+class TestParallelUUIDGenerator:
+    """Tests for ParallelUUIDGenerator."""
+
+    def test_matches_single_process(self, parallel_generator, test_config) -> None:
+        """Test that results match UUIDGenerator.generate_many in order."""
+        rows = [{"number": i, "region": "EUR"} for i in range(50)] + [(i,) for i in range(20)]
+        expected = UUIDGenerator(test_config).generate_many("invoice", rows)
+        assert parallel_generator.generate_many("invoice", rows) == expected
+
+    def test_accepts_iterators(self, parallel_generator, test_config) -> None:
+        """Test that lazily produced rows are processed in order."""
+        expected = UUIDGenerator(test_config).generate_many("item", [(i,) for i in range(30)])
+        result = list(parallel_generator.generate_iter("item", ((i,) for i in range(30))))
+        assert result == expected
+
+    def test_pool_is_reused(self, parallel_generator) -> None:
+        """Test that the worker pool persists across calls."""
+        parallel_generator.generate_many("item", [(1,)])
+        pool = parallel_generator._executor
+        parallel_generator.generate_many("item", [(2,)])
+        assert parallel_generator._executor is pool
+
+    def test_empty_input(self, parallel_generator) -> None:
+        """Test that empty input returns an empty list."""
+        assert parallel_generator.generate_many("item", []) == []
+
+    def test_collects_errors(self, parallel_generator) -> None:
+        """Test that row errors carry batch-relative indexes."""
+        rows = [(i,) for i in range(10)]
+        rows[8] = "bad"
+        errors: list[BatchRowError] = []
+        result = parallel_generator.generate_many("item", iter(rows), errors=errors)
+        assert result[8] is None
+        assert [error.index for error in errors] == [8]
+        assert isinstance(errors[0].error, TypeError)
+
+    def test_raises_on_bad_row(self, parallel_generator) -> None:
+        """Test that a bad row raises BatchRowError by default."""
+        with pytest.raises(BatchRowError) as exc_info:
+            parallel_generator.generate_many("item", [(1,), 2])
+        assert exc_info.value.index == 1
+
+    def test_close_and_restart(self, test_config) -> None:
+        """Test that a closed generator starts a fresh pool on next use."""
+        generator = ParallelUUIDGenerator(test_config, workers=1)
+        generator.generate_many("item", [(1,)])
+        generator.close()
+        assert generator._executor is None
+        assert generator.generate_many("item", [(1,)]) == [
+            UUIDGenerator(test_config).generate("item", 1)
+        ]
+        generator.close()
+
+    def test_spawn_context(self, test_config) -> None:
+        """Test that workers started with spawn receive the config."""
+        context = multiprocessing.get_context("spawn")
+        with ParallelUUIDGenerator(test_config, workers=1, mp_context=context) as generator:
+            assert generator.generate_many("item", [(1,)]) == [
+                UUIDGenerator(test_config).generate("item", 1)
+            ]
+
+    def test_invalid_arguments(self) -> None:
+        """Test argument validation."""
+        with pytest.raises(TypeError, match="config must be IDConfig"):
+            ParallelUUIDGenerator(config="invalid")  # type: ignore
+        with pytest.raises(ValueError, match="workers"):
+            ParallelUUIDGenerator(workers=0)
+        with pytest.raises(ValueError, match="chunk_size"):
+            ParallelUUIDGenerator(chunk_size=0)
+
+
+class TestThreadedUUIDGenerator:
+    """Tests for ThreadedUUIDGenerator."""
+
+    def test_matches_single_process(self, test_config) -> None:
+        """Test that results match UUIDGenerator.generate_many in order."""
+        rows = [{"number": i} for i in range(100)]
+        expected = UUIDGenerator(test_config).generate_many("invoice", rows)
+        with ThreadedUUIDGenerator(test_config, workers=4, chunk_size=9) as generator:
+            assert generator.generate_many("invoice", rows) == expected
+            assert list(generator.generate_iter("invoice", iter(rows))) == expected
+
+    def test_collects_errors(self, test_config) -> None:
+        """Test that row errors carry batch-relative indexes."""
+        rows = [(i,) for i in range(20)]
+        rows[13] = "bad"
+        errors: list[BatchRowError] = []
+        with ThreadedUUIDGenerator(test_config, workers=2, chunk_size=5) as generator:
+            result = generator.generate_many("item", rows, errors=errors)
+        assert result[13] is None
+        assert [error.index for error in errors] == [13]
+
+    def test_shares_generator(self, test_config) -> None:
+        """Test that worker threads share one generator and its compiled state."""
+        with ThreadedUUIDGenerator(test_config, workers=2, chunk_size=1) as generator:
+            generator.generate_many("item", [(1,), (2,), (3,)])
+            assert list(generator.generator._entities) == ["item"]
+
+
+def test_pool_engines_must_implement_hooks() -> None:
+    """Test that an engine missing a pool hook fails when it is created."""
+
+    class Incomplete(_PooledUUIDGenerator):
+        def _start_executor(self):
+            raise AssertionError("not reached")
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete(None, 1, 1)  # type: ignore[abstract]
+
+
+def test_gil_enabled_matches_interpreter() -> None:
+    """Test GIL detection against the running interpreter."""
+    import sys
+
+    expected = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    assert gil_enabled() is expected
+
+
+class TestProcessFile:
+    """Tests for process_file."""
+
+    def _expected(self, path, spec, config) -> str:
+        sink = io.StringIO()
+        with path.open(newline="") as source:
+            enrich_stream(source, sink, spec, config=config)
+        return sink.getvalue()
+
+    @pytest.mark.parametrize("shards", [1, 3, 16])
+    def test_csv_matches_enrich_stream(self, tmp_path, test_config, shards) -> None:
+        """Test sharded CSV output is byte-identical to single-stream output."""
+        source = tmp_path / "in.csv"
+        rows = "".join(f'EUR,{i},"note, {i}é"\r\n' for i in range(500))
+        source.write_text(f"region,number,note\r\n{rows}", newline="")
+        spec = EnrichSpec("invoice", parse_keys(["region", "number"]))
+        target = tmp_path / "out.csv"
+        result = process_file(source, target, spec, config=test_config, workers=2, shards=shards)
+        assert result == (500, 0)
+        assert target.read_text(newline="") == self._expected(source, spec, test_config)
+
+    def test_jsonl_without_trailing_newline(self, tmp_path, test_config) -> None:
+        """Test JSONL input whose last record has no newline."""
+        source = tmp_path / "in.jsonl"
+        source.write_text("\n".join(json.dumps({"customer": {"id": i}}) for i in range(100)))
+        spec = EnrichSpec("order", parse_keys(["cid=customer.id"]), InputFormat.JSONL)
+        target = tmp_path / "out.jsonl"
+        assert process_file(source, target, spec, config=test_config, shards=4) == (100, 0)
+        assert target.read_text() == self._expected(source, spec, test_config)
+
+    def test_fail_reports_global_index(self, tmp_path, test_config) -> None:
+        """Test the failing record is indexed over the whole file."""
+        source = tmp_path / "in.jsonl"
+        lines = [json.dumps({"n": i}) for i in range(300)]
+        lines[217] = "not json"
+        source.write_text("\n".join(lines) + "\n")
+        spec = EnrichSpec("x", parse_keys(["n"]), InputFormat.JSONL, ids_only=True)
+        target = tmp_path / "out.txt"
+        with pytest.raises(BatchRowError) as exc_info:
+            process_file(source, target, spec, config=test_config, workers=2, shards=5)
+        assert exc_info.value.index == 217
+        assert len(target.read_text().splitlines()) == 217
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["in.jsonl", "out.txt"]
+
+    @pytest.mark.parametrize("on_error", [OnError.SKIP, OnError.EMIT_EMPTY])
+    def test_collecting_policies(self, tmp_path, test_config, on_error) -> None:
+        """Test skip and emit-empty match single-stream output and counts."""
+        source = tmp_path / "in.csv"
+        source.write_text("a,b\n" + "".join("1\n" if i % 7 else f"{i},x\n" for i in range(50)))
+        spec = EnrichSpec("x", parse_keys(["b"]), on_error=on_error)
+        target = tmp_path / "out.csv"
+        assert process_file(source, target, spec, config=test_config, shards=3) == (50, 42)
+        assert target.read_text(newline="") == self._expected(source, spec, test_config)
+
+    def test_empty_input(self, tmp_path, test_config) -> None:
+        """Test an empty JSONL file and a header-only CSV file."""
+        source = tmp_path / "in.jsonl"
+        source.write_text("")
+        spec = EnrichSpec("x", parse_keys(["n"]), InputFormat.JSONL)
+        assert process_file(source, tmp_path / "out.jsonl", spec, config=test_config) == (0, 0)
+        assert (tmp_path / "out.jsonl").read_text() == ""
+
+        source = tmp_path / "in.csv"
+        source.write_text("n\n")
+        spec = EnrichSpec("x", parse_keys(["n"]))
+        assert process_file(source, tmp_path / "out.csv", spec, config=test_config) == (0, 0)
+        assert (tmp_path / "out.csv").read_text() == "n,id\n"
+
+    def test_validation(self, tmp_path) -> None:
+        """Test arguments and CSV keys are checked before processing."""
+        source = tmp_path / "in.csv"
+        source.write_text("a\n1\n")
+        spec = EnrichSpec("x", parse_keys(["a"]))
+        with pytest.raises(TypeError, match="config must be IDConfig"):
+            process_file(source, tmp_path / "out", spec, config="invalid")  # type: ignore
+        with pytest.raises(ValueError, match="workers"):
+            process_file(source, tmp_path / "out", spec, workers=0)
+        with pytest.raises(ValueError, match="not found in CSV header"):
+            process_file(source, tmp_path / "out", EnrichSpec("x", parse_keys(["b"])))
@@ -0,0 +1,219 @@
+"""Tests for uuid_forge.records module."""
+
+import io
+
+import pytest
+
+from uuid_forge.core import BatchRowError, IDConfig, UUIDGenerator
+from uuid_forge.records import (
+    Checkpoint,
+    EnrichSpec,
+    InputFormat,
+    OnError,
+    _Enricher,
+    enrich_file,
+    enrich_stream,
+    parse_keys,
+)
+
+
+class TestParseKeys:
+    """Tests for parse_keys."""
+
+    def test_plain_and_renamed(self) -> None:
+        """Test NAME and NAME=COLUMN forms."""
+        assert parse_keys(["a", " b = c.d "]) == (("a", "a"), ("b", "c.d"))
+
+    @pytest.mark.parametrize("keys", [["=a"], ["a", "a=b"]])
+    def test_invalid(self, keys) -> None:
+        """Test empty and duplicate names are rejected."""
+        with pytest.raises(ValueError):
+            parse_keys(keys)
+
+
+def test_input_format_from_path() -> None:
+    """Test format inference from file extensions."""
+    assert InputFormat.from_path("a.JSONL") is InputFormat.JSONL
+    assert InputFormat.from_path("a.ndjson") is InputFormat.JSONL
+    assert InputFormat.from_path("a.txt") is InputFormat.CSV
+
+
+class TestEnrichStream:
+    """Tests for enrich_stream."""
+
+    def test_csv_ids_match_generator(self, test_config: IDConfig) -> None:
+        """Test CSV IDs equal UUIDGenerator IDs for the string values."""
+        sink = io.StringIO()
+        spec = EnrichSpec("invoice", parse_keys(["region", "n=number"]), prefix="INV")
+        source = io.StringIO("region,number\nEUR,1\nUSD,2\n")
+        assert enrich_stream(source, sink, spec, config=test_config, chunk_size=1) == (2, 0)
+        generator = UUIDGenerator(test_config)
+        expected = [
+            f"INV-{generator.generate('invoice', region=region, n=number)}"
+            for region, number in (("EUR", "1"), ("USD", "2"))
+        ]
+        lines = sink.getvalue().splitlines()
+        assert lines[0] == "region,number,id"
+        assert [line.rsplit(",", 1)[1] for line in lines[1:]] == expected
+
+    def test_jsonl_keeps_types(self, test_config: IDConfig) -> None:
+        """Test JSONL values keep their JSON types."""
+        sink = io.StringIO()
+        spec = EnrichSpec("order", parse_keys(["n"]), InputFormat.JSONL, ids_only=True)
+        source = io.StringIO('{"n": 1}\n\n{"n": "1"}\n')
+        assert enrich_stream(source, sink, spec, config=test_config) == (2, 0)
+        generator = UUIDGenerator(test_config)
+        assert sink.getvalue().split() == [
+            str(generator.generate("order", n=1)),
+            str(generator.generate("order", n="1")),
+        ]
+
+    def test_fail_writes_preceding_records(self, test_config: IDConfig) -> None:
+        """Test FAIL raises with the global index after writing earlier records."""
+        sink = io.StringIO()
+        spec = EnrichSpec("x", parse_keys(["a"]), ids_only=True, on_error=OnError.FAIL)
+        source = io.StringIO("a,b\n1,2\n2,3\n\n4,5\n")
+        with pytest.raises(BatchRowError) as exc_info:
+            enrich_stream(source, sink, spec, config=test_config, chunk_size=2)
+        assert exc_info.value.index == 2
+        assert len(sink.getvalue().splitlines()) == 2
+
+
+class TestEnrichFile:
+    """Tests for enrich_file checkpointing and resume."""
+
+    SPEC = EnrichSpec("invoice", parse_keys(["a", "b"]))
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        """A CSV file with CRLF line endings and multi-line quoted fields."""
+        path = tmp_path / "in.csv"
+        rows = "".join(f'{i},"line\r\nbreak {i}é"\r\n' for i in range(500))
+        path.write_text(f"a,b\r\n{rows}", encoding="utf-8", newline="")
+        return path
+
+    def _expected(self, source, config) -> str:
+        sink = io.StringIO()
+        with source.open(encoding="utf-8", newline="") as file:
+            enrich_stream(file, sink, self.SPEC, config=config)
+        return sink.getvalue()
+
+    def test_matches_enrich_stream(self, source, tmp_path, test_config) -> None:
+        """Test output equals enrich_stream and the checkpoint is removed."""
+        target = tmp_path / "out.csv"
+        assert enrich_file(source, target, self.SPEC, config=test_config, chunk_size=7) == (500, 0)
+        assert target.read_text(encoding="utf-8", newline="") == self._expected(source, test_config)
+        assert not (tmp_path / "out.csv.checkpoint").exists()
+
+    def test_resume_after_interruption(self, source, tmp_path, test_config, monkeypatch) -> None:
+        """Test a resumed run neither duplicates nor skips records."""
+        render = _Enricher._render
+        calls = []
+
+        def interrupt(self, pairs):
+            calls.append(len(pairs))
+            if len(calls) == 9:
+                raise KeyboardInterrupt
+            return render(self, pairs)
+
+        monkeypatch.setattr(_Enricher, "_render", interrupt)
+        target = tmp_path / "out.csv"
+        options = {"config": test_config, "chunk_size": 20, "checkpoint_every": 50}
+        with pytest.raises(KeyboardInterrupt):
+            enrich_file(source, target, self.SPEC, **options)
+        checkpoint = Checkpoint.load(tmp_path / "out.csv.checkpoint")
+        assert checkpoint.processed == 120
+        assert target.stat().st_size > checkpoint.output_offset
+
+        monkeypatch.setattr(_Enricher, "_render", render)
+        # Output written after the checkpoint, including a torn write, is discarded
+        with target.open("a") as file:
+            file.write("partial,row")
+        assert enrich_file(source, target, self.SPEC, resume=True, **options) == (500, 0)
+        assert target.read_text(encoding="utf-8", newline="") == self._expected(source, test_config)
+
+    def test_resume_without_checkpoint_starts_over(self, source, tmp_path, test_config) -> None:
+        """Test resume=True without a checkpoint runs the whole job."""
+        target = tmp_path / "out.csv"
+        target.write_text("stale")
+        assert enrich_file(source, target, self.SPEC, config=test_config, resume=True) == (500, 0)
+        assert target.read_text(encoding="utf-8", newline="") == self._expected(source, test_config)
+
+    def test_rejects_other_configuration(self, source, tmp_path, test_config) -> None:
+        """Test a checkpoint from a different salt or spec is refused."""
+        target = tmp_path / "out.csv"
+        checkpoint = tmp_path / "job.checkpoint"
+        target.write_text("")
+        Checkpoint(0, 0, 0, 0, "other", "other").save(checkpoint)
+        with pytest.raises(ValueError, match="different configuration"):
+            enrich_file(
+                source,
+                target,
+                self.SPEC,
+                config=test_config,
+                resume=True,
+                checkpoint_path=checkpoint,
+            )
+
+    def test_rejects_other_input(self, source, tmp_path, test_config, monkeypatch) -> None:
+        """Test a checkpoint is refused for another input file or a changed one."""
+        render = _Enricher._render
+        calls = []
+
+        def interrupt(self, pairs):
+            calls.append(len(pairs))
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return render(self, pairs)
+
+        target = tmp_path / "out.csv"
+        options = {"config": test_config, "chunk_size": 20, "checkpoint_every": 20}
+        # Same contents under another name, as when a job is rerun on a new export
+        other = tmp_path / "other.csv"
+        other.write_bytes(source.read_bytes())
+        monkeypatch.setattr(_Enricher, "_render", interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            enrich_file(source, target, self.SPEC, **options)
+        monkeypatch.setattr(_Enricher, "_render", render)
+        with pytest.raises(ValueError, match="another input"):
+            enrich_file(other, target, self.SPEC, resume=True, **options)
+
+        with source.open("ab") as file:
+            file.write(b"500,x\r\n")
+        with pytest.raises(ValueError, match="has changed"):
+            enrich_file(source, target, self.SPEC, resume=True, **options)
+
+    def test_fresh_run_drops_old_checkpoint(
+        self, source, tmp_path, test_config, monkeypatch
+    ) -> None:
+        """Test a run started without resume discards an earlier job's checkpoint."""
+        render = _Enricher._render
+        target = tmp_path / "out.csv"
+        options = {"config": test_config, "chunk_size": 20, "checkpoint_every": 20}
+        calls = []
+
+        def interrupt(self, pairs):
+            calls.append(len(pairs))
+            if len(calls) in (3, 4):
+                raise KeyboardInterrupt
+            return render(self, pairs)
+
+        monkeypatch.setattr(_Enricher, "_render", interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            enrich_file(source, target, self.SPEC, **options)
+        assert (tmp_path / "out.csv.checkpoint").exists()
+        # A new job dies before its first checkpoint
+        with pytest.raises(KeyboardInterrupt):
+            enrich_file(source, target, self.SPEC, **options)
+        assert not (tmp_path / "out.csv.checkpoint").exists()
+
+        monkeypatch.setattr(_Enricher, "_render", render)
+        assert enrich_file(source, target, self.SPEC, resume=True, **options) == (500, 0)
+        assert target.read_text(encoding="utf-8", newline="") == self._expected(source, test_config)
+
+    def test_invalid_checkpoint(self, tmp_path) -> None:
+        """Test loading a file that is not a checkpoint."""
+        path = tmp_path / "bad.checkpoint"
+        path.write_text('{"version": 1, "offset": 3}')
+        with pytest.raises(ValueError, match="not a uuid-forge checkpoint"):
+            Checkpoint.load(path)
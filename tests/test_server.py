@@ -0,0 +1,277 @@
+"""Tests for uuid_forge.server module."""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from uuid_forge import server as server_module
+from uuid_forge.bench import run_server_benchmark
+from uuid_forge.core import IDConfig, UUIDGenerator, generate_uuid_with_prefix
+from uuid_forge.server import serve, start_server
+
+
+def post(path: str, payload: Any, *, headers: str = "") -> bytes:
+    """Build a POST request with a JSON body."""
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    return (
+        f"POST {path} HTTP/1.1\r\nHost: test\r\n{headers}Content-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple[int, dict[str, str], Any]:
+    """Read one response and return its status, headers and decoded body."""
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    status_line, *lines = head.rstrip("\r\n").split("\r\n")
+    headers = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        headers[name.lower()] = value.strip()
+    body = await reader.readexactly(int(headers["content-length"]))
+    return int(status_line.split(" ")[1]), headers, json.loads(body)
+
+
+def run(
+    config: IDConfig, scenario: Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable]
+) -> Any:
+    """Run ``scenario`` against a fresh server on a free port."""
+
+    async def main() -> Any:
+        server = await start_server(config, port=0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            return await scenario(reader, writer)
+        finally:
+            writer.close()
+            server.close()
+
+    return asyncio.run(main())
+
+
+def request(config: IDConfig, raw: bytes) -> tuple[int, dict[str, str], Any]:
+    """Send one raw request and return its response."""
+
+    async def scenario(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Any:
+        writer.write(raw)
+        return await read_response(reader)
+
+    return run(config, scenario)
+
+
+class TestEndpoints:
+    """Tests for the JSON endpoints."""
+
+    def test_health(self, test_config: IDConfig) -> None:
+        """Test the health endpoint reports the version."""
+        from uuid_forge import __version__
+
+        status, headers, body = request(test_config, b"GET /health HTTP/1.1\r\n\r\n")
+        assert status == 200
+        assert headers["content-type"] == "application/json"
+        assert body == {"status": "ok", "version": __version__}
+
+    def test_single_id_matches_python(self, test_config: IDConfig) -> None:
+        """Test /v1/id returns what generate_uuid_with_prefix returns."""
+        payload = {"entity_type": "invoice", "args": ["EUR"], "kwargs": {"number": 1}}
+        status, _, body = request(test_config, post("/v1/id", payload))
+        assert status == 200
+        assert body["id"] == str(UUIDGenerator(test_config).generate("invoice", "EUR", number=1))
+
+        payload.update(prefix="INV", separator="_")
+        _, _, body = request(test_config, post("/v1/id", payload))
+        assert body["id"] == generate_uuid_with_prefix(
+            "invoice", "EUR", config=test_config, prefix="INV", separator="_", number=1
+        )
+
+    def test_batch_matches_python(self, test_config: IDConfig) -> None:
+        """Test /v1/ids returns generate_many results for object and array rows."""
+        rows: list[Any] = [{"number": i, "amount": i / 2} for i in range(50)]
+        rows += [[i, "x"] for i in range(50)]
+        status, _, body = request(
+            test_config, post("/v1/ids", {"entity_type": "order", "rows": rows})
+        )
+        assert status == 200
+        expected = UUIDGenerator(test_config).generate_many(
+            "order", [tuple(row) if isinstance(row, list) else row for row in rows]
+        )
+        assert body == {"ids": [str(uuid) for uuid in expected], "errors": []}
+
+    def test_batch_prefix_and_row_errors(self, test_config: IDConfig) -> None:
+        """Test prefixed batch IDs and null entries for rows that fail."""
+        payload = {"entity_type": "order", "rows": [[1], 5, {"n": 2}], "prefix": "ORD"}
+        status, _, body = request(test_config, post("/v1/ids", payload))
+        assert status == 200
+        assert body["ids"][1] is None
+        assert body["ids"][0] == generate_uuid_with_prefix(
+            "order", 1, config=test_config, prefix="ORD"
+        )
+        assert body["ids"][2].startswith("ORD-")
+        assert [error["index"] for error in body["errors"]] == [1]
+
+    @pytest.mark.parametrize(
+        ("raw", "status", "message"),
+        [
+            (b"GET /nope HTTP/1.1\r\n\r\n", 404, "no such endpoint"),
+            (b"GET /v1/id HTTP/1.1\r\n\r\n", 405, "only accepts POST"),
+            (b"POST /health HTTP/1.1\r\nContent-Length: 0\r\n\r\n", 405, "only accepts GET"),
+            (post("/v1/id", b"{bad"), 400, "invalid JSON"),
+            (post("/v1/id", [1]), 400, "JSON object"),
+            (post("/v1/id", {"entity_type": 1}), 400, "entity_type"),
+            (post("/v1/id", {"entity_type": "a", "args": {}}), 400, "args must be a JSON array"),
+            (post("/v1/id", {"entity_type": "a", "prefix": 1}), 400, "prefix"),
+            (post("/v1/ids", {"entity_type": "a"}), 400, "rows must be a JSON array"),
+        ],
+    )
+    def test_errors(self, test_config: IDConfig, raw: bytes, status: int, message: str) -> None:
+        """Test invalid requests get an error status and message."""
+        code, _, body = request(test_config, raw)
+        assert code == status
+        assert message in body["error"]
+
+
+class TestHTTP:
+    """Tests for connection handling."""
+
+    @pytest.mark.parametrize(
+        ("raw", "status"),
+        [
+            (b"POST /v1/id HTTP/1.1\r\n\r\n", 411),
+            (b"POST /v1/id HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n", 501),
+            (b"POST /v1/id HTTP/1.1\r\nContent-Length: 99999999999\r\n\r\n", 413),
+            (b"POST /v1/id HTTP/1.1\r\nContent-Length: -1\r\n\r\n", 400),
+            (b"POST /v1/id HTTP/1.1\r\nContent-Length: \xb2\r\n\r\n", 400),
+            (b"garbage\r\n\r\n", 400),
+        ],
+    )
+    def test_framing_errors_close(self, test_config: IDConfig, raw: bytes, status: int) -> None:
+        """Test requests that cannot be framed are answered and the connection closed."""
+
+        async def scenario(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Any:
+            writer.write(raw)
+            code, headers, _ = await read_response(reader)
+            return code, headers, await reader.read()
+
+        code, headers, rest = run(test_config, scenario)
+        assert (code, headers["connection"], rest) == (status, "close", b"")
+
+    def test_header_limit(self, test_config: IDConfig) -> None:
+        """Test oversized headers are rejected with 431."""
+        raw = b"GET /health HTTP/1.1\r\nX: " + b"a" * server_module.MAX_HEADER_BYTES
+        status, _, _ = request(test_config, raw)
+        assert status == 431
+
+    def test_pipelining_and_keep_alive(self, test_config: IDConfig) -> None:
+        """Test pipelined requests in one write are answered in order on one connection."""
+
+        async def scenario(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Any:
+            writer.write(
+                post("/v1/id", {"entity_type": "a", "args": [1]})
+                + b"GET /health HTTP/1.1\r\n\r\n"
+                + post("/v1/id", {"entity_type": "a", "args": [2]})
+            )
+            responses = [await read_response(reader) for _ in range(3)]
+            writer.write(b"GET /nope HTTP/1.1\r\n\r\n")
+            responses.append(await read_response(reader))
+            return responses
+
+        responses = run(test_config, scenario)
+        assert [status for status, _, _ in responses] == [200, 200, 200, 404]
+        assert all("connection" not in headers for _, headers, _ in responses)
+        generator = UUIDGenerator(test_config)
+        assert responses[0][2]["id"] == str(generator.generate("a", 1))
+        assert responses[1][2]["status"] == "ok"
+        assert responses[2][2]["id"] == str(generator.generate("a", 2))
+
+    @pytest.mark.parametrize(
+        ("version", "connection", "closed"),
+        [
+            ("HTTP/1.1", "", False),
+            ("HTTP/1.1", "Connection: close\r\n", True),
+            ("HTTP/1.0", "", True),
+            ("HTTP/1.0", "Connection: keep-alive\r\n", False),
+        ],
+    )
+    def test_connection_close(
+        self, test_config: IDConfig, version: str, connection: str, closed: bool
+    ) -> None:
+        """Test HTTP/1.0 and Connection: close end the connection after the response."""
+
+        async def scenario(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Any:
+            writer.write(f"GET /health {version}\r\n{connection}\r\n".encode())
+            _, headers, _ = await read_response(reader)
+            try:
+                rest = await asyncio.wait_for(reader.read(), 0.2)
+            except TimeoutError:
+                return headers, False
+            return headers, rest == b""
+
+        headers, eof = run(test_config, scenario)
+        assert eof is closed
+        assert (headers.get("connection") == "close") is closed
+
+    def test_expect_continue(self, test_config: IDConfig) -> None:
+        """Test 100 Continue is sent before the body, then the real response."""
+
+        async def scenario(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Any:
+            body = json.dumps({"entity_type": "a", "args": [1]}).encode()
+            writer.write(
+                f"POST /v1/id HTTP/1.1\r\nExpect: 100-continue\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode()
+            )
+            interim = await reader.readuntil(b"\r\n\r\n")
+            writer.write(body)
+            return interim, await read_response(reader)
+
+        interim, (status, _, body) = run(test_config, scenario)
+        assert interim == b"HTTP/1.1 100 Continue\r\n\r\n"
+        assert status == 200
+        assert body["id"] == str(UUIDGenerator(test_config).generate("a", 1))
+
+    def test_split_request(self, test_config: IDConfig) -> None:
+        """Test a request arriving in small pieces is answered once complete."""
+
+        async def scenario(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Any:
+            raw = post("/v1/ids", {"entity_type": "a", "rows": [[1], [2]]})
+            for i in range(0, len(raw), 7):
+                writer.write(raw[i : i + 7])
+                await writer.drain()
+                await asyncio.sleep(0)
+            return await read_response(reader)
+
+        status, _, body = run(test_config, scenario)
+        assert status == 200
+        assert len(body["ids"]) == 2
+
+
+class TestServe:
+    """Tests for serve() and the server benchmark."""
+
+    def test_validation(self) -> None:
+        """Test invalid arguments are rejected before listening."""
+        with pytest.raises(TypeError):
+            serve("invalid")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="at least 1"):
+            serve(workers=0)
+        with pytest.raises(ValueError, match="port 0"):
+            serve(port=0, workers=2)
+
+    def test_start_server_rejects_invalid_config(self) -> None:
+        """Test start_server checks the config type."""
+        with pytest.raises(TypeError):
+            asyncio.run(start_server("invalid", port=0))  # type: ignore[arg-type]
+
+    def test_server_benchmark(self, id_server: int) -> None:
+        """Test run_server_benchmark counts whole requests of IDs."""
+        result = run_server_benchmark(port=id_server, count=250, batch_size=100, repeat=1)
+        assert (result.benchmark, result.count, result.workers) == ("serve /v1/ids", 300, 4)
+        assert result.ids_per_second > 0
+
+    def test_server_benchmark_validation(self) -> None:
+        """Test invalid benchmark arguments are rejected before connecting."""
+        with pytest.raises(ValueError):
+            run_server_benchmark(count=0)
+        with pytest.raises(ValueError, match="Unknown name"):
+            run_server_benchmark(payload="huge")
@@ -0,0 +1,182 @@
+"""Tests for uuid_forge.shared_cache module."""
+
+import os
+import subprocess
+import sys
+import warnings
+from collections.abc import Iterator
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from uuid_forge.core import CacheInfo, EntitySchema, IDConfig, UUIDGenerator
+from uuid_forge.shared_cache import SharedUUIDCache
+
+
+@pytest.fixture
+def cache() -> Iterator[SharedUUIDCache]:
+    """Fixture providing a small shared cache, unlinked afterwards."""
+    with SharedUUIDCache(64) as shared:
+        yield shared
+
+
+class TestSharedUUIDCache:
+    """Tests for lookups, eviction and statistics."""
+
+    def test_matches_generator(self, cache: SharedUUIDCache, test_config: IDConfig) -> None:
+        """Test every generator method returns uncached results through the cache."""
+        generator = UUIDGenerator(test_config, cache=cache)
+        plain = UUIDGenerator(test_config)
+        for _ in range(2):
+            value = generator.generate("invoice", "EUR", number=1)
+            assert value == plain.generate("invoice", "EUR", number=1)
+            assert value.version == 5
+            assert str(value) == str(plain.generate("invoice", "EUR", number=1))
+            assert generator.generate_int("invoice", 2) == plain.generate_int("invoice", 2)
+            assert generator.generate_bytes("invoice", 3) == plain.generate_bytes("invoice", 3)
+        rows = [(i % 5,) for i in range(20)]
+        assert generator.generate_many("order", rows) == plain.generate_many("order", rows)
+
+        schema = EntitySchema("invoice", fields=("region", "number"))
+        assert generator.for_schema(schema)("EUR", 1) == (
+            generator.generate("invoice", region="EUR", number=1)
+        )
+
+        info = generator.cache_info()
+        assert info is not None
+        assert (info.hits, info.misses, info.currsize) == (19, 9, 9)
+
+    def test_eviction_stays_bounded(self, test_config: IDConfig) -> None:
+        """Test a full bucket replaces entries and results stay correct."""
+        with SharedUUIDCache(5) as cache:
+            assert cache.maxsize == 8
+            generator = UUIDGenerator(test_config, cache=cache)
+            plain = UUIDGenerator(test_config)
+            for _ in range(2):
+                assert [generator.generate("user", i) for i in range(20)] == [
+                    plain.generate("user", i) for i in range(20)
+                ]
+            info = cache.info()
+            assert (info.currsize, info.maxsize) == (8, 8)
+            assert info.evictions == info.misses - 8
+            assert info.hits + info.misses == 40
+
+    def test_clear(self, cache: SharedUUIDCache) -> None:
+        """Test clear drops all entries and resets the counters."""
+        generator = UUIDGenerator(cache=cache)
+        generator.generate("user", 1)
+        generator.generate("user", 1)
+        generator.cache_clear()
+        assert cache.info() == CacheInfo(0, 0, 0, 64, 0, 64 * 32, 0)
+        generator.generate("user", 1)
+        assert cache.info().misses == 1
+
+    def test_damaged_entry_is_a_miss(self, cache: SharedUUIDCache) -> None:
+        """Test an entry failing its checksum is recomputed and rewritten."""
+        generator = UUIDGenerator(cache=cache)
+        expected = generator.generate("user", 1)
+        fingerprints = cache._table[::4].tolist()
+        at = next(i for i, fingerprint in enumerate(fingerprints) if fingerprint) * 4
+        cache._table[at + 2] ^= 1
+        assert generator.generate("user", 1) == expected
+        assert (cache.info().hits, cache.info().misses) == (0, 2)
+        assert generator.generate("user", 1) == expected
+        assert cache.info().hits == 1
+
+    def test_shared_across_fork(self, cache: SharedUUIDCache, test_config: IDConfig) -> None:
+        """Test entries written by a forked child are hits in the parent."""
+        generator = UUIDGenerator(test_config, cache=cache)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            for i in range(10):
+                generator.generate("user", i)
+            os._exit(0)
+        _, status = os.waitpid(pid, 0)
+        assert status == 0
+        assert cache.info().currsize == 10
+        assert [generator.generate("user", i) for i in range(10)] == [
+            UUIDGenerator(test_config).generate("user", i) for i in range(10)
+        ]
+        assert (cache.info().hits, cache.info().misses) == (10, 0)
+
+
+class TestLifecycle:
+    """Tests for attaching, binding and closing."""
+
+    def test_attach_by_name(self, test_config: IDConfig) -> None:
+        """Test a cache attached by name sees the creator's entries."""
+        with SharedUUIDCache(64, name=f"uuid-forge-test-{os.getpid()}") as cache:
+            UUIDGenerator(test_config, cache=cache).generate("user", 1)
+            other = SharedUUIDCache.attach(cache.name)
+            with other:
+                assert UUIDGenerator(test_config, cache=other).generate("user", 1) == (
+                    UUIDGenerator(test_config).generate("user", 1)
+                )
+                assert other.info().hits == 1
+                with pytest.raises(FileExistsError):
+                    SharedUUIDCache(64, name=cache.name)
+            # Closing an attached cache leaves the segment in place
+            SharedUUIDCache.attach(cache.name).close()
+        with pytest.raises(FileNotFoundError):
+            SharedUUIDCache.attach(cache.name)
+
+    def test_attach_rejects_foreign_segments(self) -> None:
+        """Test attach checks the layout."""
+        shm = SharedMemory(create=True, size=128)
+        try:
+            with pytest.raises(ValueError, match="not a uuid-forge shared cache"):
+                SharedUUIDCache.attach(shm.name)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_attach_from_another_hash_seed(self, test_config: IDConfig) -> None:
+        """Test a process with another PYTHONHASHSEED finds the creator's entries."""
+        with SharedUUIDCache(64) as cache:
+            generator = UUIDGenerator(test_config, cache=cache)
+            expected = generator.generate("user", 1)
+            code = (
+                "from uuid_forge.core import IDConfig, UUIDGenerator\n"
+                "from uuid_forge.shared_cache import SharedUUIDCache\n"
+                f"with SharedUUIDCache.attach({cache.name!r}) as cache:\n"
+                f"    generator = UUIDGenerator(IDConfig(salt={test_config.salt!r}), cache=cache)\n"
+                "    print(generator.generate('user', 1), cache.info().hits)\n"
+            )
+            env = {**os.environ, "PYTHONHASHSEED": "12345"}
+            result = subprocess.run(
+                [sys.executable, "-c", code], env=env, capture_output=True, text=True, timeout=60
+            )
+            assert result.stdout.split() == [str(expected), "1"], result.stderr
+
+    def test_fingerprints_are_keyed_per_cache(self) -> None:
+        """Test each cache draws its own fingerprint key."""
+        with SharedUUIDCache(8) as first, SharedUUIDCache(8) as second:
+            assert first._key != second._key
+            with SharedUUIDCache.attach(first.name) as attached:
+                assert attached._key == first._key
+
+    def test_bound_to_one_config(self, cache: SharedUUIDCache, test_config: IDConfig) -> None:
+        """Test generators with another namespace or salt cannot share a cache."""
+        UUIDGenerator(test_config, cache=cache)
+        UUIDGenerator(test_config, cache=cache)
+        with pytest.raises(ValueError, match="another namespace or salt"):
+            UUIDGenerator(IDConfig(salt="other-salt"), cache=cache)
+        generator = UUIDGenerator(test_config, cache=cache)
+        with pytest.raises(ValueError, match="another namespace or salt"):
+            generator.config = IDConfig(salt="other-salt")
+        assert generator.config == test_config
+
+    def test_validation(self, cache: SharedUUIDCache) -> None:
+        """Test invalid arguments are rejected."""
+        with pytest.raises(ValueError, match="at least 1"):
+            SharedUUIDCache(0)
+        with pytest.raises(ValueError, match="not both"):
+            UUIDGenerator(cache_size=10, cache=cache)
+        with pytest.raises(ValueError, match="not both"):
+            UUIDGenerator(cache_bytes=10_000, cache=cache)
+
+    def test_repr(self, cache: SharedUUIDCache) -> None:
+        """Test the representation shows the name and size."""
+        assert repr(cache) == f"SharedUUIDCache(name={cache.name!r}, maxsize=64)"
@@ -0,0 +1,351 @@
+"""Tests for uuid_forge.sidecar module."""
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import uuid
+import warnings
+from collections.abc import Iterator
+
+import pytest
+
+from uuid_forge.core import BatchRowError, IDConfig, UUIDGenerator
+from uuid_forge.sidecar import SidecarClient, SidecarServer, SidecarUnavailableError
+
+
+class BadRepr:
+    """A value whose normalization fails."""
+
+    def __repr__(self) -> str:
+        raise ValueError("cannot represent")
+
+
+class StubbornError(Exception):
+    """An exception that cannot be rebuilt after pickling."""
+
+    def __init__(self, first: str, second: str) -> None:
+        super().__init__(f"{first} {second}")
+
+
+class Unpicklable:
+    """A value whose normalization raises StubbornError."""
+
+    def __repr__(self) -> str:
+        raise StubbornError("no", "way")
+
+
+@pytest.fixture
+def name() -> Iterator[str]:
+    """Fixture providing a unique sidecar name."""
+    yield f"uuid-forge-test-{uuid.uuid4().hex[:12]}"
+
+
+def start(config: IDConfig, name: str, **kwargs) -> tuple[SidecarServer, threading.Thread]:
+    """Create a server and serve it on a background thread."""
+    server = SidecarServer(config, name, idle_sleep=0.0001, **kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, thread
+
+
+def stop(server: SidecarServer, thread: threading.Thread) -> None:
+    """Close a server started with start()."""
+    server.close()
+    thread.join(10)
+
+
+@pytest.fixture
+def running(test_config: IDConfig, name: str) -> Iterator[SidecarServer]:
+    """Fixture providing a serving sidecar with small slots."""
+    server, thread = start(test_config, name, slots=4, slot_size=4096)
+    yield server
+    stop(server, thread)
+
+
+class TestClient:
+    """Tests for SidecarClient calls."""
+
+    def test_matches_generator(self, running: SidecarServer, test_config: IDConfig) -> None:
+        """Test single calls return what UUIDGenerator returns."""
+        generator = UUIDGenerator(test_config)
+        with SidecarClient(running.name) as client:
+            expected = generator.generate("invoice", "EUR", number=1)
+            assert client.generate("invoice", "EUR", number=1) == expected
+            assert client.generate_int("invoice", "EUR", number=1) == expected.int
+            assert client.generate_bytes("invoice", "EUR", number=1) == expected.bytes
+
+    def test_generate_many_splits_to_fit(
+        self, running: SidecarServer, test_config: IDConfig
+    ) -> None:
+        """Test batches larger than a slot are split and stay in order."""
+        rows = [{"number": i, "region": "EUR"} for i in range(3000)]
+        with SidecarClient(running.name) as client:
+            assert client.generate_many("invoice", iter(rows)) == (
+                UUIDGenerator(test_config).generate_many("invoice", rows)
+            )
+            assert client.generate_many("invoice", []) == []
+
+    def test_generate_many_with_cache(self, test_config: IDConfig, name: str) -> None:
+        """Test a caching server answers batches identically."""
+        server, thread = start(test_config, name, cache_size=100)
+        try:
+            rows = [(i % 10,) for i in range(50)]
+            with SidecarClient(name) as client:
+                assert client.generate_many("order", rows) == (
+                    UUIDGenerator(test_config).generate_many("order", rows)
+                )
+            assert server.generator.cache_info().hits == 40  # type: ignore[union-attr]
+        finally:
+            stop(server, thread)
+
+    def test_row_errors(self, running: SidecarServer) -> None:
+        """Test failing rows are collected or raised as BatchRowError."""
+        rows = [(1,), 42, (2,), (BadRepr(),)]
+        with SidecarClient(running.name) as client:
+            errors: list[BatchRowError] = []
+            uuids = client.generate_many("order", rows, errors=errors)
+            assert [u is None for u in uuids] == [False, True, False, True]
+            assert [(e.index, e.row) for e in errors] == [(1, 42), (3, rows[3])]
+            assert isinstance(errors[1].error, ValueError)
+
+            with pytest.raises(BatchRowError) as exc_info:
+                client.generate_many("order", rows)
+            assert exc_info.value.index == 1
+
+    def test_exceptions_are_reraised(self, running: SidecarServer) -> None:
+        """Test server-side errors reach the client, as RuntimeError if unpicklable."""
+        with SidecarClient(running.name) as client:
+            with pytest.raises(ValueError, match="cannot represent"):
+                client.generate("user", BadRepr())
+            with pytest.raises(RuntimeError, match="StubbornError: no way"):
+                client.generate("user", Unpicklable())
+            assert client.generate("user", 1) == UUIDGenerator(running.generator.config).generate(
+                "user", 1
+            )
+
+    def test_request_too_large(self, running: SidecarServer) -> None:
+        """Test a request that cannot fit in a slot raises ValueError."""
+        with SidecarClient(running.name) as client:
+            with pytest.raises(ValueError, match="exceeds"):
+                client.generate("user", "x" * 5000)
+            with pytest.raises(ValueError, match="exceeds"):
+                client.generate_many("user", [("x" * 5000,)])
+            assert isinstance(client.generate("user", "x"), uuid.UUID)
+
+    def test_threads_share_a_client(self, running: SidecarServer, test_config: IDConfig) -> None:
+        """Test concurrent calls on one client take turns on its slot."""
+        client = SidecarClient(running.name)
+        results: dict[int, uuid.UUID] = {}
+
+        def work(offset: int) -> None:
+            for i in range(offset, offset + 50):
+                results[i] = client.generate("user", i)
+
+        threads = [threading.Thread(target=work, args=(n * 50,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.close()
+        generator = UUIDGenerator(test_config)
+        assert results == {i: generator.generate("user", i) for i in range(200)}
+
+    def test_timeout(self, test_config: IDConfig, name: str) -> None:
+        """Test a client gives up on a server that stopped answering."""
+        server = SidecarServer(test_config, name)
+        try:
+            with pytest.raises(TimeoutError):
+                SidecarClient(name, timeout=0.05).generate("user", 1)
+        finally:
+            server.close()
+
+
+class TestLifecycle:
+    """Tests for shutdown, slot ownership and crash recovery."""
+
+    def test_no_server(self, name: str) -> None:
+        """Test calls fail fast without a server."""
+        client = SidecarClient(name)
+        with pytest.raises(SidecarUnavailableError, match="no sidecar"):
+            client.generate("user", 1)
+
+    def test_lock_directory(
+        self, test_config: IDConfig, name: str, tmp_path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test locks live in XDG_RUNTIME_DIR and a non-private directory is refused."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        server, thread = start(test_config, name)
+        try:
+            assert (tmp_path / f"{name}.locks" / "server").exists()
+            with SidecarClient(name) as client:
+                assert client.generate("user", 1) == UUIDGenerator(test_config).generate("user", 1)
+        finally:
+            stop(server, thread)
+        assert not (tmp_path / f"{name}.locks").exists()
+
+        locks = tmp_path / f"{name}.locks"
+        locks.mkdir()
+        locks.chmod(0o755)
+        with pytest.raises(PermissionError, match="mode 0700"):
+            SidecarServer(test_config, name)
+        with pytest.raises(PermissionError, match="mode 0700"):
+            SidecarClient(name).generate("user", 1)
+
+        locks.rmdir()
+        locks.symlink_to(tmp_path)
+        with pytest.raises(PermissionError, match="owned by this user"):
+            SidecarServer(test_config, name)
+
+    def test_name_is_exclusive(self, running: SidecarServer) -> None:
+        """Test a second server cannot claim a running server's name."""
+        with pytest.raises(SidecarUnavailableError, match="already running"):
+            SidecarServer(name=running.name)
+
+    def test_slots_are_exclusive(self, test_config: IDConfig, name: str) -> None:
+        """Test each client holds its own slot until it is closed."""
+        server, thread = start(test_config, name, slots=1)
+        try:
+            first, second = SidecarClient(name), SidecarClient(name)
+            first.generate("user", 1)
+            with pytest.raises(SidecarUnavailableError, match="in use"):
+                second.generate("user", 1)
+            first.close()
+            assert second.generate("user", 1) == UUIDGenerator(test_config).generate("user", 1)
+            second.close()
+        finally:
+            stop(server, thread)
+
+    def test_close_and_restart(self, test_config: IDConfig, name: str) -> None:
+        """Test clients fail after close and move to a restarted server."""
+        server, thread = start(test_config, name)
+        client = SidecarClient(name)
+        try:
+            client.generate("user", 1)
+            stop(server, thread)
+            with pytest.raises(SidecarUnavailableError):
+                client.generate("user", 1)
+
+            other = IDConfig(salt="other-salt")
+            server, thread = start(other, name)
+            assert client.generate("user", 2) == UUIDGenerator(other).generate("user", 2)
+
+            # Restarted while the client is still attached to the old segment
+            stop(server, thread)
+            server, thread = start(test_config, name)
+            assert client.generate("user", 2) == UUIDGenerator(test_config).generate("user", 2)
+        finally:
+            client.close()
+            stop(server, thread)
+
+    def test_serve_forever_guards(self, test_config: IDConfig, name: str) -> None:
+        """Test serve_forever refuses to run twice or after close."""
+        server, thread = start(test_config, name)
+        while not server._serving.locked():
+            time.sleep(0.001)
+        with pytest.raises(RuntimeError, match="already serving"):
+            server.serve_forever()
+        stop(server, thread)
+        with pytest.raises(RuntimeError, match="closed"):
+            server.serve_forever()
+
+    def test_fork_takes_a_new_slot(self, running: SidecarServer, test_config: IDConfig) -> None:
+        """Test a client inherited across fork claims its own slot in the child."""
+        client = SidecarClient(running.name)
+        client.generate("user", 1)
+        assert client._channel is not None
+        parent_slot = client._channel.index
+        expected = UUIDGenerator(test_config).generate("user", 2)
+
+        read, write = os.pipe()
+        with warnings.catch_warnings():
+            # The server thread is not used by the child
+            warnings.simplefilter("ignore", DeprecationWarning)
+            pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            ok = client.generate("user", 2) == expected
+            os.write(write, f"{ok} {client._channel.index}".encode())  # type: ignore[union-attr]
+            os._exit(0)
+        os.close(write)
+        os.waitpid(pid, 0)
+        with os.fdopen(read) as pipe:
+            ok, child_slot = pipe.read().split()
+        assert ok == "True"
+        assert int(child_slot) != parent_slot
+        assert client.generate("user", 2) == expected
+        assert client._channel.index == parent_slot
+        client.close()
+
+    def test_crashed_client_frees_its_slot(self, test_config: IDConfig, name: str) -> None:
+        """Test the slot of a client killed mid-use can be claimed again."""
+        server, thread = start(test_config, name, slots=1)
+        try:
+            code = (
+                "import os; from uuid_forge.sidecar import SidecarClient; "
+                f"SidecarClient({name!r}).generate('user', 1); os._exit(0)"
+            )
+            subprocess.run([sys.executable, "-c", code], check=True, timeout=60)
+            with SidecarClient(name) as client:
+                assert client.generate("user", 1) == UUIDGenerator(test_config).generate("user", 1)
+        finally:
+            stop(server, thread)
+
+    def test_crashed_server(self, test_config: IDConfig, name: str) -> None:
+        """Test clients notice a killed server and a new one takes over the name."""
+        code = (
+            "from uuid_forge.sidecar import SidecarServer; "
+            f"server = SidecarServer(name={name!r}); print('ready', flush=True); "
+            "server.serve_forever()"
+        )
+        process = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE)
+        try:
+            assert process.stdout is not None
+            assert process.stdout.readline() == b"ready\n"
+            client = SidecarClient(name)
+            assert client.generate("user", 1) == UUIDGenerator().generate("user", 1)
+        finally:
+            os.kill(process.pid, signal.SIGKILL)
+            process.wait(10)
+        with pytest.raises(SidecarUnavailableError, match="not running"):
+            client.generate("user", 1)
+
+        server, thread = start(test_config, name)
+        try:
+            assert client.generate("user", 1) == UUIDGenerator(test_config).generate("user", 1)
+        finally:
+            client.close()
+            stop(server, thread)
+
+
+class TestValidation:
+    """Tests for argument checking."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error"),
+        [
+            ({"config": "invalid"}, TypeError),
+            ({"name": ""}, ValueError),
+            ({"name": "a/b"}, ValueError),
+            ({"slots": 0}, ValueError),
+            ({"slot_size": 100}, ValueError),
+            ({"idle_sleep": -1}, ValueError),
+        ],
+    )
+    def test_server(self, kwargs, error) -> None:
+        """Test invalid server arguments are rejected before claiming the name."""
+        with pytest.raises(error):
+            SidecarServer(**kwargs)
+
+    def test_client(self) -> None:
+        """Test invalid client arguments are rejected."""
+        with pytest.raises(ValueError, match="timeout"):
+            SidecarClient(timeout=0)
+        with pytest.raises(ValueError, match="name"):
+            SidecarClient("a/b")
+
+    def test_repr(self, running: SidecarServer) -> None:
+        """Test both classes have readable representations."""
+        assert repr(running) == (f"SidecarServer(name={running.name!r}, slots=4, slot_size=4096)")
+        assert repr(SidecarClient("x", timeout=1.0)) == "SidecarClient(name='x', timeout=1.0)"